@@ -6,13 +6,141 @@ and session management for Dispatcharr API integration.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Iterator, List, Any, Tuple
+from urllib.parse import urlparse
 import requests
 
 logger = logging.getLogger(__name__)
 
 
+def _next_page_endpoint(next_url: Optional[str]) -> Optional[str]:
+    """Turn a DRF 'next' link into an endpoint path (absolute URLs keep path+query)."""
+    if not next_url:
+        return None
+    if next_url.startswith('http'):
+        parsed = urlparse(next_url)
+        return f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+    return next_url
+
+
+def iter_paginated(
+    auth: 'DispatcharrAuth',
+    initial_endpoint: str,
+    error_context: str = "items",
+    prefetch: bool = True,
+    raise_on_error: bool = False
+) -> Iterator[List[Dict]]:
+    """
+    Yield the pages of a paginated API endpoint as they arrive.
+
+    Handles both paginated dict responses (with 'results' and 'next') and
+    simple list responses. With prefetch, the request for page N+1 is in
+    flight while the caller works on page N.
+
+    A failed request ends the iteration (pages already yielded stand), or
+    with raise_on_error raises, so callers that need the complete listing
+    can tell it apart from a short one.
+
+    Args:
+        auth: DispatcharrAuth for the instance
+        initial_endpoint: Starting endpoint with page_size (e.g., "/api/channels/streams/?page_size=1000")
+        error_context: Context for error logging (e.g., "streams", "channels")
+        prefetch: Fetch the next page in the background while the current one is consumed
+        raise_on_error: Raise instead of ending the iteration on a failed request
+
+    Yields:
+        List of items per page
+
+    Raises:
+        requests.RequestException: A request failed and raise_on_error is set
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dispatcharr-page') if prefetch else None
+    pending = None
+    next_page = initial_endpoint
+
+    try:
+        while next_page:
+            response = pending.result() if pending is not None else auth.get(next_page)
+            pending = None
+
+            if response is None or response.status_code != 200:
+                message = f"Failed to get {error_context}: {response.status_code if response else 'No response'}"
+                if raise_on_error:
+                    raise requests.RequestException(f"{message} (listing incomplete)", response=response)
+                logger.error(message)
+                return
+
+            data = response.json()
+
+            if isinstance(data, dict) and 'results' in data:
+                items = data['results']
+                next_page = _next_page_endpoint(data.get('next'))
+            elif isinstance(data, list):
+                items = data
+                next_page = None
+            else:
+                if raise_on_error:
+                    raise requests.RequestException(f"Unexpected {error_context} response (listing incomplete)")
+                return
+
+            if next_page and executor:
+                pending = executor.submit(auth.get, next_page)
+
+            yield items
+    finally:
+        if executor:
+            # Consumer stopped early (e.g. a limit was reached) - drop the prefetch
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Refresh polling: check quickly at first, then back off for long-running imports
+POLL_INITIAL_INTERVAL = 1.0
+POLL_MAX_INTERVAL = 8.0
+POLL_BACKOFF = 1.5
+
+# M3U account statuses that mean a refresh is still running
+M3U_IN_PROGRESS_STATUSES = {'fetching', 'parsing', 'pending_setup'}
+
+
+def backoff_intervals(
+    timeout: float,
+    initial: float = POLL_INITIAL_INTERVAL,
+    maximum: float = POLL_MAX_INTERVAL,
+    factor: float = POLL_BACKOFF
+) -> Iterator[float]:
+    """
+    Yield sleep intervals for a poll loop until timeout seconds have passed.
+
+    Intervals grow geometrically from initial up to maximum; the last one is
+    trimmed so the loop never sleeps past the deadline.
+    """
+    deadline = time.time() + timeout
+    interval = initial
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return
+        yield min(interval, remaining)
+        interval = min(interval * factor, maximum)
+
+
+def _minutes_since(timestamp: Optional[str]) -> Optional[float]:
+    """Minutes since an ISO timestamp from Dispatcharr (None if missing/unparseable)."""
+    if not timestamp:
+        return None
+    try:
+        # Handle both Z and +00:00 formats
+        updated_dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        return (datetime.now(timezone.utc) - updated_dt).total_seconds() / 60
+    except (ValueError, TypeError) as e:
+        logger.debug(f"Could not parse updated_at '{timestamp}': {e}")
+        return None
+
+
 class DispatcharrAuth:
     """
     Just-In-Time authentication handler for Dispatcharr API.
@@ -383,7 +511,7 @@ class EPGManager:
         self,
         epg_id: int,
         timeout: int = 60,
-        poll_interval: int = 2
+        poll_interval: float = POLL_INITIAL_INTERVAL
     ) -> Dict[str, Any]:
         """
         Trigger EPG refresh and wait for completion.
@@ -396,7 +524,8 @@ class EPGManager:
         Args:
             epg_id: EPG source ID to refresh
             timeout: Maximum seconds to wait (default: 60)
-            poll_interval: Seconds between status checks (default: 2)
+            poll_interval: Seconds before the first status check; later checks
+                           back off up to POLL_MAX_INTERVAL
 
         Returns:
             Result dict with:
@@ -405,8 +534,6 @@ class EPGManager:
             - duration: float (seconds taken)
             - source: dict (final EPG source state if successful)
         """
-        import time
-
         # Get current state before refresh
         before = self.get_source(epg_id)
         if not before:
@@ -425,8 +552,8 @@ class EPGManager:
         last_status = None
         last_message = None
 
-        while time.time() - start_time < timeout:
-            time.sleep(poll_interval)
+        for delay in backoff_intervals(timeout, initial=poll_interval):
+            time.sleep(delay)
 
             current = self.get_source(epg_id)
             if not current:
@@ -606,6 +733,43 @@ class M3UManager:
 
         Returns:
             List of stream dicts with id, name, url, channel_group, tvg_id, etc.
+            (all pages - groups over 1,000 streams are not truncated), or an
+            empty list if any page fails
+        """
+        streams = []
+        pages = self.iter_stream_pages(group_name=group_name, group_id=group_id, account_id=account_id)
+        try:
+            for page in pages:
+                streams.extend(page)
+                if limit and len(streams) >= limit:
+                    return streams[:limit]
+        except requests.RequestException as e:
+            logger.error(f"Failed to list streams: {e}")
+            return []
+        finally:
+            pages.close()
+
+        return streams
+
+    def iter_stream_pages(
+        self,
+        group_name: Optional[str] = None,
+        group_id: Optional[int] = None,
+        account_id: Optional[int] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Yield streams from Dispatcharr one page at a time.
+
+        Follows 'next' links until the listing is exhausted, prefetching the
+        next page while the caller processes the current one. Same filters
+        as list_streams().
+
+        Yields:
+            List of stream dicts per page
+
+        Raises:
+            requests.RequestException: A page could not be fetched, so the
+                pages yielded so far are not the whole group
         """
         import urllib.parse
 
@@ -620,18 +784,12 @@ class M3UManager:
         if account_id is not None:
             params.append(f"m3u_account={account_id}")
 
-        response = self.auth.get(f"/api/channels/streams/?{'&'.join(params)}")
-        if response is None or response.status_code != 200:
-            logger.error(f"Failed to list streams: {response.status_code if response else 'No response'}")
-            return []
-
-        data = response.json()
-        streams = data.get('results', []) if isinstance(data, dict) else data
-
-        if limit:
-            streams = streams[:limit]
-
-        return streams
+        yield from iter_paginated(
+            self.auth,
+            f"/api/channels/streams/?{'&'.join(params)}",
+            error_context="streams",
+            raise_on_error=True
+        )
 
     def get_group_with_streams(self, group_id: int, stream_limit: int = None) -> Optional[Dict]:
         """
@@ -681,20 +839,20 @@ class M3UManager:
         self,
         account_id: int,
         timeout: int = 120,
-        poll_interval: int = 2,
+        poll_interval: float = POLL_INITIAL_INTERVAL,
         skip_if_recent_minutes: int = 60
     ) -> Dict[str, Any]:
         """
         Trigger M3U refresh and wait for completion.
 
         This ensures streams are updated before we fetch them for EPG generation.
-        Uses polling to detect when refresh completes by monitoring updated_at.
-        Skips refresh if account was updated within skip_if_recent_minutes.
+        Completion is detected by M3URefreshTracker (updated_at/status polling
+        with backoff). Skips refresh if account was updated within skip_if_recent_minutes.
 
         Args:
             account_id: M3U account ID to refresh
             timeout: Maximum seconds to wait (default: 120)
-            poll_interval: Seconds between status checks (default: 2)
+            poll_interval: Seconds before the first status check (later checks back off)
             skip_if_recent_minutes: Skip refresh if updated within this many minutes (default: 60)
 
         Returns:
@@ -705,92 +863,17 @@ class M3UManager:
             - account: dict (final account state if successful)
             - skipped: bool (True if refresh was skipped due to recent update)
         """
-        import time
-        from datetime import datetime, timezone
-
-        # Get current state
-        before = self.get_account(account_id)
-        if not before:
-            return {"success": False, "message": f"Account {account_id} not found"}
-
-        before_updated = before.get('updated_at')
-
-        # Check if recently refreshed - skip if within threshold
-        if skip_if_recent_minutes > 0 and before_updated:
-            try:
-                # Parse ISO timestamp (handle both Z and +00:00 formats)
-                updated_str = before_updated.replace('Z', '+00:00')
-                updated_dt = datetime.fromisoformat(updated_str)
-                now = datetime.now(timezone.utc)
-                age_minutes = (now - updated_dt).total_seconds() / 60
-
-                if age_minutes < skip_if_recent_minutes:
-                    logger.info(f"M3U account {account_id} refreshed {age_minutes:.1f} min ago, skipping refresh")
-                    return {
-                        "success": True,
-                        "message": f"Skipped - refreshed {age_minutes:.0f} min ago",
-                        "duration": 0,
-                        "skipped": True,
-                        "account": before
-                    }
-            except (ValueError, TypeError) as e:
-                logger.debug(f"Could not parse updated_at '{before_updated}': {e}")
-
-        # Trigger refresh
-        trigger_result = self.refresh_m3u_account(account_id)
-        if not trigger_result.get('success'):
-            return trigger_result
-
-        # Poll until updated_at changes or status indicates completion/error
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            time.sleep(poll_interval)
-
-            current = self.get_account(account_id)
-            if not current:
-                continue
-
-            current_status = current.get('status', '')
-            current_updated = current.get('updated_at')
-
-            # Check if refresh completed (updated_at changed)
-            if current_updated != before_updated:
-                duration = time.time() - start_time
-                if current_status == 'success':
-                    return {
-                        "success": True,
-                        "message": current.get('last_message', 'Refresh completed'),
-                        "duration": duration,
-                        "account": current
-                    }
-                elif current_status == 'error':
-                    return {
-                        "success": False,
-                        "message": current.get('last_message', 'Refresh failed'),
-                        "duration": duration,
-                        "account": current
-                    }
-
-            # Check for error status even if updated_at hasn't changed
-            if current_status == 'error':
-                return {
-                    "success": False,
-                    "message": current.get('last_message', 'Refresh failed'),
-                    "duration": time.time() - start_time
-                }
-
-        # Timeout
-        return {
-            "success": False,
-            "message": f"Refresh timed out after {timeout} seconds",
-            "duration": timeout
-        }
+        tracker = M3URefreshTracker(
+            self, timeout=timeout, poll_interval=poll_interval,
+            skip_if_recent_minutes=skip_if_recent_minutes
+        )
+        return tracker.start([account_id])[account_id].result()
 
     def refresh_multiple_accounts(
         self,
         account_ids: List[int],
         timeout: int = 120,
-        poll_interval: int = 2,
+        poll_interval: float = POLL_INITIAL_INTERVAL,
         skip_if_recent_minutes: int = 60
     ) -> Dict[str, Any]:
         """
@@ -800,10 +883,12 @@ class M3UManager:
         This is more efficient than sequential refreshes when multiple event groups
         share the same M3U provider. Skips accounts refreshed within skip_if_recent_minutes.
 
+        Use M3URefreshTracker directly to act on each account as soon as it finishes.
+
         Args:
             account_ids: List of unique M3U account IDs to refresh
             timeout: Maximum seconds to wait for all (default: 120)
-            poll_interval: Seconds between status checks (default: 2)
+            poll_interval: Seconds before the first status check (later checks back off)
             skip_if_recent_minutes: Skip refresh if updated within this many minutes (default: 60)
 
         Returns:
@@ -815,160 +900,225 @@ class M3UManager:
             - succeeded_count: int
             - skipped_count: int
         """
-        import time
-        from concurrent.futures import ThreadPoolExecutor
-        from datetime import datetime, timezone
+        tracker = M3URefreshTracker(
+            self, timeout=timeout, poll_interval=poll_interval,
+            skip_if_recent_minutes=skip_if_recent_minutes
+        )
+        tracker.start(account_ids)
+        return tracker.summary()
+
+    def test_connection(self) -> Dict[str, Any]:
+        """Test connection to Dispatcharr."""
+        try:
+            if not self.auth.get_token():
+                return {"success": False, "message": "Authentication failed"}
 
-        if not account_ids:
+            accounts = self.list_m3u_accounts()
             return {
                 "success": True,
-                "results": {},
-                "duration": 0,
-                "failed_count": 0,
-                "succeeded_count": 0,
-                "skipped_count": 0
+                "message": f"Connected. Found {len(accounts)} M3U account(s).",
+                "accounts": accounts
             }
+        except Exception as e:
+            return {"success": False, "message": str(e)}
+
+
+class M3URefreshTracker:
+    """
+    Triggers M3U account refreshes and tracks them to completion.
+
+    Each account gets a Future that resolves with its result dict as soon
+    as that account finishes (or is skipped / fails to trigger), so callers
+    can start on finished accounts while others are still refreshing.
+
+    One background thread checks every pending account with a single
+    list_m3u_accounts() request per tick, backing off from poll_interval
+    to POLL_MAX_INTERVAL. Dispatcharr's REST API exposes no completion
+    callback, so updated_at/status polling is the completion signal.
+
+    Usage:
+        tracker = M3URefreshTracker(manager, timeout=120)
+        tracker.start([1, 2, 3])
+        for account_id, result in tracker.iter_completed():
+            ...
+    """
+
+    def __init__(
+        self,
+        manager: 'M3UManager',
+        timeout: int = 120,
+        poll_interval: float = POLL_INITIAL_INTERVAL,
+        skip_if_recent_minutes: int = 60
+    ):
+        """
+        Args:
+            manager: M3UManager used for listing and triggering accounts
+            timeout: Maximum seconds to wait for refreshes to finish
+            poll_interval: Seconds before the first status check
+            skip_if_recent_minutes: Don't refresh accounts updated within this many minutes
+        """
+        self.manager = manager
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.skip_if_recent_minutes = skip_if_recent_minutes
+
+        self.futures: Dict[int, Future] = {}
+        self._initial_updated: Dict[int, Optional[str]] = {}
+        self._pending: set = set()
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
 
-        # Deduplicate account IDs
-        unique_ids = list(set(account_ids))
+    def _account_states(self) -> Dict[int, Dict]:
+        """All accounts by ID (one request)."""
+        return {a.get('id'): a for a in self.manager.list_m3u_accounts() if isinstance(a, dict)}
+
+    def _resolve(self, account_id: int, result: Dict[str, Any]):
+        self._pending.discard(account_id)
+        future = self.futures[account_id]
+        if not future.done():
+            future.set_result(result)
+        if not self._pending and self._end_time is None:
+            self._end_time = time.time()
+
+    def start(self, account_ids: List[int]) -> Dict[int, Future]:
+        """
+        Trigger refreshes and start tracking them in the background.
+
+        Args:
+            account_ids: M3U account IDs (duplicates are ignored)
+
+        Returns:
+            Dict mapping account_id -> Future resolving to its result dict
+        """
+        unique_ids = list(dict.fromkeys(account_ids))
+        self._start_time = time.time()
+        self.futures = {account_id: Future() for account_id in unique_ids}
+        self._pending = set(unique_ids)
+        if not unique_ids:
+            self._end_time = self._start_time
+            return {}
 
         # Get initial state for all accounts and check which need refresh
-        initial_states = {}
-        results = {}
+        states = self._account_states()
         ids_needing_refresh = []
-        now = datetime.now(timezone.utc)
 
         for account_id in unique_ids:
-            account = self.get_account(account_id)
+            account = states.get(account_id) or self.manager.get_account(account_id)
             if not account:
-                initial_states[account_id] = None
-                ids_needing_refresh.append(account_id)
+                self._resolve(account_id, {"success": False, "message": f"Account {account_id} not found"})
                 continue
 
-            initial_states[account_id] = account.get('updated_at')
+            self._initial_updated[account_id] = account.get('updated_at')
 
             # Check if recently refreshed
-            if skip_if_recent_minutes > 0 and account.get('updated_at'):
-                try:
-                    updated_str = account['updated_at'].replace('Z', '+00:00')
-                    updated_dt = datetime.fromisoformat(updated_str)
-                    age_minutes = (now - updated_dt).total_seconds() / 60
-
-                    if age_minutes < skip_if_recent_minutes:
-                        logger.info(f"M3U account {account_id} refreshed {age_minutes:.1f} min ago, skipping")
-                        results[account_id] = {
-                            "success": True,
-                            "message": f"Skipped - refreshed {age_minutes:.0f} min ago",
-                            "duration": 0,
-                            "skipped": True
-                        }
-                        continue
-                except (ValueError, TypeError):
-                    pass
+            age_minutes = _minutes_since(account.get('updated_at'))
+            if self.skip_if_recent_minutes > 0 and age_minutes is not None and age_minutes < self.skip_if_recent_minutes:
+                logger.info(f"M3U account {account_id} refreshed {age_minutes:.1f} min ago, skipping refresh")
+                self._resolve(account_id, {
+                    "success": True,
+                    "message": f"Skipped - refreshed {age_minutes:.0f} min ago",
+                    "duration": 0,
+                    "skipped": True,
+                    "account": account
+                })
+                continue
 
             ids_needing_refresh.append(account_id)
 
-        # If all accounts were skipped, return early
         if not ids_needing_refresh:
-            skipped_count = len(results)
-            return {
-                "success": True,
-                "results": results,
-                "duration": 0,
-                "failed_count": 0,
-                "succeeded_count": skipped_count,
-                "skipped_count": skipped_count
-            }
+            return dict(self.futures)
 
         # Trigger refreshes in parallel (only for accounts that need it)
-        def trigger_refresh(account_id):
-            return (account_id, self.refresh_m3u_account(account_id))
-
-        trigger_results = {}
         with ThreadPoolExecutor(max_workers=len(ids_needing_refresh)) as executor:
-            futures = {executor.submit(trigger_refresh, aid): aid for aid in ids_needing_refresh}
-            for future in futures:
+            trigger_futures = {
+                executor.submit(self.manager.refresh_m3u_account, aid): aid for aid in ids_needing_refresh
+            }
+            for future in as_completed(trigger_futures):
+                account_id = trigger_futures[future]
                 try:
-                    account_id, result = future.result()
-                    trigger_results[account_id] = result
+                    trigger_result = future.result()
                 except Exception as e:
-                    account_id = futures[future]
-                    trigger_results[account_id] = {"success": False, "message": str(e)}
+                    trigger_result = {"success": False, "message": str(e)}
 
-        # Track which accounts we're waiting for
-        pending = set()
+                if not trigger_result.get('success'):
+                    self._resolve(account_id, {
+                        "success": False,
+                        "message": trigger_result.get('message', 'Failed to trigger refresh')
+                    })
 
-        for account_id in ids_needing_refresh:
-            trigger_result = trigger_results.get(account_id, {"success": False, "message": "Trigger failed"})
+        if self._pending:
+            threading.Thread(target=self._poll, name='m3u-refresh-tracker', daemon=True).start()
 
-            if trigger_result.get('success'):
-                pending.add(account_id)
-            else:
-                results[account_id] = {
-                    "success": False,
-                    "message": trigger_result.get('message', 'Failed to trigger refresh')
-                }
+        return dict(self.futures)
 
-        # Poll until all complete or timeout
-        start_time = time.time()
-        while pending and (time.time() - start_time) < timeout:
-            time.sleep(poll_interval)
-
-            # Check all pending accounts
-            still_pending = set()
-            for account_id in pending:
-                current = self.get_account(account_id)
-                if not current:
-                    still_pending.add(account_id)
-                    continue
-
-                current_status = current.get('status', '')
-                current_updated = current.get('updated_at')
-                initial_updated = initial_states.get(account_id)
-
-                # Check if refresh completed
-                if current_updated != initial_updated:
-                    duration = time.time() - start_time
-                    if current_status == 'success':
-                        results[account_id] = {
-                            "success": True,
-                            "message": current.get('last_message', 'Refresh completed'),
-                            "duration": duration
-                        }
-                    elif current_status == 'error':
-                        results[account_id] = {
-                            "success": False,
-                            "message": current.get('last_message', 'Refresh failed'),
-                            "duration": duration
-                        }
-                    else:
-                        # Status unclear but updated_at changed - assume success
-                        results[account_id] = {
-                            "success": True,
-                            "message": "Refresh completed",
-                            "duration": duration
-                        }
-                elif current_status == 'error':
-                    results[account_id] = {
-                        "success": False,
-                        "message": current.get('last_message', 'Refresh failed'),
-                        "duration": time.time() - start_time
-                    }
-                else:
-                    still_pending.add(account_id)
+    def _check(self, account_id: int, current: Optional[Dict]) -> Optional[Dict[str, Any]]:
+        """Result dict if this account's refresh has finished, else None."""
+        if not current:
+            return None
 
-            pending = still_pending
+        current_status = current.get('status', '')
+        duration = time.time() - self._start_time
 
-        # Handle any remaining pending (timed out)
-        for account_id in pending:
-            results[account_id] = {
+        if current_status == 'error':
+            return {
                 "success": False,
-                "message": f"Refresh timed out after {timeout} seconds",
-                "duration": timeout
+                "message": current.get('last_message', 'Refresh failed'),
+                "duration": duration,
+                "account": current
             }
 
-        # Calculate summary
-        total_duration = time.time() - start_time
+        if current.get('updated_at') != self._initial_updated.get(account_id):
+            if current_status in M3U_IN_PROGRESS_STATUSES:
+                # updated_at moved when the refresh started - still running
+                return None
+            return {
+                "success": True,
+                "message": current.get('last_message') or 'Refresh completed',
+                "duration": duration,
+                "account": current
+            }
+
+        return None
+
+    def _poll(self):
+        """Background loop: one account listing per tick until all pending accounts finish."""
+        try:
+            for delay in backoff_intervals(self.timeout, initial=self.poll_interval):
+                time.sleep(delay)
+
+                states = self._account_states()
+                for account_id in list(self._pending):
+                    result = self._check(account_id, states.get(account_id))
+                    if result:
+                        self._resolve(account_id, result)
+
+                if not self._pending:
+                    return
+
+            # Handle any remaining pending (timed out)
+            for account_id in list(self._pending):
+                self._resolve(account_id, {
+                    "success": False,
+                    "message": f"Refresh timed out after {self.timeout} seconds",
+                    "duration": self.timeout
+                })
+        except Exception as e:
+            logger.error(f"M3U refresh tracking failed: {e}")
+            for account_id in list(self._pending):
+                self._resolve(account_id, {"success": False, "message": f"Refresh tracking failed: {e}"})
+
+    def iter_completed(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (account_id, result) as each account finishes."""
+        account_by_future = {future: account_id for account_id, future in self.futures.items()}
+        for future in as_completed(account_by_future):
+            yield account_by_future[future], future.result()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Wait for all accounts and summarize (refresh_multiple_accounts() format).
+        """
+        results = {account_id: future.result() for account_id, future in self.futures.items()}
+
         skipped = sum(1 for r in results.values() if r.get('skipped'))
         succeeded = sum(1 for r in results.values() if r.get('success'))
         failed = len(results) - succeeded
@@ -976,27 +1126,12 @@ class M3UManager:
         return {
             "success": failed == 0,
             "results": results,
-            "duration": total_duration,
+            "duration": (self._end_time or time.time()) - (self._start_time or time.time()),
             "failed_count": failed,
             "succeeded_count": succeeded,
             "skipped_count": skipped
         }
 
-    def test_connection(self) -> Dict[str, Any]:
-        """Test connection to Dispatcharr."""
-        try:
-            if not self.auth.get_token():
-                return {"success": False, "message": "Authentication failed"}
-
-            accounts = self.list_m3u_accounts()
-            return {
-                "success": True,
-                "message": f"Connected. Found {len(accounts)} M3U account(s).",
-                "accounts": accounts
-            }
-        except Exception as e:
-            return {"success": False, "message": str(e)}
-
 
 class ChannelManager:
     """
@@ -1189,38 +1324,22 @@ class ChannelManager:
         Returns:
             List of all items from all pages
         """
-        from urllib.parse import urlparse
-
         all_items = []
-        next_page = initial_endpoint
-
-        while next_page:
-            response = self.auth.get(next_page)
-            if response is None or response.status_code != 200:
-                logger.error(f"Failed to get {error_context}: {response.status_code if response else 'No response'}")
-                break
-
-            data = response.json()
+        for page in self._iter_paginated(initial_endpoint, error_context):
+            all_items.extend(page)
+        return all_items
 
-            if isinstance(data, dict) and 'results' in data:
-                all_items.extend(data['results'])
-                next_url = data.get('next')
-                if next_url:
-                    # Handle absolute URLs by extracting path+query
-                    if next_url.startswith('http'):
-                        parsed = urlparse(next_url)
-                        next_page = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
-                    else:
-                        next_page = next_url
-                else:
-                    next_page = None
-            elif isinstance(data, list):
-                all_items.extend(data)
-                next_page = None
-            else:
-                next_page = None
+    def _iter_paginated(
+        self,
+        initial_endpoint: str,
+        error_context: str = "items"
+    ) -> Iterator[List[Dict]]:
+        """
+        Yield pages from a paginated API endpoint, prefetching the next page.
 
-        return all_items
+        See iter_paginated().
+        """
+        return iter_paginated(self.auth, initial_endpoint, error_context)
 
     def _parse_api_error(self, response) -> str:
         """
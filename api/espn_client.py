@@ -3,11 +3,13 @@ import requests
 from requests.adapters import HTTPAdapter
 import json
 import threading
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 import time
 from utils.logger import get_logger
 from epg.league_config import SoccerCompat
+from api.scoreboard_index import ScoreboardIndex
 
 logger = get_logger(__name__)
 
@@ -16,6 +18,10 @@ logger = get_logger(__name__)
 _espn_session: Optional[requests.Session] = None
 _espn_session_lock = threading.Lock()
 
+# Upper bound on concurrent ESPN HTTP requests across all threads (matches pool_maxsize)
+MAX_CONCURRENT_REQUESTS = 100
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
 
 def _get_espn_session() -> requests.Session:
     """Get or create the shared ESPN HTTP session with connection pooling."""
@@ -58,29 +64,44 @@ class ESPNClient:
     }
 
     # Class-level caches shared across all instances
+    # Each cache has a lock that only guards the dicts (never held during HTTP)
+    # and an in-flight map so concurrent misses for the same key share one request
     # Key: (sport, league, date), Value: scoreboard data
     _scoreboard_cache: Dict[tuple, Optional[Dict]] = {}
     _scoreboard_cache_lock = threading.Lock()
+    _scoreboard_in_flight: Dict[tuple, Future] = {}
+
+    # Key: (sport, league, date), Value: ScoreboardIndex of the cached scoreboard
+    _scoreboard_index_cache: Dict[tuple, ScoreboardIndex] = {}
+    _scoreboard_index_cache_lock = threading.Lock()
 
     # Key: (sport, league, team_slug), Value: schedule data
     _schedule_cache: Dict[tuple, Optional[Dict]] = {}
     _schedule_cache_lock = threading.Lock()
+    _schedule_in_flight: Dict[tuple, Future] = {}
 
     # Key: (sport, league, team_id), Value: team info data
     _team_info_cache: Dict[tuple, Optional[Dict]] = {}
     _team_info_cache_lock = threading.Lock()
+    _team_info_in_flight: Dict[tuple, Future] = {}
 
     # Key: (league, team_id), Value: roster data
     _roster_cache: Dict[tuple, Optional[Dict]] = {}
     _roster_cache_lock = threading.Lock()
+    _roster_in_flight: Dict[tuple, Future] = {}
 
     # Key: (sport, league, group_id), Value: (name, abbreviation)
     _group_cache: Dict[tuple, tuple] = {}
     _group_cache_lock = threading.Lock()
+    _group_in_flight: Dict[tuple, Future] = {}
 
     # Cache for team stats (refreshes every 6 hours) - instance level is OK
     # since this is long-lived and not cleared per-generation
 
+    # Back the per-generation caches with the persistent response cache
+    # (api/response_cache.py) so unchanged data isn't re-fetched every generation
+    persistent_cache = True
+
     def __init__(self, base_url: str = "https://site.api.espn.com/apis/site/v2/sports", db_path: str = None):
         self.base_url = base_url
         self.db_path = db_path
@@ -101,7 +122,8 @@ class ESPNClient:
         """Make HTTP request with retry logic and connection pooling"""
         for attempt in range(self.retry_count):
             try:
-                response = self._session.get(url, timeout=self.timeout)
+                with _request_slots:
+                    response = self._session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 return response.json()
             except requests.exceptions.RequestException as e:
@@ -113,12 +135,152 @@ class ESPNClient:
                     logger.error(f"ESPN API request failed after {self.retry_count} attempts: {e}")
                     return None
 
+    def _make_conditional_request(self, url: str, headers: Dict[str, str]) -> Optional[requests.Response]:
+        """
+        GET with optional validator headers (If-None-Match / If-Modified-Since).
+
+        Same retry policy as _make_request, but returns the response so the
+        caller can tell a 304 Not Modified from a fresh body.
+
+        Returns:
+            Response (status 200 or 304) or None if the request failed
+        """
+        for attempt in range(self.retry_count):
+            try:
+                with _request_slots:
+                    response = self._session.get(url, timeout=self.timeout, headers=headers)
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+            except requests.exceptions.RequestException as e:
+                if attempt < self.retry_count - 1:
+                    logger.warning(f"ESPN API request failed (attempt {attempt + 1}/{self.retry_count}): {e}")
+                    time.sleep(self.retry_delay * (attempt + 1))
+                    continue
+                else:
+                    logger.error(f"ESPN API request failed after {self.retry_count} attempts: {e}")
+                    return None
+
+    def _fetch_persistent(self, endpoint: str, url: str, date: str = None) -> Optional[Dict]:
+        """
+        Fetch a URL through the persistent response cache.
+
+        Fresh entries are served without a request (see
+        CachedResponse.is_fresh). Stale entries are revalidated with their
+        ETag / Last-Modified (a 304 only extends the TTL) and served stale if
+        ESPN can't be reached.
+
+        Args:
+            endpoint: TTL tier name (see response_cache.ENDPOINT_TTLS)
+            url: Full ESPN URL
+            date: YYYYMMDD for scoreboards (past final days never expire)
+
+        Returns:
+            Parsed JSON or None if failed
+        """
+        if not self.persistent_cache:
+            return self._make_request(url)
+
+        from api.response_cache import get_response_cache, ttl_for
+
+        try:
+            cache = get_response_cache()
+            entry = cache.get(url)
+        except Exception as e:
+            logger.debug(f"Persistent ESPN cache unavailable: {e}")
+            return self._make_request(url)
+
+        if entry and entry.is_fresh(cache.generation_started):
+            return entry.data
+
+        headers = {}
+        if entry and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+
+        response = self._make_conditional_request(url, headers)
+        if response is None:
+            # Stale data beats no data when ESPN is down
+            return entry.data if entry else None
+        if response.status_code == 304 and entry:
+            cache.extend(url, ttl_for(endpoint, entry.data, date))
+            return entry.data
+
+        try:
+            data = response.json()
+        except ValueError as e:
+            logger.error(f"Invalid JSON from ESPN for {url}: {e}")
+            return entry.data if entry else None
+
+        if data is None:
+            return entry.data if entry else None
+
+        try:
+            cache.put(
+                url, endpoint, data, ttl_for(endpoint, data, date),
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+        except Exception as e:
+            logger.debug(f"Failed to store ESPN response for {url}: {e}")
+        return data
+
+    def _get_cached(
+        self,
+        cache: Dict[tuple, Any],
+        lock: threading.Lock,
+        in_flight: Dict[tuple, Future],
+        cache_key: tuple,
+        fetch: Callable[[], Any]
+    ) -> Any:
+        """
+        Return a cached value, fetching it on a miss with per-key coalescing.
+
+        The first thread to miss on a key performs the fetch; other threads
+        missing on the same key wait for that result instead of issuing their
+        own request. The lock only protects the dicts, so misses on different
+        keys (e.g. NBA and NHL scoreboards) fetch in parallel.
+
+        Results are cached even if None, to avoid re-fetching failures.
+        """
+        # Fast path: check cache without lock
+        if cache_key in cache:
+            return cache[cache_key]
+
+        with lock:
+            # Double-check after acquiring lock
+            if cache_key in cache:
+                return cache[cache_key]
+            future = in_flight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                in_flight[cache_key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            with lock:
+                in_flight.pop(cache_key, None)
+            future.set_exception(e)
+            raise
+
+        with lock:
+            cache[cache_key] = result
+            in_flight.pop(cache_key, None)
+        future.set_result(result)
+        return result
+
     def _get_group_name(self, sport: str, league: str, group_id: str) -> tuple:
         """
         Fetch group (conference or division) name and abbreviation from ESPN core API.
 
         Results are cached per-generation to avoid redundant API calls.
-        Thread-safe via double-checked locking.
+        Thread-safe; concurrent misses for the same key share one request.
 
         Args:
             sport: Sport type (e.g., 'basketball', 'football')
@@ -130,36 +292,24 @@ class ESPNClient:
         """
         cache_key = (sport, league, str(group_id))
 
-        # Fast path: check cache without lock
-        if cache_key in self._group_cache:
-            logger.debug(f"Group cache hit for {sport}/{league}/group/{group_id}")
-            return self._group_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._group_cache_lock:
-            # Double-check after acquiring lock
-            if cache_key in self._group_cache:
-                logger.debug(f"Group cache hit (after lock) for {sport}/{league}/group/{group_id}")
-                return self._group_cache[cache_key]
-
+        def fetch():
             try:
                 url = f"http://sports.core.api.espn.com/v2/sports/{sport}/leagues/{league}/groups/{group_id}"
-                group_data = self._make_request(url)
+                group_data = self._fetch_persistent('group', url)
 
                 if group_data:
                     # Get both full name and abbreviation
                     name = group_data.get('shortName') or group_data.get('name', '')
                     abbrev = group_data.get('abbreviation', '')
-                    result = (name, abbrev)
-                else:
-                    result = ('', '')
+                    return (name, abbrev)
             except Exception as e:
                 logger.error(f"Error fetching group name for ID {group_id}: {e}")
-                result = ('', '')
+            # Failures are cached too, to avoid re-fetching
+            return ('', '')
 
-            # Cache the result (even failures to avoid re-fetching)
-            self._group_cache[cache_key] = result
-            return result
+        return self._get_cached(
+            self._group_cache, self._group_cache_lock, self._group_in_flight, cache_key, fetch
+        )
 
     def _extract_record(self, record_list: List) -> Dict:
         """Extract win-loss record from competitor record array"""
@@ -205,7 +355,7 @@ class ESPNClient:
 
         Schedule data is cached per-generation to avoid redundant API calls
         when the same team is referenced multiple times (e.g., opponent lookups).
-        Thread-safe via double-checked locking.
+        Thread-safe; concurrent misses for the same key share one request.
 
         Args:
             sport: Sport type (e.g., 'basketball', 'football', 'soccer')
@@ -218,25 +368,13 @@ class ESPNClient:
         """
         cache_key = (sport, league, str(team_slug))
 
-        # Fast path: check cache without lock
-        if cache_key in self._schedule_cache:
-            logger.debug(f"Schedule cache hit for {sport}/{league}/{team_slug}")
-            return self._schedule_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._schedule_cache_lock:
-            # Double-check after acquiring lock (another thread may have populated)
-            if cache_key in self._schedule_cache:
-                logger.debug(f"Schedule cache hit (after lock) for {sport}/{league}/{team_slug}")
-                return self._schedule_cache[cache_key]
-
-            # Fetch from API
+        def fetch():
             url = f"{self.base_url}/{sport}/{league}/teams/{team_slug}/schedule"
-            result = self._make_request(url)
+            return self._fetch_persistent('schedule', url)
 
-            # Cache the result (even if None to avoid re-fetching failures)
-            self._schedule_cache[cache_key] = result
-            return result
+        return self._get_cached(
+            self._schedule_cache, self._schedule_cache_lock, self._schedule_in_flight, cache_key, fetch
+        )
 
     def clear_schedule_cache(self):
         """Clear the schedule cache. Call this at the start of each EPG generation."""
@@ -248,6 +386,13 @@ class ESPNClient:
         """Clear the team info cache. Call this at the start of each EPG generation."""
         with ESPNClient._team_info_cache_lock:
             ESPNClient._team_info_cache.clear()
+        if self.persistent_cache:
+            # Persisted team info (records) is revalidated once per generation
+            from api.response_cache import get_response_cache
+            try:
+                get_response_cache().start_generation()
+            except Exception as e:
+                logger.debug(f"Persistent ESPN cache unavailable: {e}")
         logger.debug("Team info cache cleared")
 
     def clear_roster_cache(self):
@@ -266,6 +411,8 @@ class ESPNClient:
         """Clear the scoreboard cache. Call this at the start of each EPG generation."""
         with ESPNClient._scoreboard_cache_lock:
             ESPNClient._scoreboard_cache.clear()
+        with ESPNClient._scoreboard_index_cache_lock:
+            ESPNClient._scoreboard_index_cache.clear()
         logger.debug("Scoreboard cache cleared")
 
     def get_team_info(self, sport: str, league: str, team_id: str) -> Optional[Dict]:
@@ -275,7 +422,7 @@ class ESPNClient:
         Team info is cached per-generation to avoid redundant API calls
         when the same team is referenced multiple times (e.g., opponent lookups,
         stats fetches that call get_team_info internally).
-        Thread-safe via double-checked locking.
+        Thread-safe; concurrent misses for the same key share one request.
 
         Args:
             sport: Sport type
@@ -287,25 +434,13 @@ class ESPNClient:
         """
         cache_key = (sport, league, str(team_id))
 
-        # Fast path: check cache without lock
-        if cache_key in self._team_info_cache:
-            logger.debug(f"Team info cache hit for {sport}/{league}/{team_id}")
-            return self._team_info_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._team_info_cache_lock:
-            # Double-check after acquiring lock (another thread may have populated)
-            if cache_key in self._team_info_cache:
-                logger.debug(f"Team info cache hit (after lock) for {sport}/{league}/{team_id}")
-                return self._team_info_cache[cache_key]
-
-            # Fetch from API
+        def fetch():
             url = f"{self.base_url}/{sport}/{league}/teams/{team_id}"
-            result = self._make_request(url)
+            return self._fetch_persistent('team_info', url)
 
-            # Cache the result (even if None to avoid re-fetching failures)
-            self._team_info_cache[cache_key] = result
-            return result
+        return self._get_cached(
+            self._team_info_cache, self._team_info_cache_lock, self._team_info_in_flight, cache_key, fetch
+        )
 
     def get_team_roster(self, league: str, team_id: str) -> Optional[Dict]:
         """
@@ -313,7 +448,7 @@ class ESPNClient:
 
         Roster data is cached per-generation to avoid redundant API calls
         when the same team's roster is needed multiple times (e.g., coach lookups).
-        Thread-safe via double-checked locking.
+        Thread-safe; concurrent misses for the same key share one request.
 
         Args:
             league: League path (e.g., 'football/nfl', 'basketball/nba')
@@ -324,25 +459,13 @@ class ESPNClient:
         """
         cache_key = (league, str(team_id))
 
-        # Fast path: check cache without lock
-        if cache_key in self._roster_cache:
-            logger.debug(f"Roster cache hit for {league}/{team_id}")
-            return self._roster_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._roster_cache_lock:
-            # Double-check after acquiring lock
-            if cache_key in self._roster_cache:
-                logger.debug(f"Roster cache hit (after lock) for {league}/{team_id}")
-                return self._roster_cache[cache_key]
-
-            # Fetch from API
+        def fetch():
             url = f"{self.base_url}/{league}/teams/{team_id}/roster"
-            result = self._make_request(url)
+            return self._fetch_persistent('roster', url)
 
-            # Cache the result (even if None to avoid re-fetching failures)
-            self._roster_cache[cache_key] = result
-            return result
+        return self._get_cached(
+            self._roster_cache, self._roster_cache_lock, self._roster_in_flight, cache_key, fetch
+        )
 
     def get_team_record(self, sport: str, league: str, team_id: str) -> Optional[Dict]:
         """
@@ -607,7 +730,7 @@ class ESPNClient:
 
         Scoreboard data is cached per-generation to avoid redundant API calls
         during multi-sport disambiguation (same league/date checked many times).
-        Thread-safe via double-checked locking.
+        Thread-safe; concurrent misses for the same key share one request.
 
         Args:
             sport: Sport type
@@ -622,29 +745,69 @@ class ESPNClient:
 
         cache_key = (sport, league, date)
 
-        # Fast path: check cache without lock
-        if cache_key in self._scoreboard_cache:
-            logger.debug(f"Scoreboard cache hit for {sport}/{league}/{date}")
-            return self._scoreboard_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._scoreboard_cache_lock:
-            # Double-check after acquiring lock
-            if cache_key in self._scoreboard_cache:
-                logger.debug(f"Scoreboard cache hit (after lock) for {sport}/{league}/{date}")
-                return self._scoreboard_cache[cache_key]
-
+        def fetch():
             # Build URL with optional groups param for college sports
             # This unlocks full D1 scoreboard (all games vs just featured)
             url = f"{self.base_url}/{sport}/{league}/scoreboard?dates={date}"
             if league in self.COLLEGE_SCOREBOARD_GROUPS:
                 url += f"&groups={self.COLLEGE_SCOREBOARD_GROUPS[league]}"
+            return self._fetch_persistent('scoreboard', url, date=date)
 
-            result = self._make_request(url)
+        return self._get_cached(
+            self._scoreboard_cache, self._scoreboard_cache_lock, self._scoreboard_in_flight, cache_key, fetch
+        )
 
-            # Cache the result (even if None to avoid re-fetching failures)
-            self._scoreboard_cache[cache_key] = result
-            return result
+    def get_scoreboard_index(
+        self,
+        sport: str,
+        league: str,
+        date: str,
+        scoreboard_data: Optional[Dict] = None
+    ) -> Optional[ScoreboardIndex]:
+        """
+        Get the team/event index of a scoreboard, building it on first use.
+
+        The index is cached next to the scoreboard itself and rebuilt if the
+        scoreboard response for the key has changed.
+
+        Args:
+            sport: Sport type
+            league: League identifier
+            date: Date in YYYYMMDD format
+            scoreboard_data: Already fetched scoreboard (fetched via
+                get_scoreboard if omitted)
+
+        Returns:
+            ScoreboardIndex, or None if there is no scoreboard with events
+        """
+        if scoreboard_data is None:
+            scoreboard_data = self.get_scoreboard(sport, league, date)
+        if not scoreboard_data or 'events' not in scoreboard_data:
+            return None
+
+        cache_key = (sport, league, date)
+        index = self._scoreboard_index_cache.get(cache_key)
+        if index is None or index.source is not scoreboard_data:
+            index = ScoreboardIndex(scoreboard_data)
+            with self._scoreboard_index_cache_lock:
+                self._scoreboard_index_cache[cache_key] = index
+        return index
+
+    def peek_scoreboard_index(self, sport: str, league: str, date: str) -> Optional[ScoreboardIndex]:
+        """
+        Index of a scoreboard that has already been fetched this generation.
+
+        Never fetches: returns None if the scoreboard hasn't been fetched yet
+        (or the fetch failed), so callers can tell "no games" from "unknown".
+        """
+        scoreboard_data = self._scoreboard_cache.get((sport, league, date))
+        if not scoreboard_data or 'events' not in scoreboard_data:
+            return None
+        return self.get_scoreboard_index(sport, league, date, scoreboard_data)
+
+    def peek_team_schedule(self, sport: str, league: str, team_slug: str) -> Optional[Dict]:
+        """Team schedule if already fetched this generation (never fetches)"""
+        return self._schedule_cache.get((sport, league, str(team_slug)))
 
     def get_event_summary(self, sport: str, league: str, event_id: str) -> Optional[Dict]:
         """
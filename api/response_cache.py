@@ -0,0 +1,379 @@
+"""
+Persistent ESPN Response Cache
+
+Keeps ESPN API responses in SQLite (espn_response_cache table) so they
+survive EPG generations and container restarts. ESPNClient's in-memory
+caches still deduplicate requests within a generation; this layer sits
+underneath them and decides whether a miss actually needs the network.
+
+TTL tiers (per endpoint):
+- group:        7 days  (conference/division names)
+- team_info:    24 hours, revalidated once per generation (records change
+                whenever a game finishes)
+- roster:       24 hours
+- schedule:     3 hours, refreshed as soon as a cached game has started
+                but isn't final (results feed streaks, records and H2H)
+- scoreboard:   past date with every game final -> kept until evicted
+                today / future / past with unfinished games -> 5 minutes
+
+Stale entries are revalidated with If-None-Match / If-Modified-Since when
+ESPN sent an ETag or Last-Modified; a 304 just extends the entry. The table
+is bounded by total body size and evicts least recently used entries.
+Recency is tracked in memory and written to the table in batches.
+
+Usage:
+    cache = get_response_cache()
+    cache.start_generation()        # at the start of each EPG generation
+    entry = cache.get(url)
+    if entry and entry.is_fresh(cache.generation_started):
+        return entry.data
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+ENDPOINT_TTLS = {
+    'group': 7 * DAY,
+    'team_info': DAY,
+    'roster': DAY,
+    'schedule': 3 * HOUR,
+    'scoreboard': 5 * MINUTE,
+}
+
+# Scoreboards for past dates where every game is final never change
+FINAL_SCOREBOARD_TTL = None
+
+# Endpoints revalidated at least once per generation, whatever their TTL
+REVALIDATE_PER_GENERATION = {'team_info'}
+
+# last_access updates are kept in memory and written every this many hits
+# (or this many seconds), instead of one UPDATE + commit per lookup
+ACCESS_FLUSH_BATCH = 500
+ACCESS_FLUSH_INTERVAL = 60
+
+# Upper bound on the summed size of cached bodies
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# Eviction trims down to this fraction of MAX_CACHE_BYTES so it doesn't run on every write
+EVICT_TO_FRACTION = 0.9
+
+
+@dataclass
+class CachedResponse:
+    """A cached ESPN response body with its validators."""
+    url: str
+    endpoint: str
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: Optional[float]  # None = never expires
+    fetched_at: float = 0.0      # Last fetch or 304 revalidation
+
+    def is_expired(self, now: float = None) -> bool:
+        if self.expires_at is None:
+            return False
+        return (now or time.time()) >= self.expires_at
+
+    def is_fresh(self, generation_started: float = 0.0, now: float = None) -> bool:
+        """
+        Whether the entry can be served without a request.
+
+        Args:
+            generation_started: Start of the current EPG generation (see
+                ESPNResponseCache.start_generation)
+            now: Current time (defaults to time.time())
+        """
+        now = now or time.time()
+        if self.is_expired(now):
+            return False
+        if self.endpoint in REVALIDATE_PER_GENERATION and self.fetched_at < generation_started:
+            return False
+        if self.endpoint == 'schedule' and _has_unfinished_started_game(self.data, now):
+            return False
+        return True
+
+
+def _scoreboard_is_final(data: Any) -> bool:
+    """True if the scoreboard has events and all of them are completed."""
+    events = (data or {}).get('events') or []
+    if not events:
+        return False
+    for event in events:
+        status_type = (event.get('status') or {}).get('type') or {}
+        if not (status_type.get('completed') or status_type.get('state') == 'post'):
+            return False
+    return True
+
+
+def _has_unfinished_started_game(data: Any, now: float) -> bool:
+    """True if a schedule lists a game that has started but isn't final."""
+    from epg.schedule_index import parse_event_datetime
+
+    for event in (data or {}).get('events') or []:
+        start = parse_event_datetime(event)
+        if start is None or start.timestamp() > now:
+            continue
+        competitions = event.get('competitions') or [{}]
+        status = event.get('status') or competitions[0].get('status') or {}
+        status_type = status.get('type') or {}
+        if not (status_type.get('completed') or status_type.get('state') == 'post'):
+            return True
+    return False
+
+
+def ttl_for(endpoint: str, data: Any, date: Optional[str] = None) -> Optional[float]:
+    """
+    TTL in seconds for a response (None = never expires).
+
+    Args:
+        endpoint: Endpoint name (see ENDPOINT_TTLS)
+        data: Parsed response body
+        date: YYYYMMDD date for scoreboards
+    """
+    if endpoint == 'scoreboard' and date and date < datetime.now().strftime('%Y%m%d'):
+        if _scoreboard_is_final(data):
+            return FINAL_SCOREBOARD_TTL
+    return ENDPOINT_TTLS.get(endpoint, 5 * MINUTE)
+
+
+class ESPNResponseCache:
+    """SQLite-backed ESPN response cache with TTLs and size-bounded LRU eviction."""
+
+    def __init__(self, get_connection_func, max_bytes: int = MAX_CACHE_BYTES):
+        """
+        Args:
+            get_connection_func: Function that returns a database connection
+            max_bytes: Evict least recently used entries above this total body size
+        """
+        self.get_connection = get_connection_func
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+
+        # Start of the current generation (entries in REVALIDATE_PER_GENERATION
+        # fetched before it are revalidated)
+        self.generation_started = time.time()
+
+        # url -> last access time not yet written to the table
+        self._pending_access = {}
+        self._last_access_flush = time.time()
+
+    def start_generation(self):
+        """Mark the start of an EPG generation."""
+        self.generation_started = time.time()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response (expired or not) and mark it as recently used.
+
+        Returns:
+            CachedResponse or None if the URL isn't cached
+        """
+        conn = self.get_connection()
+        try:
+            row = conn.execute("""
+                SELECT endpoint, body, etag, last_modified, expires_at, fetched_at
+                FROM espn_response_cache WHERE url = ?
+            """, (url,)).fetchone()
+        except Exception as e:
+            logger.debug(f"[ESPN CACHE] lookup failed for {url}: {e}")
+            return None
+        finally:
+            conn.close()
+
+        if not row:
+            self._stats['misses'] += 1
+            return None
+
+        self._stats['hits'] += 1
+        self._note_access(url)
+        return CachedResponse(
+            url=url,
+            endpoint=row['endpoint'],
+            data=json.loads(row['body']),
+            etag=row['etag'],
+            last_modified=row['last_modified'],
+            expires_at=row['expires_at'],
+            fetched_at=row['fetched_at'] or 0.0,
+        )
+
+    def _note_access(self, url: str):
+        """Record a hit in memory, writing the batch once it's due."""
+        now = time.time()
+        with self._lock:
+            self._pending_access[url] = now
+            due = (len(self._pending_access) >= ACCESS_FLUSH_BATCH
+                   or now - self._last_access_flush >= ACCESS_FLUSH_INTERVAL)
+        if due:
+            self.flush_access()
+
+    def flush_access(self):
+        """Write pending last_access updates in one transaction."""
+        with self._lock:
+            pending, self._pending_access = self._pending_access, {}
+            self._last_access_flush = time.time()
+        if not pending:
+            return
+
+        conn = self.get_connection()
+        try:
+            conn.executemany(
+                "UPDATE espn_response_cache SET last_access = ? WHERE url = ?",
+                [(accessed, url) for url, accessed in pending.items()]
+            )
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"[ESPN CACHE] last_access flush failed: {e}")
+        finally:
+            conn.close()
+
+    def put(
+        self,
+        url: str,
+        endpoint: str,
+        data: Any,
+        ttl: Optional[float],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """Store (or replace) a response. ttl=None keeps it until evicted."""
+        body = json.dumps(data, separators=(',', ':'))
+        size = len(body.encode('utf-8'))
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+
+        conn = self.get_connection()
+        try:
+            old = conn.execute(
+                "SELECT size_bytes FROM espn_response_cache WHERE url = ?", (url,)
+            ).fetchone()
+            conn.execute("""
+                INSERT OR REPLACE INTO espn_response_cache
+                    (url, endpoint, body, etag, last_modified, fetched_at, expires_at, last_access, size_bytes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (url, endpoint, body, etag, last_modified, now, expires_at, now, size))
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"[ESPN CACHE] store failed for {url}: {e}")
+            return
+        finally:
+            conn.close()
+
+        self._stats['stored'] += 1
+        self._adjust_total(size - (old['size_bytes'] if old else 0))
+
+    def extend(self, url: str, ttl: Optional[float]):
+        """Extend an entry after a 304 Not Modified revalidation."""
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        conn = self.get_connection()
+        try:
+            conn.execute("""
+                UPDATE espn_response_cache
+                SET fetched_at = ?, expires_at = ?, last_access = ?
+                WHERE url = ?
+            """, (now, expires_at, now, url))
+            conn.commit()
+            self._stats['revalidated'] += 1
+        except Exception as e:
+            logger.debug(f"[ESPN CACHE] extend failed for {url}: {e}")
+        finally:
+            conn.close()
+
+    def _adjust_total(self, delta: int):
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._load_total()
+            else:
+                self._total_bytes += delta
+            over_limit = self._total_bytes > self.max_bytes
+
+        if over_limit:
+            self.evict()
+
+    def _load_total(self) -> int:
+        conn = self.get_connection()
+        try:
+            row = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM espn_response_cache").fetchone()
+            return row[0]
+        finally:
+            conn.close()
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until under the size target.
+
+        Returns:
+            Number of entries evicted
+        """
+        target = int(self.max_bytes * EVICT_TO_FRACTION)
+        self.flush_access()  # Evict by up-to-date recency
+        conn = self.get_connection()
+        try:
+            total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM espn_response_cache").fetchone()[0]
+            if total <= target:
+                with self._lock:
+                    self._total_bytes = total
+                return 0
+
+            victims = []
+            freed = 0
+            for row in conn.execute("SELECT url, size_bytes FROM espn_response_cache ORDER BY last_access ASC"):
+                victims.append((row['url'],))
+                freed += row['size_bytes']
+                if total - freed <= target:
+                    break
+
+            conn.executemany("DELETE FROM espn_response_cache WHERE url = ?", victims)
+            conn.commit()
+        finally:
+            conn.close()
+
+        with self._lock:
+            self._total_bytes = total - freed
+        self._stats['evicted'] += len(victims)
+        logger.info(f"[ESPN CACHE] Evicted {len(victims)} least recently used responses ({freed // 1024} KB)")
+        return len(victims)
+
+    def clear(self) -> int:
+        """Delete every cached response."""
+        conn = self.get_connection()
+        try:
+            cleared = conn.execute("DELETE FROM espn_response_cache").rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        with self._lock:
+            self._total_bytes = 0
+        return cleared
+
+    def get_stats(self):
+        """Hit/miss/store counters for this process."""
+        return self._stats.copy()
+
+
+_response_cache: Optional[ESPNResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ESPNResponseCache:
+    """Get the shared persistent response cache."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                from database import get_connection
+                _response_cache = ESPNResponseCache(get_connection)
+    return _response_cache
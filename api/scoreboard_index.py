@@ -0,0 +1,83 @@
+"""
+Scoreboard Index - per-team view of a fetched ESPN scoreboard
+
+Stream matching, league detection and EPG enrichment all ask the same
+questions of the cached scoreboards: "which games on date X involve team A
+(and team B)?" and "which scoreboard event has ID N?". Answering them by
+scanning every event and competitor of every day in the lookahead window
+repeats the same work thousands of times per generation.
+
+ScoreboardIndex decomposes one scoreboard response once into compact event
+refs keyed by competitor team ID and by event ID. ESPNClient keeps one index
+per cached scoreboard (see ESPNClient.get_scoreboard_index), so a lookup is
+a dict access plus a scan of the few games a team plays that day.
+
+Usage:
+    index = espn.get_scoreboard_index('basketball', 'nba', '20251126')
+    index.events_between(team1_id, team2_id)    # raw events with both teams
+    index.events_for_team(team_id)              # [ScoreboardEventRef, ...]
+    index.event(event_id)                       # raw event or None
+"""
+
+from datetime import datetime
+from typing import Dict, FrozenSet, List, NamedTuple, Optional
+
+from epg.schedule_index import parse_event_datetime
+
+
+class ScoreboardEventRef(NamedTuple):
+    """One scoreboard event with its pre-extracted lookup fields"""
+    start: Optional[datetime]    # Parsed 'date' (None if missing/unparseable)
+    team_ids: FrozenSet[str]     # Competitor team IDs (first competition)
+    competitor_count: int
+    event: dict                  # Raw scoreboard event (shared, never copied)
+
+
+class ScoreboardIndex:
+    """
+    Read-only index over one scoreboard response.
+
+    Refs keep scoreboard order (ESPN lists a day's games by start time), so
+    results come back in the same order a scan of the events would give.
+    """
+
+    def __init__(self, scoreboard_data: Dict):
+        # The response this index was built from (identity checked by ESPNClient)
+        self.source = scoreboard_data
+
+        self._by_team: Dict[str, List[ScoreboardEventRef]] = {}
+        self._by_id: Dict[str, dict] = {}
+
+        for event in scoreboard_data.get('events') or []:
+            try:
+                self._by_id[event.get('id')] = event
+
+                competitions = event.get('competitions', [])
+                if not competitions:
+                    continue
+
+                competitors = competitions[0].get('competitors', [])
+                ref = ScoreboardEventRef(
+                    start=parse_event_datetime(event),
+                    team_ids=frozenset(str(c.get('team', {}).get('id', '')) for c in competitors),
+                    competitor_count=len(competitors),
+                    event=event
+                )
+            except (AttributeError, TypeError, IndexError):
+                continue
+
+            for team_id in ref.team_ids:
+                self._by_team.setdefault(team_id, []).append(ref)
+
+    def events_for_team(self, team_id: str) -> List[ScoreboardEventRef]:
+        """Events with the team among the competitors, in scoreboard order"""
+        return self._by_team.get(str(team_id), [])
+
+    def events_between(self, team1_id: str, team2_id: str) -> List[dict]:
+        """Raw events involving both teams, in scoreboard order"""
+        team2_id = str(team2_id)
+        return [ref.event for ref in self.events_for_team(team1_id) if team2_id in ref.team_ids]
+
+    def event(self, event_id: str) -> Optional[dict]:
+        """Raw scoreboard event by ID (None if not on this scoreboard)"""
+        return self._by_id.get(event_id)
@@ -34,6 +34,7 @@ from epg.xmltv_generator import XMLTVGenerator
 from utils.logger import setup_logging, get_logger
 from utils import to_pascal_case
 from utils.time_format import format_time as fmt_time, get_time_settings
+from utils.settings_snapshot import get_settings_snapshot, invalidate_settings_snapshot, snapshot_from_settings
 from utils.filter_reasons import FilterReason, get_display_text, INTERNAL_REASONS
 from utils.match_result import (
     FilteredReason, FailedReason, MatchedTier,
@@ -224,7 +225,7 @@ def inject_globals():
 # CORE EPG GENERATION FUNCTIONS
 # =============================================================================
 
-def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_start_datetime=None, progress_callback=None, generation=None):
+def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_start_datetime=None, progress_callback=None, generation=None, matcher_pool=None):
     """
     Core function to refresh a single event EPG group.
 
@@ -238,37 +239,43 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         epg_start_datetime: Optional datetime for EPG start (for multi-day filler)
         progress_callback: Optional callable(processed, total, group_name) for stream progress
         generation: EPG generation counter for fingerprint cache (None = no caching)
+        matcher_pool: Optional MatcherPool shared across groups of one generation
+                      (a pool for this group is created if not provided)
 
     Returns:
         dict with keys: success, stream_count, matched_count, matched_streams,
                        epg_result, channel_results, error
     """
-    from epg.team_matcher import create_matcher
-    from epg.event_matcher import create_event_matcher
+    from epg.matcher_pool import MatcherPool
     from epg.event_epg_generator import generate_event_epg
     from epg.epg_consolidator import get_data_dir, after_event_epg_generation
     from database import get_template, update_event_epg_group_stats, save_failed_matches_batch, save_matched_streams_batch
     from utils.stream_filter import filter_game_streams
     from epg.stream_match_cache import StreamMatchCache, refresh_cached_event
+    from requests import RequestException
 
     group_id = group['id']
     group_name = group.get('group_name', f'Group {group_id}')
 
     # Initialize fingerprint cache if generation provided
-    stream_cache = StreamMatchCache(get_connection) if generation is not None else None
+    # All of the group's fingerprints are loaded up front and writes are flushed once after matching
+    stream_cache = StreamMatchCache(get_connection, buffer_writes=True) if generation is not None else None
+    if stream_cache:
+        stream_cache.load_group(group_id)
     cache_stats = {'hits': 0, 'misses': 0, 'stored': 0}
 
     # Collect matches for debugging
     failed_matches = []
     successful_matches = []
 
-    # Fetch settings early for use throughout the function
-    conn = get_connection()
-    settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
-    conn.close()
+    # Settings of this generation (the pool's snapshot, else the shared one)
+    settings_snapshot = (matcher_pool.settings if matcher_pool else None) or get_settings_snapshot()
+    settings = settings_snapshot.as_dict()
     include_final_events = bool(settings.get('include_final_events', 0))
     lookahead_days = settings.get('event_lookahead_days', 7)
 
+    streams_listed = False  # Set once every page of the group's streams has arrived
+
     try:
         # Step 1: Refresh M3U data and wait for completion (unless already done in batch)
         if not skip_m3u_refresh:
@@ -284,42 +291,26 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         else:
             app.logger.debug(f"Skipping M3U refresh for group {group_id} (already refreshed in batch)")
 
-        # Step 2: Fetch streams
-        all_streams = m3u_manager.list_streams(group_name=group['group_name'])
-        total_stream_count = len(all_streams)
-        app.logger.debug(f"Fetched {total_stream_count} streams for group '{group['group_name']}'")
+        # Step 2: Streams are fetched page by page further down (Step 3), so filtering
+        # and matching start on page one while later pages are still downloading
 
         # Step 2.5: Filter to game streams only (unless skip_builtin_filter is enabled)
         skip_builtin_filter = bool(group.get('skip_builtin_filter', 0))
 
         # Track granular filtering stats
+        total_stream_count = 0
         filtered_no_indicator = 0
         filtered_include_regex = 0
         filtered_exclude_regex = 0
 
         if skip_builtin_filter:
             # Skip built-in game indicator filter - user is using custom regex or wants all streams
-            streams = all_streams
             app.logger.debug(f"Skipping built-in filter (skip_builtin_filter enabled)")
         else:
             # Apply built-in filter (must have vs/@/at indicator)
             from utils.regex_helper import get_group_filter_patterns
             include_regex, exclude_regex = get_group_filter_patterns(group)
 
-            filter_result = filter_game_streams(
-                all_streams,
-                include_regex=include_regex,
-                exclude_regex=exclude_regex
-            )
-            streams = filter_result['game_streams']
-            filtered_no_indicator = filter_result['filtered_no_indicator']
-            filtered_include_regex = filter_result['filtered_include_regex']
-            filtered_exclude_regex = filter_result['filtered_exclude_regex']
-            filtered_count = filtered_no_indicator + filtered_include_regex + filtered_exclude_regex
-
-            if filtered_count > 0:
-                app.logger.debug(f"Filtered {filtered_count} non-game streams ({filtered_no_indicator} no indicator, {filtered_include_regex} include regex, {filtered_exclude_regex} exclude regex), {len(streams)} game streams remain")
-
         # Step 3: Match streams to ESPN events (PARALLEL for speed)
         from concurrent.futures import ThreadPoolExecutor
 
@@ -359,11 +350,24 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
                 app.logger.warning(f"Multi-sport mode enabled but no leagues configured")
                 is_multi_sport = False  # Fall back to single-league mode
 
+        # Shared matchers for all worker threads (built once, not per stream)
+        pool = matcher_pool
+        if pool is None or pool.lookahead_days != lookahead_days:
+            pool = MatcherPool(lookahead_days=lookahead_days, settings=settings_snapshot)
+        shared_team_matcher = pool.team_matcher
+        shared_event_matcher = pool.event_matcher
+
+        if is_multi_sport:
+            shared_league_detector = pool.get_league_detector(enabled_leagues)
+            pool.prepare_leagues(enabled_leagues or [], load_teams=False)
+        else:
+            shared_league_detector = None
+            pool.prepare_leagues([group.get('assigned_league')])
+
         def match_single_stream_single_league(stream):
             """Match a single stream to ESPN event in assigned league - called in parallel"""
-            # Create matchers per-thread for thread safety
-            thread_team_matcher = create_matcher()
-            thread_event_matcher = create_event_matcher(lookahead_days=lookahead_days)
+            thread_team_matcher = shared_team_matcher
+            thread_event_matcher = shared_event_matcher
 
             try:
                 # Use selective regex if any individual field is enabled
@@ -476,18 +480,13 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
               Tier 3a-c: Cache lookup + schedule disambiguation
               Tier 4a-b: Single-team schedule fallback (NAIA vs NCAA)
             """
-            from epg.league_detector import LeagueDetector
             from epg.multi_sport_matcher import MultiSportMatcher, MatcherConfig
             from database import find_any_channel_for_event
 
-            # Create per-thread instances
-            thread_team_matcher = create_matcher()
-            thread_event_matcher = create_event_matcher(lookahead_days=lookahead_days)
-            thread_league_detector = LeagueDetector(
-                espn_client=thread_event_matcher.espn,
-                enabled_leagues=enabled_leagues,
-                lookahead_days=lookahead_days
-            )
+            # Shared instances (thread-safe, built once per group)
+            thread_team_matcher = shared_team_matcher
+            thread_event_matcher = shared_event_matcher
+            thread_league_detector = shared_league_detector
 
             # Configure the matcher
             config = MatcherConfig(
@@ -584,9 +583,8 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         # Select the matching function based on mode
         match_single_stream_base = match_single_stream_multi_sport if is_multi_sport else match_single_stream_single_league
 
-        # Create ESPN client for cache refreshes (shared across threads via get_event_summary)
-        from api.espn_client import ESPNClient
-        espn_for_cache = ESPNClient()
+        # ESPN client for cache refreshes (shared across threads via get_event_summary)
+        espn_for_cache = pool.espn
 
         def match_with_cache(stream):
             """
@@ -669,12 +667,42 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         filtered_unsupported_sport = 0
         results = []
 
-        if streams:  # Only use ThreadPoolExecutor if there are streams to process
-            total_streams = len(streams)
-            processed_count = 0
+        streams = []  # Game streams (passed filtering), across all pages
+
+        try:
+            with ThreadPoolExecutor(max_workers=100) as executor:
+                futures = {}
+
+                # Filter each page as it arrives and queue its game streams for matching
+                for page in m3u_manager.iter_stream_pages(group_name=group['group_name']):
+                    total_stream_count += len(page)
+
+                    if skip_builtin_filter:
+                        page_streams = page
+                    else:
+                        filter_result = filter_game_streams(
+                            page,
+                            include_regex=include_regex,
+                            exclude_regex=exclude_regex
+                        )
+                        page_streams = filter_result['game_streams']
+                        filtered_no_indicator += filter_result['filtered_no_indicator']
+                        filtered_include_regex += filter_result['filtered_include_regex']
+                        filtered_exclude_regex += filter_result['filtered_exclude_regex']
+
+                    streams.extend(page_streams)
+                    for s in page_streams:
+                        futures[executor.submit(match_with_cache, s)] = s
+                streams_listed = True
+
+                app.logger.debug(f"Fetched {total_stream_count} streams for group '{group['group_name']}'")
+                filtered_count = filtered_no_indicator + filtered_include_regex + filtered_exclude_regex
+                if filtered_count > 0:
+                    app.logger.debug(f"Filtered {filtered_count} non-game streams ({filtered_no_indicator} no indicator, {filtered_include_regex} include regex, {filtered_exclude_regex} exclude regex), {len(streams)} game streams remain")
+
+                total_streams = len(streams)
+                processed_count = 0
 
-            with ThreadPoolExecutor(max_workers=min(total_streams, 100)) as executor:
-                futures = {executor.submit(match_with_cache, s): s for s in streams}
                 for future in as_completed(futures):
                     result = future.result()
                     results.append(result)
@@ -691,6 +719,11 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
                             stream_matched=matched,
                             stream_status=status_icon
                         )
+        finally:
+            # Write buffered fingerprint cache sets/touches in one transaction,
+            # even if matching failed part way through
+            if stream_cache:
+                stream_cache.flush()
 
         # Process results
         for result in results:
@@ -797,8 +830,8 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         # (e.g., game went final but channel hasn't been deleted yet)
         from database import get_managed_channels_for_group
 
-        # Create event_matcher for fetching events by ID (outside thread pool)
-        event_matcher = create_event_matcher(lookahead_days=lookahead_days)
+        # Event matcher for fetching events by ID (outside thread pool)
+        event_matcher = pool.event_matcher
 
         existing_channels = get_managed_channels_for_group(group_id)
         matched_event_ids = {m['event'].get('id') for m in matched_streams}
@@ -1070,6 +1103,15 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         }
 
     except Exception as e:
+        if isinstance(e, RequestException) and not streams_listed:
+            # A page of the stream listing failed: the streams seen so far are not the
+            # whole group, so no EPG or channel lifecycle changes are made from them
+            app.logger.error(f"Incomplete stream listing for event group '{group['group_name']}': {e}")
+            return {
+                'success': False,
+                'error': f"Stream fetch failed: {e}",
+                'step': 'fetch'
+            }
         app.logger.error(f"Error refreshing event group '{group['group_name']}': {e}", exc_info=True)
         return {
             'success': False,
@@ -1162,14 +1204,14 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
     }
 
     try:
-        # Get settings if not provided
+        # Get settings if not provided - one snapshot shared by every phase of this generation
         if settings is None:
-            conn = get_connection()
-            settings_row = conn.execute("SELECT * FROM settings WHERE id = 1").fetchone()
-            conn.close()
-            if not settings_row:
+            settings_snapshot = get_settings_snapshot()
+            if not settings_snapshot:
                 return {'success': False, 'error': 'Settings not configured'}
-            settings = dict(settings_row)
+            settings = settings_snapshot.as_dict()
+        else:
+            settings_snapshot = snapshot_from_settings(settings)
 
         days_ahead = settings.get('epg_days_ahead', 14)
         epg_timezone = settings.get('default_timezone', 'America/Detroit')
@@ -1223,13 +1265,17 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                 # Generate team XMLTV and save via consolidator
                 report_progress('progress', f'Saving team EPG ({team_stats["count"]} teams)...', 45)
 
-                xml_content = xmltv_generator.generate(
-                    result['teams_list'],
-                    result['all_events'],
-                    settings
+                # Stream team XMLTV straight into teams.xml
+                after_team_epg_generation(
+                    None,
+                    output_path,
+                    write_xml=lambda f: xmltv_generator.write(
+                        result['teams_list'],
+                        result['all_events'],
+                        settings,
+                        f
+                    )
                 )
-
-                after_team_epg_generation(xml_content, output_path)
                 app.logger.info(f"📺 Team EPG: {team_stats['programmes']} programs from {team_stats['count']} teams")
             else:
                 report_progress('progress', 'No active teams configured, skipping team EPG...', 45)
@@ -1281,15 +1327,21 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                     if g.get('dispatcharr_account_id')
                 ))
 
+                # Refreshes are tracked in the background; each group is gated on its own
+                # account, so groups on finished accounts start while others still refresh
+                from api.dispatcharr_client import M3URefreshTracker
+                refresh_tracker = M3URefreshTracker(m3u_manager, timeout=120)
+                account_gates = {}
+
                 if unique_account_ids:
                     account_count = len(unique_account_ids)
                     report_progress('progress', f'Refreshing {account_count} M3U provider(s)...', 52)
                     app.logger.info(f"🔄 Batch refreshing {account_count} unique M3U account(s) for {total_groups} event group(s)")
 
-                    batch_refresh_result = m3u_manager.refresh_multiple_accounts(
-                        unique_account_ids,
-                        timeout=120
-                    )
+                    account_gates = refresh_tracker.start(unique_account_ids)
+
+                def log_m3u_refresh_summary():
+                    batch_refresh_result = refresh_tracker.summary()
 
                     if batch_refresh_result.get('success'):
                         skipped = batch_refresh_result.get('skipped_count', 0)
@@ -1316,27 +1368,29 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                             if not result.get('success') and not result.get('skipped'):
                                 app.logger.warning(f"  Account {account_id}: {result.get('message')}")
 
-                # Step 2b: Process groups sequentially (parents first, then children)
-                # Sequential processing allows stream-level progress reporting during large groups
-                # Streams within each group are still processed in parallel for speed
+                # Step 2b: Process groups in parallel on a dependency-aware scheduler
+                # Children wait for their parent, multi-sport groups wait for the single-league
+                # groups they check; streams within each group are still matched in parallel
                 report_progress('progress', f'Processing {total_groups} event group(s)...', 55)
 
-                group_results = []
+                from epg.group_scheduler import GroupScheduler
+
                 completed_count = 0
                 all_groups = single_league_parents + single_league_children + multi_sport_groups
 
-                def make_stream_progress_callback(group_idx, total_groups):
+                # One set of matchers for every group in this generation
+                from epg.matcher_pool import MatcherPool
+                matcher_pool = MatcherPool(
+                    lookahead_days=settings.get('event_lookahead_days', 7),
+                    settings=settings_snapshot
+                )
+
+                def make_stream_progress_callback():
                     """Create a callback for stream-level progress within a group."""
                     def callback(processed_streams, total_streams, group_name, **kwargs):
-                        # Calculate overall progress: 55-85% range divided among groups
-                        # Each group gets a slice of the progress bar proportional to its position
-                        group_base_percent = 55 + int(30 * group_idx / total_groups)
-                        group_end_percent = 55 + int(30 * (group_idx + 1) / total_groups)
-                        group_range = group_end_percent - group_base_percent
-
-                        # Within this group's slice, show stream progress
-                        stream_progress = processed_streams / total_streams if total_streams > 0 else 1
-                        progress_percent = group_base_percent + int(group_range * stream_progress)
+                        # Groups run concurrently, so the bar tracks completed groups (55-85% range)
+                        # and the message carries the reporting group's stream progress
+                        progress_percent = 55 + int(30 * completed_count / total_groups)
 
                         # Build message with stream name and status if available
                         stream_name = kwargs.get('stream_name', '')
@@ -1359,35 +1413,28 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                         )
                     return callback
 
-                for group_idx, group in enumerate(all_groups):
-                    try:
-                        # Create stream progress callback for this group
-                        stream_callback = make_stream_progress_callback(group_idx, total_groups)
-
-                        # Initial progress message for this group
-                        group_base_percent = 55 + int(30 * group_idx / total_groups)
-                        report_progress(
-                            'progress',
-                            f"Starting group: {group['group_name']}",
-                            group_base_percent,
-                            group_name=group['group_name']
-                        )
+                def process_group(group):
+                    # Process the group with stream-level progress callback
+                    return refresh_event_group_core(
+                        group, m3u_manager,
+                        skip_m3u_refresh=True,
+                        epg_start_datetime=epg_start_datetime,
+                        progress_callback=make_stream_progress_callback(),
+                        generation=current_generation,
+                        matcher_pool=matcher_pool
+                    )
 
-                        # Process the group with stream-level progress callback
-                        refresh_result = refresh_event_group_core(
-                            group, m3u_manager,
-                            skip_m3u_refresh=True,
-                            epg_start_datetime=epg_start_datetime,
-                            progress_callback=stream_callback,
-                            generation=current_generation
-                        )
-                        error = None
-                    except Exception as e:
-                        app.logger.warning(f"Error refreshing event group '{group['group_name']}': {e}")
-                        refresh_result = None
-                        error = str(e)
+                def on_group_start(group):
+                    # Initial progress message for this group
+                    report_progress(
+                        'progress',
+                        f"Starting group: {group['group_name']}",
+                        55 + int(30 * completed_count / total_groups),
+                        group_name=group['group_name']
+                    )
 
-                    group_results.append((group, refresh_result, error))
+                def on_group_complete(group, refresh_result, error):
+                    nonlocal completed_count
                     completed_count += 1
 
                     # Aggregate stats
@@ -1422,6 +1469,17 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                         current=completed_count,
                         total=total_groups
                     )
+
+                group_gates = {
+                    g['id']: account_gates[g['dispatcharr_account_id']]
+                    for g in all_groups
+                    if g.get('dispatcharr_account_id') in account_gates
+                }
+                scheduler = GroupScheduler(all_groups, gates=group_gates)
+                scheduler.run(process_group, on_start=on_group_start, on_complete=on_group_complete)
+
+                if unique_account_ids:
+                    log_m3u_refresh_summary()
             else:
                 report_progress('progress', 'M3U manager not available, skipping event groups...', 85)
                 app.logger.warning("M3U manager not available - skipping event groups")
@@ -1597,12 +1655,15 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
 
                     # Update last sync time
                     sync_conn = get_connection()
-                    sync_conn.execute(
-                        "UPDATE settings SET dispatcharr_last_sync = ? WHERE id = 1",
-                        (datetime.now().isoformat(),)
-                    )
-                    sync_conn.commit()
-                    sync_conn.close()
+                    try:
+                        sync_conn.execute(
+                            "UPDATE settings SET dispatcharr_last_sync = ? WHERE id = 1",
+                            (datetime.now().isoformat(),)
+                        )
+                        sync_conn.commit()
+                    finally:
+                        sync_conn.close()
+                    invalidate_settings_snapshot()
                     dispatcharr_refreshed = True
 
                     # ============================================
@@ -1819,8 +1880,10 @@ def scheduler_loop():
     while scheduler_running:
         try:
             conn = get_connection()
-            settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
-            conn.close()
+            try:
+                settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
+            finally:
+                conn.close()
 
             if not settings.get('auto_generate_enabled', False):
                 time.sleep(60)  # Check every minute if disabled
@@ -2294,7 +2357,11 @@ def templates_import():
         data = json.load(file)
 
         # Check if template name already exists
-        existing = get_connection().execute("SELECT id FROM templates WHERE name = ?", (data.get('name', ''),)).fetchone()
+        conn = get_connection()
+        try:
+            existing = conn.execute("SELECT id FROM templates WHERE name = ?", (data.get('name', ''),)).fetchone()
+        finally:
+            conn.close()
         if existing:
             # Append timestamp to make unique
             data['name'] = f"{data['name']} (imported {datetime.now().strftime('%Y-%m-%d %H:%M')})"
@@ -2900,6 +2967,7 @@ def settings_update():
                     # Validate epg_days_ahead range
                     if field == 'epg_days_ahead' and value and (value < 1 or value > 14):
                         flash('Days to Generate must be between 1 and 14', 'error')
+                        conn.close()
                         return redirect(url_for('settings_form'))
                 elif field in ['game_duration_default', 'max_program_hours_default',
                                'game_duration_basketball', 'game_duration_football',
@@ -2913,6 +2981,7 @@ def settings_update():
 
         conn.commit()
         conn.close()
+        invalidate_settings_snapshot()
 
         flash('Settings updated successfully!', 'success')
     except Exception as e:
@@ -3060,6 +3129,7 @@ def dispatcharr_refresh_manual():
             )
             conn.commit()
             conn.close()
+            invalidate_settings_snapshot()
 
         return jsonify(result)
 
@@ -3234,13 +3304,7 @@ def get_generation_status():
 def download_epg():
     """Download generated EPG file"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT epg_output_path FROM settings WHERE id = 1")
-        result = cursor.fetchone()
-        conn.close()
-
-        output_path = result[0] if result else '/app/data/teamarr.xml'
+        output_path = _get_epg_output_path()
 
         if not os.path.exists(output_path):
             app.logger.warning(f'EPG file not found at {output_path}')
@@ -3254,24 +3318,71 @@ def download_epg():
         flash(f"Error downloading EPG: {str(e)}", 'error')
         return redirect(url_for('index'))
 
+# ETag per served EPG file: path -> ((size, mtime_ns), sha256)
+_epg_etag_cache = {}
+
+
+def _get_epg_output_path():
+    """Get the configured final EPG output path (from the settings snapshot, so
+    polling clients don't hit SQLite on every request)"""
+    settings = get_settings_snapshot()
+    return (settings.get('epg_output_path') if settings else None) or '/app/data/teamarr.xml'
+
+
+def _send_epg_file(path):
+    """
+    Send an EPG XML file with conditional GET and gzip negotiation.
+
+    - ETag is the SHA256 of the file content (same as XMLTVGenerator.calculate_file_hash),
+      computed once per file version and cached by size/mtime
+    - If-None-Match / If-Modified-Since are answered with 304
+    - Clients accepting gzip get the precompressed .gz sidecar when it is current
+    """
+    from epg.xmltv_writer import file_sha256
+
+    st = os.stat(path)
+    signature = (st.st_size, st.st_mtime_ns)
+    cached = _epg_etag_cache.get(path)
+    if cached and cached[0] == signature:
+        etag = cached[1]
+    else:
+        etag = file_sha256(path)
+        _epg_etag_cache[path] = (signature, etag)
+
+    gz_path = path + '.gz'
+    gz_current = False
+    if request.accept_encodings['gzip'] and os.path.exists(gz_path):
+        gz_current = os.stat(gz_path).st_mtime_ns >= st.st_mtime_ns
+
+    if gz_current:
+        # Distinct strong ETag per representation
+        response = send_file(
+            gz_path, mimetype='application/xml',
+            etag=f'{etag}-gzip', last_modified=st.st_mtime, max_age=0
+        )
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = send_file(
+            path, mimetype='application/xml',
+            etag=etag, last_modified=st.st_mtime, max_age=0
+        )
+
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
 @app.route('/teamarr.xml')
 def serve_epg():
     """Serve EPG file for IPTV clients"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT epg_output_path FROM settings WHERE id = 1")
-        result = cursor.fetchone()
-        conn.close()
-
-        output_path = result[0] if result else '/app/data/teamarr.xml'
+        output_path = _get_epg_output_path()
 
         if not os.path.exists(output_path):
             app.logger.warning(f'EPG file not found at {output_path}')
             return "EPG file not found. Generate it first.", 404
 
-        app.logger.info(f'📡 Serving EPG file: {output_path}')
-        return send_file(output_path, mimetype='application/xml')
+        app.logger.debug(f'📡 Serving EPG file: {output_path}')
+        return _send_epg_file(output_path)
     except Exception as e:
         app.logger.error(f"❌ Error serving EPG: {str(e)}", exc_info=True)
         return f"Error serving EPG: {str(e)}", 500
@@ -3373,7 +3484,8 @@ def api_epg_stats_live():
     """
     Get live game statistics from the EPG.
 
-    Uses teamarr metadata comments in the XML to identify game events,
+    Reads the game programme index written next to the EPG on each merge
+    (rebuilt from the XML's teamarr metadata comments if missing or stale),
     then compares times to current datetime to calculate:
     - games_today: Events scheduled for today
     - live_now: Events currently in progress (started but not ended)
@@ -3381,16 +3493,14 @@ def api_epg_stats_live():
     Query params:
         type: 'team' or 'event' (default: both)
     """
-    import xml.etree.ElementTree as ET
-    from datetime import datetime, timedelta, timezone
+    from datetime import datetime, timedelta
     from zoneinfo import ZoneInfo
     from utils.time_format import format_time, get_time_settings
+    from epg.programme_index import KIND_NAMES, query_game_programmes
 
     try:
         # Get settings for timezone and EPG path
-        conn = get_connection()
-        settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
-        conn.close()
+        settings = get_settings_snapshot()
 
         epg_path = settings.get('epg_output_path', '/app/data/teamarr.xml')
         user_tz_name = settings.get('default_timezone', 'America/Detroit')
@@ -3408,78 +3518,26 @@ def api_epg_stats_live():
         if not os.path.exists(epg_path):
             return jsonify({'success': True, 'stats': stats, 'message': 'No EPG file found'})
 
-        # Parse the EPG XML with comments enabled
-        parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
-        tree = ET.parse(epg_path, parser)
-        root = tree.getroot()
-
-        # Parse XMLTV datetime format: YYYYMMDDHHmmss +ZZZZ
-        def parse_xmltv_time(time_str):
-            if not time_str:
-                return None
-            try:
-                # Handle format like "20251129220000 -0500"
-                parts = time_str.split()
-                dt_str = parts[0]
-                tz_str = parts[1] if len(parts) > 1 else '+0000'
-
-                dt = datetime.strptime(dt_str, '%Y%m%d%H%M%S')
-
-                # Parse timezone offset
-                tz_sign = 1 if tz_str[0] == '+' else -1
-                tz_hours = int(tz_str[1:3])
-                tz_mins = int(tz_str[3:5])
-                tz_offset = timedelta(hours=tz_sign * tz_hours, minutes=tz_sign * tz_mins)
-                dt = dt.replace(tzinfo=timezone(tz_offset))
-
-                return dt.astimezone(user_tz)
-            except Exception:
-                return None
-
-        # Process each programme element
-        for programme in root.findall('.//programme'):
-            # Look for teamarr metadata comment
-            teamarr_type = None
-            for child in programme:
-                if callable(child.tag):  # Comments have callable tag (ET.Comment)
-                    comment_text = child.text or ''
-                    if comment_text.startswith('teamarr:'):
-                        teamarr_type = comment_text[8:]  # Remove 'teamarr:' prefix
-                        break
-
-            # Skip if no teamarr metadata or if it's filler
-            if not teamarr_type or 'filler' in teamarr_type:
-                continue
-
-            # Determine stat key from metadata (teams-event or event-event)
-            stat_key = 'team' if teamarr_type == 'teams-event' else 'event'
-
-            start_str = programme.get('start')
-            stop_str = programme.get('stop')
-            title_elem = programme.find('title')
-            title = title_elem.text if title_elem is not None else ''
-
-            start_time = parse_xmltv_time(start_str)
-            stop_time = parse_xmltv_time(stop_str)
-
-            if not start_time or not stop_time:
-                continue
-
-            start_date = start_time.date()
-
-            # Games Today: events scheduled for today
-            if start_date == today:
-                stats[stat_key]['games_today'] += 1
-                stats[stat_key]['today_events'].append({
-                    'title': title,
-                    'start': format_time(start_time, time_fmt, show_tz),
-                    'start_ts': start_time.timestamp(),  # For sorting
-                    'channel': programme.get('channel', '')
-                })
+        # Games Today: game programmes starting between local midnight and the next
+        day_start = datetime.combine(today, datetime.min.time(), tzinfo=user_tz)
+        day_end = datetime.combine(today + timedelta(days=1), datetime.min.time(), tzinfo=user_tz)
+        now_ts = now.timestamp()
+
+        for game in query_game_programmes(epg_path, int(day_start.timestamp()), int(day_end.timestamp())):
+            stat_key = KIND_NAMES[game.kind]
+            start_time = datetime.fromtimestamp(game.start, user_tz)
+
+            stats[stat_key]['games_today'] += 1
+            stats[stat_key]['today_events'].append({
+                'title': game.title,
+                'start': format_time(start_time, time_fmt, show_tz),
+                'start_ts': game.start,  # For sorting
+                'channel': game.channel
+            })
 
-                # Live Now: currently in progress
-                if start_time <= now <= stop_time:
-                    stats[stat_key]['live_now'] += 1
+            # Live Now: currently in progress
+            if game.start <= now_ts <= game.stop:
+                stats[stat_key]['live_now'] += 1
 
         # Sort events by start time (earliest first)
         for key in ['team', 'event']:
@@ -4212,6 +4270,22 @@ def api_soccer_team_leagues(team_id):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+# =============================================================================
+# DATABASE METRICS
+# =============================================================================
+
+@app.route('/api/db/pool-stats', methods=['GET'])
+def api_db_pool_stats():
+    """Get database connection pool utilization and match cache lock wait statistics."""
+    from database import get_pool_stats
+
+    try:
+        return jsonify({'success': True, **get_pool_stats()})
+    except Exception as e:
+        app.logger.error(f"Error getting database pool stats: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 # =============================================================================
 # TEAM-LEAGUE CACHE API ENDPOINTS (Non-Soccer Sports)
 # =============================================================================
@@ -5866,6 +5940,7 @@ def api_event_epg_test_regex(group_id):
     """
     from epg.team_matcher import create_matcher
     from utils.regex_helper import compile_pattern, validate_pattern
+    from utils.stream_filter import pattern_match_indexes
 
     try:
         group = get_event_epg_group(group_id)
@@ -5918,8 +5993,10 @@ def api_event_epg_test_regex(group_id):
         if limit:
             streams = streams[:limit]
 
-        # Compile exclude pattern if provided
+        # Compile exclude pattern if provided and find excluded streams in one batch
         exclude_regex = compile_pattern(exclude_pattern) if exclude_pattern else None
+        stream_names = [stream.get('name', '') for stream in streams]
+        excluded_indexes = set(pattern_match_indexes(exclude_regex, stream_names)) if exclude_regex else set()
 
         # Test regex against each stream
         team_matcher = create_matcher()
@@ -5927,11 +6004,9 @@ def api_event_epg_test_regex(group_id):
         results = []
         excluded_count = 0
 
-        for stream in streams:
-            stream_name = stream.get('name', '')
-
+        for index, stream_name in enumerate(stream_names):
             # Check exclusion pattern first
-            if exclude_regex and exclude_regex.search(stream_name):
+            if index in excluded_indexes:
                 results.append({
                     'stream_name': stream_name,
                     'matched': False,
@@ -6224,7 +6299,7 @@ def serve_event_epg(group_id):
             return Response(empty_xml, mimetype='application/xml')
 
         app.logger.debug(f"Serving event EPG file for group {group_id}")
-        return send_file(epg_path, mimetype='application/xml')
+        return _send_epg_file(epg_path)
 
     except Exception as e:
         app.logger.error(f"Error serving event EPG for group {group_id}: {e}")
@@ -7683,6 +7758,7 @@ def sync_timezone_from_env():
             conn.execute("UPDATE settings SET default_timezone = ? WHERE id = 1", (env_tz,))
             conn.commit()
             conn.close()
+            invalidate_settings_snapshot()
             app.logger.info(f"🌍 Timezone synced from TZ env var: {env_tz}")
         except Exception as e:
             app.logger.warning(f"⚠️ Invalid TZ env var '{env_tz}': {e}")
@@ -7694,6 +7770,7 @@ def sync_timezone_from_env():
             if not row or not row[0]:
                 conn.execute("UPDATE settings SET default_timezone = 'America/Detroit' WHERE id = 1")
                 conn.commit()
+                invalidate_settings_snapshot()
                 app.logger.info("🌍 No TZ env var, defaulting to America/Detroit")
             conn.close()
         except Exception as e:
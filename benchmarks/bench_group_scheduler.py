@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential event groups vs dependency-aware GroupScheduler
+
+Builds a synthetic generation of single-league parents, child groups and
+multi-sport groups and runs every group through refresh_event_group_core,
+once one after another (old generate_all_epg loop) and once on the
+GroupScheduler. Dispatcharr's stream listing and ESPN requests are
+simulated with configurable latency; Dispatcharr channel management is
+disabled.
+
+Runs fully offline (OfflineESPNClient + temp database).
+
+Usage:
+    python3 benchmarks/bench_group_scheduler.py --parents 30 --children 4 --multi-sport 2
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import (  # noqa: E402
+    OfflineESPNClient, create_temp_database, synthetic_fixtures, synthetic_streams, synthetic_teams
+)
+
+
+class FakeM3UManager:
+    """Stand-in for M3UManager: serves synthetic streams per group name, 1,000 per page."""
+
+    PAGE_SIZE = 1000
+
+    def __init__(self, streams_by_group, latency):
+        self.streams_by_group = streams_by_group
+        self.latency = latency
+
+    def iter_stream_pages(self, group_name=None, **kwargs):
+        streams = self.streams_by_group.get(group_name, [])
+        for start in range(0, max(len(streams), 1), self.PAGE_SIZE):
+            time.sleep(self.latency)
+            yield list(streams[start:start + self.PAGE_SIZE])
+
+    def list_streams(self, group_name=None, **kwargs):
+        return [s for page in self.iter_stream_pages(group_name) for s in page]
+
+
+def create_groups(league, parents, children, multi_sport, template_id):
+    """Insert synthetic event groups; returns them in generate_all_epg order."""
+    import json
+    from database import create_event_epg_group, get_all_event_epg_groups
+
+    dispatcharr_id = 1
+    parent_ids = []
+    for i in range(parents):
+        parent_ids.append(create_event_epg_group(
+            dispatcharr_group_id=dispatcharr_id, dispatcharr_account_id=1,
+            group_name=f"Provider {i} | {league.upper()}", assigned_league=league,
+            assigned_sport='basketball', event_template_id=template_id
+        ))
+        dispatcharr_id += 1
+    for i in range(children):
+        create_event_epg_group(
+            dispatcharr_group_id=dispatcharr_id, dispatcharr_account_id=1,
+            group_name=f"Backup {i} | {league.upper()}", assigned_league=league,
+            assigned_sport='basketball', parent_group_id=parent_ids[i % len(parent_ids)]
+        )
+        dispatcharr_id += 1
+    for i in range(multi_sport):
+        create_event_epg_group(
+            dispatcharr_group_id=dispatcharr_id, dispatcharr_account_id=1,
+            group_name=f"Sports Mix {i}", assigned_league=league, assigned_sport='basketball',
+            event_template_id=template_id, is_multi_sport=True, enabled_leagues=json.dumps([league]),
+            overlap_handling='consolidate'
+        )
+        dispatcharr_id += 1
+
+    groups = get_all_event_epg_groups(enabled_only=True)
+    single = [g for g in groups if not g.get('is_multi_sport')]
+    return (
+        [g for g in single if not g.get('parent_group_id')]
+        + [g for g in single if g.get('parent_group_id')]
+        + [g for g in groups if g.get('is_multi_sport')]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parents', type=int, default=30)
+    parser.add_argument('--children', type=int, default=4)
+    parser.add_argument('--multi-sport', type=int, default=2)
+    parser.add_argument('--streams', type=int, default=100, help='streams per group')
+    parser.add_argument('--teams', type=int, default=30)
+    parser.add_argument('--workers', type=int, default=4, help='groups processed at once')
+    parser.add_argument('--m3u-latency', type=float, default=0.3, help='seconds per stream page request')
+    parser.add_argument('--espn-latency', type=float, default=0.05, help='seconds per ESPN request')
+    parser.add_argument('--league', default='nba')
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.WARNING)
+
+    teams = synthetic_teams(args.teams)
+    fixtures = synthetic_fixtures(teams, days=7, games_per_day=args.teams // 2)
+    create_temp_database(args.league, teams)
+
+    from database import create_template, get_connection
+    output_dir = tempfile.mkdtemp(prefix='teamarr-bench-epg-')
+    conn = get_connection()
+    try:
+        conn.execute(
+            "UPDATE settings SET epg_output_path = ?, dispatcharr_enabled = 0 WHERE id = 1",
+            (os.path.join(output_dir, 'teamarr.xml'),)
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    template_id = create_template({
+        'name': 'Bench Event', 'template_type': 'event',
+        'title_format': '{away_team} @ {home_team}', 'description_template': '{matchup}'
+    })
+    groups = create_groups(args.league, args.parents, args.children, args.multi_sport, template_id)
+
+    streams_by_group = {
+        g['group_name']: synthetic_streams(fixtures, args.streams, prefix=args.league.upper(), noise_every=10)
+        for g in groups
+    }
+    m3u_manager = FakeM3UManager(streams_by_group, args.m3u_latency)
+
+    # Importing app initializes Flask and runs migrations against the temp database
+    import contextlib
+    import io
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app as teamarr_app
+    from epg.group_scheduler import GroupScheduler
+    from epg.matcher_pool import MatcherPool
+    from epg import team_matcher as team_matcher_module
+
+    def fresh_pool():
+        OfflineESPNClient.clear_all_caches()
+        team_matcher_module._shared_team_cache.clear()
+        espn = OfflineESPNClient(fixtures, latency=args.espn_latency)
+        pool = MatcherPool(lookahead_days=7, espn_client=espn)
+        return pool, espn
+
+    def process_with(pool):
+        def process(group):
+            return teamarr_app.refresh_event_group_core(
+                group, m3u_manager, skip_m3u_refresh=True, matcher_pool=pool
+            )
+        return process
+
+    print(f"Synthetic generation: {len(groups)} groups ({args.parents} parents, {args.children} children, "
+          f"{args.multi_sport} multi-sport), {args.streams} streams each")
+    print(f"{'mode':<12} {'wall (s)':>9} {'groups ok':>10} {'matched':>8} {'ESPN calls':>11}")
+
+    def report(label, elapsed, results, espn):
+        ok = sum(1 for _, r, _ in results if r and r.get('success'))
+        matched = sum((r or {}).get('matched_count', 0) for _, r, _ in results)
+        calls = sum(espn.request_counts.values())
+        print(f"{label:<12} {elapsed:>9.2f} {ok:>10} {matched:>8} {calls:>11}")
+
+    pool, espn = fresh_pool()
+    process = process_with(pool)
+    start = time.perf_counter()
+    results = []
+    for group in groups:
+        try:
+            results.append((group, process(group), None))
+        except Exception as e:
+            results.append((group, None, str(e)))
+    report('sequential', time.perf_counter() - start, results, espn)
+
+    pool, espn = fresh_pool()
+    start = time.perf_counter()
+    results = GroupScheduler(groups, max_workers=args.workers).run(process_with(pool))
+    report(f'scheduled x{args.workers}', time.perf_counter() - start, results, espn)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-stream matchers vs shared MatcherPool
+
+Replays a synthetic single-league event group through the same matching
+steps refresh_event_group_core runs per stream (extract_teams +
+find_and_enrich), once building matchers per stream (old behaviour) and
+once sharing a MatcherPool across the executor threads.
+
+Runs fully offline (OfflineESPNClient + temp database).
+
+Usage:
+    python3 benchmarks/bench_matcher_pool.py --streams 5000 --workers 100
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import (  # noqa: E402
+    OfflineESPNClient, create_temp_database, synthetic_fixtures, synthetic_streams, synthetic_teams
+)
+
+
+def _match(team_matcher, event_matcher, stream, league):
+    team_result = team_matcher.extract_teams(stream['name'], league)
+    if not team_result.get('matched'):
+        return False
+    event_result = event_matcher.find_and_enrich(
+        team_result['away_team_id'],
+        team_result['home_team_id'],
+        league,
+        game_date=team_result.get('game_date'),
+        game_time=team_result.get('game_time'),
+    )
+    return bool(event_result.get('found'))
+
+
+def run_per_stream(espn, streams, league, workers, lookahead_days):
+    """Old behaviour: fresh matchers for every stream."""
+    from database import get_connection
+    from epg.team_matcher import TeamMatcher
+    from epg.event_matcher import EventMatcher
+    from epg.event_enricher import EventEnricher
+
+    def match_one(stream):
+        team_matcher = TeamMatcher(espn, db_connection_func=get_connection)
+        enricher = EventEnricher(espn, db_connection_func=get_connection)
+        event_matcher = EventMatcher(
+            espn, db_connection_func=get_connection,
+            lookahead_days=lookahead_days, enricher=enricher
+        )
+        return _match(team_matcher, event_matcher, stream, league)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(match_one, streams))
+
+
+def run_pooled(espn, streams, league, workers, lookahead_days):
+    """New behaviour: one MatcherPool shared by all threads."""
+    from epg.matcher_pool import MatcherPool
+
+    pool = MatcherPool(lookahead_days=lookahead_days, espn_client=espn)
+    pool.prepare_leagues([league])
+
+    def match_one(stream):
+        return _match(pool.team_matcher, pool.event_matcher, stream, league)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(match_one, streams))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--streams', type=int, default=5000)
+    parser.add_argument('--teams', type=int, default=30)
+    parser.add_argument('--workers', type=int, default=100)
+    parser.add_argument('--league', default='nba')
+    parser.add_argument('--lookahead-days', type=int, default=7)
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.WARNING)
+
+    teams = synthetic_teams(args.teams)
+    fixtures = synthetic_fixtures(teams, days=args.lookahead_days, games_per_day=args.teams // 2)
+    streams = synthetic_streams(fixtures, args.streams, prefix=args.league.upper(), noise_every=0)
+    create_temp_database(args.league, teams)
+
+    from epg import team_matcher as team_matcher_module
+
+    print(f"Synthetic group: {len(streams)} streams, {len(teams)} teams, {args.workers} workers")
+    print(f"{'mode':<12} {'total (s)':>10} {'per stream (ms)':>16} {'matched':>8} {'ESPN calls':>11}")
+
+    for label, runner in (('per-stream', run_per_stream), ('pooled', run_pooled)):
+        OfflineESPNClient.clear_all_caches()
+        team_matcher_module._shared_team_cache.clear()
+        espn = OfflineESPNClient(fixtures)
+
+        start = time.perf_counter()
+        matched = runner(espn, streams, args.league, args.workers, args.lookahead_days)
+        elapsed = time.perf_counter() - start
+
+        calls = sum(espn.request_counts.values())
+        print(f"{label:<12} {elapsed:>10.2f} {1000 * elapsed / len(streams):>16.3f} {matched:>8} {calls:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Benchmark: end-to-end EPG pipeline with replayed ESPN and Dispatcharr traffic
+
+Runs the same phases generate_all_epg does, at configurable scale:
+  team_epg      EPGOrchestrator.generate_epg for every team channel
+  team_xmltv    Stream teams.xml (after_team_epg_generation, includes a merge)
+  event_groups  refresh_event_group_core for every event group (GroupScheduler)
+  merge         merge_all_epgs into the final teamarr.xml
+
+HTTP is served by a ReplayTransport mounted on the real ESPN and
+Dispatcharr sessions (see benchmarks/replay.py), from synthetic fixtures
+or a recorded fixture file. Dispatcharr channel management is disabled.
+
+Reports wall time, per-phase time, peak allocations (tracemalloc) and
+request counts per endpoint. With --baseline the run fails (exit 1) when
+a phase is slower or allocates more than the baseline allows, or when
+any service makes more requests than the baseline.
+
+Usage:
+    python3 benchmarks/bench_pipeline.py --teams 30 --groups 6 --streams 500
+    python3 benchmarks/bench_pipeline.py --save-baseline benchmarks/baseline.json
+    python3 benchmarks/bench_pipeline.py --baseline benchmarks/baseline.json --tolerance 0.25
+    python3 benchmarks/bench_pipeline.py --league nba --record recorded.jsonl
+    python3 benchmarks/bench_pipeline.py --league nba --fixtures recorded.jsonl
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.replay import (  # noqa: E402
+    DISPATCHARR_URL, FixtureStore, RecordingTransport, ReplayTransport, SyntheticDispatcharr, SyntheticESPN,
+    install_transport
+)
+from benchmarks.synthetic import (  # noqa: E402
+    OfflineESPNClient, create_temp_database, synthetic_fixtures, synthetic_streams, synthetic_teams
+)
+
+PHASES = ('team_epg', 'team_xmltv', 'event_groups', 'merge')
+
+# Phases faster than this are not judged on relative time (timer noise dominates)
+MIN_JUDGED_SECONDS = 0.05
+
+# Token requests depend on worker timing (concurrent first requests may each
+# authenticate), so they are reported but not counted against the baseline
+UNGATED_ENDPOINT_PREFIX = '/api/accounts/token'
+
+
+class PhaseTimer:
+    """Wall time and peak traced allocation per phase"""
+
+    def __init__(self, trace_alloc: bool):
+        self.trace_alloc = trace_alloc
+        self.seconds: Dict[str, float] = {}
+        self.peak_kib: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        if self.trace_alloc:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = time.perf_counter() - start
+            if self.trace_alloc:
+                _, peak = tracemalloc.get_traced_memory()
+                self.peak_kib[name] = max(peak - base, 0) / 1024
+
+
+def setup_database(args, teams) -> str:
+    """Temp database with team channels, templates and event groups; returns the EPG output path"""
+    from database import create_event_epg_group, create_team, create_template, get_connection
+
+    create_temp_database(args.league, teams)
+
+    output_dir = tempfile.mkdtemp(prefix='teamarr-bench-epg-')
+    output_path = os.path.join(output_dir, 'teamarr.xml')
+
+    conn = get_connection()
+    try:
+        conn.execute(
+            """UPDATE settings SET epg_output_path = ?, epg_days_ahead = ?, dispatcharr_enabled = 0,
+                   dispatcharr_url = ?, dispatcharr_username = 'bench', dispatcharr_password = 'bench'
+               WHERE id = 1""",
+            (output_path, args.days, DISPATCHARR_URL)
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    team_template_id = create_template({
+        'name': 'Bench Team', 'template_type': 'team', 'sport': 'basketball', 'league': args.league,
+        'title_format': '{league} Basketball', 'subtitle_template': '{team_name} vs {opponent}',
+        'description_options': json.dumps([
+            {'template': '{team_name} host {opponent}', 'priority': 10, 'condition': 'is_home'},
+            {'template': '{team_name} at {opponent}', 'priority': 100},
+        ]),
+        'pregame_enabled': True, 'pregame_title': 'Pregame: {opponent.next}',
+        'postgame_enabled': True, 'postgame_title': 'Postgame: {opponent.last}',
+        'idle_enabled': True, 'idle_title': '{team_name} Programming',
+        'idle_description': 'Next: {opponent.next} on {game_date.next}',
+    })
+    for team in teams[:args.teams]:
+        create_team({
+            'espn_team_id': team['id'], 'league': args.league, 'sport': 'basketball',
+            'team_name': team['name'], 'team_abbrev': team['abbrev'],
+            'channel_id': f"bench.{team['id']}", 'template_id': team_template_id, 'active': 1,
+        })
+
+    event_template_id = create_template({
+        'name': 'Bench Event', 'template_type': 'event',
+        'title_format': '{away_team} @ {home_team}', 'description_template': '{matchup}'
+    })
+    for i in range(args.groups):
+        create_event_epg_group(
+            dispatcharr_group_id=i + 1, dispatcharr_account_id=1,
+            group_name=f"Provider {i} | {args.league.upper()}", assigned_league=args.league,
+            assigned_sport='basketball', event_template_id=event_template_id
+        )
+
+    return output_path
+
+
+def gated_counts_by_service(request_counts: Dict) -> Dict[str, int]:
+    """Requests per service, leaving out authentication endpoints"""
+    totals: Dict[str, int] = {}
+    for (service, endpoint), count in request_counts.items():
+        if not endpoint.startswith(UNGATED_ENDPOINT_PREFIX):
+            totals[service] = totals.get(service, 0) + count
+    return totals
+
+
+def run_once(args, output_path, teams_app, transports, trace_alloc: bool) -> dict:
+    """One pass over every phase with cold ESPN/matcher caches"""
+    from api.dispatcharr_client import M3UManager
+    from database import get_all_event_epg_groups, get_connection
+    from epg import team_matcher as team_matcher_module
+    from epg.epg_consolidator import after_team_epg_generation, clear_fragment_cache, merge_all_epgs
+    from epg.group_scheduler import GroupScheduler
+    from epg.matcher_pool import MatcherPool
+    from epg.orchestrator import EPGOrchestrator
+    from epg.xmltv_generator import XMLTVGenerator
+
+    OfflineESPNClient.clear_all_caches()
+    team_matcher_module._shared_team_cache.clear()
+    clear_fragment_cache()
+    for transport in transports:
+        transport.reset_counts()
+
+    conn = get_connection()
+    try:
+        settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
+    finally:
+        conn.close()
+
+    timer = PhaseTimer(trace_alloc)
+    wall_start = time.perf_counter()
+
+    with timer.phase('team_epg'):
+        result = EPGOrchestrator().generate_epg(
+            days_ahead=args.days, epg_timezone=settings.get('default_timezone', 'America/Detroit'),
+            settings=settings
+        )
+
+    with timer.phase('team_xmltv'):
+        after_team_epg_generation(
+            None, output_path,
+            write_xml=lambda f: XMLTVGenerator().write(result['teams_list'], result['all_events'], settings, f)
+        )
+
+    groups = get_all_event_epg_groups(enabled_only=True)
+    m3u_manager = M3UManager(DISPATCHARR_URL, 'bench', 'bench')
+    pool = MatcherPool(lookahead_days=settings.get('event_lookahead_days', 7))
+
+    def process(group):
+        return teams_app.refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=True, matcher_pool=pool)
+
+    with timer.phase('event_groups'):
+        group_results = GroupScheduler(groups, max_workers=args.workers).run(process)
+
+    with timer.phase('merge'):
+        merge_result = merge_all_epgs(output_path, cleanup=False)
+
+    request_counts = {}
+    for transport in transports:
+        for key, count in transport.request_counts.items():
+            request_counts[key] = request_counts.get(key, 0) + count
+
+    return {
+        'wall_seconds': time.perf_counter() - wall_start,
+        'phase_seconds': timer.seconds,
+        'phase_peak_kib': timer.peak_kib,
+        'requests': {f"{service}:{endpoint}": count for (service, endpoint), count in sorted(request_counts.items())},
+        'requests_by_service': gated_counts_by_service(request_counts),
+        'programmes': merge_result.get('programme_count', 0),
+        'groups_ok': sum(1 for _, r, _ in group_results if r and r.get('success')),
+        'streams_matched': sum((r or {}).get('matched_count', 0) for _, r, _ in group_results),
+    }
+
+
+def summarize(runs: List[dict]) -> dict:
+    """Median times/allocations across repeats; counts from the last run"""
+    summary = dict(runs[-1])
+    summary['wall_seconds'] = statistics.median(r['wall_seconds'] for r in runs)
+    summary['phase_seconds'] = {p: statistics.median(r['phase_seconds'][p] for r in runs) for p in PHASES}
+    if runs[-1]['phase_peak_kib']:
+        summary['phase_peak_kib'] = {p: statistics.median(r['phase_peak_kib'][p] for r in runs) for p in PHASES}
+    return summary
+
+
+def report(summary: dict):
+    print(f"{'phase':<14} {'wall (s)':>9} {'peak alloc (KiB)':>17}")
+    for phase in PHASES:
+        peak = summary['phase_peak_kib'].get(phase)
+        peak_text = f"{peak:>17.0f}" if peak is not None else f"{'-':>17}"
+        print(f"{phase:<14} {summary['phase_seconds'][phase]:>9.3f} {peak_text}")
+    print(f"{'total':<14} {summary['wall_seconds']:>9.3f}")
+    print()
+    print(f"programmes: {summary['programmes']}, groups ok: {summary['groups_ok']}, "
+          f"streams matched: {summary['streams_matched']}")
+    print("requests: " + ', '.join(f"{k}={v}" for k, v in summary['requests'].items()))
+
+
+def compare_to_baseline(summary: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Regressions of this run against a stored baseline summary"""
+    regressions = []
+    allowed = 1 + tolerance
+
+    for phase in PHASES:
+        base_s = baseline['phase_seconds'].get(phase)
+        now_s = summary['phase_seconds'][phase]
+        if base_s is not None and now_s > base_s * allowed and now_s - base_s > MIN_JUDGED_SECONDS:
+            regressions.append(f"{phase}: {now_s:.3f}s vs baseline {base_s:.3f}s")
+
+        base_kib = baseline.get('phase_peak_kib', {}).get(phase)
+        now_kib = summary['phase_peak_kib'].get(phase)
+        if base_kib is not None and now_kib is not None and now_kib > base_kib * allowed and now_kib - base_kib > 1024:
+            regressions.append(f"{phase}: peak {now_kib:.0f} KiB vs baseline {base_kib:.0f} KiB")
+
+    for service, base_count in baseline.get('requests_by_service', {}).items():
+        now_count = summary['requests_by_service'].get(service, 0)
+        if now_count > base_count:
+            regressions.append(f"{service} requests: {now_count} vs baseline {base_count}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--teams', type=int, default=30, help='team channels')
+    parser.add_argument('--league-teams', type=int, default=30, help='teams in the synthetic league')
+    parser.add_argument('--groups', type=int, default=6, help='event groups')
+    parser.add_argument('--streams', type=int, default=500, help='streams per event group')
+    parser.add_argument('--days', type=int, default=14, help='EPG days ahead')
+    parser.add_argument('--workers', type=int, default=4, help='event groups processed at once')
+    parser.add_argument('--league', default='nba')
+    parser.add_argument('--espn-latency', type=float, default=0.0, help='seconds per ESPN request')
+    parser.add_argument('--dispatcharr-latency', type=float, default=0.0, help='seconds per Dispatcharr request')
+    parser.add_argument('--fixtures', help='recorded fixture file (JSON Lines) served before synthetic data')
+    parser.add_argument('--record', help='fetch ESPN from the network and record responses to this file')
+    parser.add_argument('--repeat', type=int, default=1, help='runs to take the median of')
+    parser.add_argument('--no-alloc', action='store_true', help='skip tracemalloc (faster, no allocation figures)')
+    parser.add_argument('--save-baseline', help='write this run as a baseline JSON file')
+    parser.add_argument('--baseline', help='fail if this run regresses against a baseline JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown/growth')
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.WARNING)
+
+    teams = synthetic_teams(max(args.league_teams, args.teams))
+    fixtures = synthetic_fixtures(teams, days=args.days, games_per_day=len(teams) // 2)
+    output_path = setup_database(args, teams)
+
+    streams_by_group = {
+        f"Provider {i} | {args.league.upper()}": synthetic_streams(fixtures, args.streams, prefix=args.league.upper())
+        for i in range(args.groups)
+    }
+    transport = ReplayTransport(
+        fixtures=FixtureStore.load(args.fixtures) if args.fixtures else None,
+        responders=[SyntheticESPN(fixtures), SyntheticDispatcharr(streams_by_group)],
+        latency={'espn': args.espn_latency, 'dispatcharr': args.dispatcharr_latency},
+    )
+    install_transport(transport)
+    transports = [transport]
+
+    if args.record:
+        # Real ESPN traffic through a recording pass-through; Dispatcharr stays synthetic
+        from api.espn_client import _get_espn_session
+        recorder = RecordingTransport(args.record)
+        _get_espn_session().mount('https://', recorder)
+        _get_espn_session().mount('http://', recorder)
+        transports.append(recorder)
+
+    # Importing app initializes Flask and runs migrations against the temp database
+    import contextlib
+    import io
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app as teams_app
+    from api.espn_client import ESPNClient
+    # Keep runs repeatable - never read or write the on-disk ESPN response cache
+    ESPNClient.persistent_cache = False
+
+    trace_alloc = not args.no_alloc
+    if trace_alloc:
+        tracemalloc.start()
+
+    print(f"Pipeline: {args.teams} team channels, {args.groups} event groups x {args.streams} streams, "
+          f"{args.days} days" + (f", fixtures {args.fixtures}" if args.fixtures else ''))
+    runs = [run_once(args, output_path, teams_app, transports, trace_alloc) for _ in range(args.repeat)]
+    summary = summarize(runs)
+    summary['config'] = {k: getattr(args, k) for k in (
+        'teams', 'league_teams', 'groups', 'streams', 'days', 'workers', 'league', 'fixtures', 'no_alloc'
+    )}
+    report(summary)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('config') != summary['config']:
+            print("\nWarning: baseline was recorded with a different configuration")
+        regressions = compare_to_baseline(summary, baseline, args.tolerance)
+        if regressions:
+            print(f"\nRegressions (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,366 @@
+"""
+HTTP transport replay for offline benchmarks
+
+Serves ESPN and Dispatcharr responses through a requests transport adapter
+mounted on the shared sessions the clients already use
+(api.espn_client._get_espn_session() and DispatcharrAuth._http_sessions),
+so ESPNClient, DispatcharrAuth, M3UManager and everything above them run
+their production code paths - only the socket is replaced.
+
+Responses come from, in order:
+  1. A recorded fixture file (JSON Lines, see FixtureStore)
+  2. Synthetic responders (SyntheticESPN / SyntheticDispatcharr)
+  3. An empty 200 response, so clients don't sit in retry back-off
+
+Recording: RecordingTransport passes requests through to the network and
+appends every response to a fixture file. Scoreboard dates are recorded
+relative to the recording day and ESPN dates are shifted on replay, so a
+recording keeps working on later days.
+
+Usage:
+    transport = ReplayTransport(
+        fixtures=FixtureStore.load('fixtures.jsonl'),
+        responders=[SyntheticESPN(fixtures), SyntheticDispatcharr(streams_by_group)],
+    )
+    install_transport(transport, dispatcharr_url=DISPATCHARR_URL)
+    ...
+    transport.request_counts   # {('espn', 'scoreboard'): 14, ('dispatcharr', '/api/channels/streams/'): 40}
+"""
+
+import json
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from benchmarks.synthetic import scoreboard_payload
+
+# Base URL the benchmark's Dispatcharr settings point at (never resolved)
+DISPATCHARR_URL = 'http://dispatcharr.bench'
+
+# Responder: (method, url parts, JSON body or None) -> (status, JSON) or None to pass
+Responder = Callable[[str, Any, Optional[Any]], Optional[Tuple[int, Any]]]
+
+# ISO dates inside recorded ESPN bodies ("2025-11-26T22:00Z") and scoreboard ?dates=
+_ISO_DATE_RE = re.compile(r'"(\d{4})-(\d{2})-(\d{2})T')
+_DATES_PARAM_RE = re.compile(r'^\d{8}$')
+
+
+def service_for(host: str) -> str:
+    """Label used in request counts: 'espn' or 'dispatcharr'"""
+    return 'espn' if 'espn.com' in host else 'dispatcharr'
+
+
+def endpoint_for(parts) -> str:
+    """Short endpoint label for request counts"""
+    if service_for(parts.netloc) == 'dispatcharr':
+        return parts.path
+    segments = [s for s in parts.path.split('/') if s]
+    last = segments[-1] if segments else ''
+    if last in ('scoreboard', 'schedule', 'roster', 'summary', 'standings', 'groups', 'teams'):
+        return last
+    if len(segments) >= 2 and segments[-2] == 'teams':
+        return 'team'
+    return 'other'
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+class FixtureStore:
+    """
+    Recorded responses keyed by method + normalized URL.
+
+    File format (JSON Lines): a header line {"recorded_on": "YYYY-MM-DD"}
+    followed by one {"method", "url", "status", "body"} object per response.
+    Scoreboard ?dates= are stored as offsets from recorded_on; ESPN body
+    dates are shifted by the days since recorded_on when served.
+    """
+
+    def __init__(self, recorded_on: date = None):
+        self.recorded_on = recorded_on or date.today()
+        self.responses: Dict[str, Tuple[int, Any]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'FixtureStore':
+        store = cls()
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if 'recorded_on' in entry:
+                    store.recorded_on = date.fromisoformat(entry['recorded_on'])
+                    continue
+                store.responses[f"{entry['method']} {entry['url']}"] = (entry['status'], entry['body'])
+        return store
+
+    def lookup(self, method: str, url: str) -> Optional[Tuple[int, Any]]:
+        """Recorded (status, body) for a live request URL, with dates shifted to today"""
+        entry = self.responses.get(f"{method} {relative_url(url, date.today())}")
+        if entry is None:
+            return None
+        status, body = entry
+        if service_for(urlsplit(url).netloc) == 'espn':
+            body = shift_dates(body, (date.today() - self.recorded_on).days)
+        return status, body
+
+
+def relative_url(url: str, today: date) -> str:
+    """URL with sorted query and ESPN ?dates=YYYYMMDD rewritten as day offsets (e.g. 'd+1')"""
+    parts = urlsplit(url)
+    query = []
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        if key == 'dates' and _DATES_PARAM_RE.match(value):
+            offset = (datetime.strptime(value, '%Y%m%d').date() - today).days
+            value = f"d{offset:+d}"
+        query.append((key, value))
+    normalized = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    return normalized + ('?' + urlencode(sorted(query)) if query else '')
+
+
+def shift_dates(body: Any, days: int) -> Any:
+    """Shift every ISO date string in a JSON body by `days`"""
+    if not days or body is None:
+        return body
+
+    def shift(match):
+        shifted = date(int(match[1]), int(match[2]), int(match[3])) + timedelta(days=days)
+        return f'"{shifted.isoformat()}T'
+
+    return json.loads(_ISO_DATE_RE.sub(shift, json.dumps(body)))
+
+
+# =============================================================================
+# TRANSPORTS
+# =============================================================================
+
+def _build_response(request, status: int, body: Any) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode('utf-8') if body is not None else b''
+    response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+    response.encoding = 'utf-8'
+    response.url = request.url
+    response.request = request
+    response.reason = 'OK' if status < 400 else 'Error'
+    return response
+
+
+class _CountingMixin:
+    """Per (service, endpoint) request counters shared by both transports"""
+
+    def _init_counts(self):
+        self.request_counts: Dict[Tuple[str, str], int] = {}
+        self._count_lock = threading.Lock()
+
+    def _count(self, parts):
+        key = (service_for(parts.netloc), endpoint_for(parts))
+        with self._count_lock:
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def reset_counts(self):
+        with self._count_lock:
+            self.request_counts.clear()
+
+    def counts_by_service(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for (service, _), count in self.request_counts.items():
+            totals[service] = totals.get(service, 0) + count
+        return totals
+
+
+class ReplayTransport(_CountingMixin, BaseAdapter):
+    """Transport adapter that answers every request locally"""
+
+    def __init__(self, fixtures: FixtureStore = None, responders: List[Responder] = None,
+                 latency: Dict[str, float] = None):
+        super().__init__()
+        self._init_counts()
+        self.fixtures = fixtures
+        self.responders = responders or []
+        self.latency = latency or {}
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        parts = urlsplit(request.url)
+        self._count(parts)
+
+        delay = self.latency.get(service_for(parts.netloc), 0)
+        if delay:
+            time.sleep(delay)
+
+        result = self.fixtures.lookup(request.method, request.url) if self.fixtures else None
+        if result is None:
+            body = json.loads(request.body) if request.body else None
+            for responder in self.responders:
+                result = responder(request.method, parts, body)
+                if result is not None:
+                    break
+        if result is None:
+            result = (200, {})
+
+        return _build_response(request, *result)
+
+    def close(self):
+        pass
+
+
+class RecordingTransport(_CountingMixin, HTTPAdapter):
+    """Pass-through transport that appends every JSON response to a fixture file"""
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self._init_counts()
+        self.path = path
+        self._write_lock = threading.Lock()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'recorded_on': date.today().isoformat()}) + '\n')
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        parts = urlsplit(request.url)
+        self._count(parts)
+
+        try:
+            body = response.json() if response.content else None
+        except ValueError:
+            return response
+
+        # Never write credentials into fixtures
+        if '/api/accounts/token' in parts.path:
+            body = {'access': 'replay', 'refresh': 'replay'}
+
+        url = relative_url(request.url, date.today())
+
+        with self._write_lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    'method': request.method, 'url': url,
+                    'status': response.status_code, 'body': body
+                }) + '\n')
+        return response
+
+
+def install_transport(transport: BaseAdapter, dispatcharr_url: str = DISPATCHARR_URL):
+    """
+    Mount a transport on the ESPN and Dispatcharr HTTP sessions.
+
+    Both clients keep one module/class-level session, so every client
+    instance created afterwards uses the transport as well.
+    """
+    from api.espn_client import _get_espn_session
+    from api.dispatcharr_client import DispatcharrAuth
+
+    espn_session = _get_espn_session()
+    espn_session.mount('https://', transport)
+    espn_session.mount('http://', transport)
+
+    # Creating an auth handler initializes the per-URL session it will share
+    DispatcharrAuth(dispatcharr_url, 'bench', 'bench')
+    dispatcharr_session = DispatcharrAuth._http_sessions[dispatcharr_url.rstrip('/')]
+    dispatcharr_session.mount('https://', transport)
+    dispatcharr_session.mount('http://', transport)
+
+
+# =============================================================================
+# SYNTHETIC RESPONDERS
+# =============================================================================
+
+class SyntheticESPN:
+    """ESPN responder backed by synthetic_fixtures() (same data as OfflineESPNClient)"""
+
+    def __init__(self, fixtures: List[Tuple[Dict, Dict, datetime]]):
+        self.fixtures = fixtures
+        self.teams: Dict[str, Dict] = {}
+        for away, home, _ in fixtures:
+            self.teams[away['id']] = away
+            self.teams[home['id']] = home
+
+    def __call__(self, method, parts, body):
+        if service_for(parts.netloc) != 'espn':
+            return None
+
+        segments = [s for s in parts.path.split('/') if s]
+        endpoint = endpoint_for(parts)
+
+        if endpoint == 'scoreboard':
+            query = dict(parse_qsl(parts.query))
+            date_str = query.get('dates', datetime.now().strftime('%Y%m%d'))[:8]
+            return 200, scoreboard_payload(self.fixtures, date_str)
+
+        if endpoint == 'schedule':
+            team_id = segments[-2]
+            dates = sorted({start.strftime('%Y%m%d') for _, _, start in self.fixtures})
+            events = [
+                event
+                for date_str in dates
+                for event in scoreboard_payload(self.fixtures, date_str)['events']
+                if any(c['team']['id'] == team_id for c in event['competitions'][0]['competitors'])
+            ]
+            return 200, {'events': events}
+
+        if endpoint == 'team':
+            team = self.teams.get(segments[-1])
+            if not team:
+                return 404, {}
+            return 200, {'team': {
+                'id': team['id'], 'displayName': team['name'], 'name': team['short_name'],
+                'abbreviation': team['abbrev'], 'shortDisplayName': team['short_name'], 'logos': [],
+            }}
+
+        if endpoint == 'teams':
+            return 200, {'sports': [{'leagues': [{'teams': [
+                {'team': {'id': t['id'], 'displayName': t['name'], 'abbreviation': t['abbrev'],
+                          'shortDisplayName': t['short_name']}}
+                for t in self.teams.values()
+            ]}]}]}
+
+        return None
+
+
+class SyntheticDispatcharr:
+    """Dispatcharr responder: token auth, channel groups, M3U accounts and paginated streams"""
+
+    def __init__(self, streams_by_group: Dict[str, List[Dict]], base_url: str = DISPATCHARR_URL):
+        self.streams_by_group = streams_by_group
+        self.base_url = base_url.rstrip('/')
+
+    def __call__(self, method, parts, body):
+        if service_for(parts.netloc) != 'dispatcharr':
+            return None
+
+        path = parts.path
+        if path.startswith('/api/accounts/token'):
+            return 200, {'access': 'bench-access', 'refresh': 'bench-refresh'}
+
+        if path == '/api/channels/groups/':
+            return 200, [
+                {'id': i + 1, 'name': name, 'm3u_accounts': [{'m3u_account': 1}]}
+                for i, name in enumerate(self.streams_by_group)
+            ]
+
+        if path == '/api/m3u/accounts/':
+            return 200, [{'id': 1, 'name': 'Bench M3U', 'status': 'success',
+                          'updated_at': datetime.now().isoformat()}]
+
+        if path == '/api/channels/streams/':
+            query = dict(parse_qsl(parts.query))
+            streams = self.streams_by_group.get(query.get('channel_group_name'), [])
+            page_size = int(query.get('page_size', 1000))
+            page = int(query.get('page', 1))
+            start = (page - 1) * page_size
+            next_url = None
+            if start + page_size < len(streams):
+                next_url = f"{self.base_url}{path}?{urlencode({**query, 'page': page + 1})}"
+            return 200, {'count': len(streams), 'next': next_url,
+                         'results': streams[start:start + page_size]}
+
+        return None
@@ -0,0 +1,217 @@
+"""
+Synthetic fixtures for offline benchmarks
+
+Builds a throwaway SQLite database, a synthetic league of teams, ESPN-shaped
+scoreboard responses and Dispatcharr-shaped stream lists so the EPG pipeline
+can be exercised without network access.
+
+Nothing here touches the real data directory: the database lives in a temp
+directory and database.DB_PATH is pointed at it for the lifetime of the run.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+# Allow running benchmarks from the repo root without installing anything
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from api.espn_client import ESPNClient  # noqa: E402
+
+CITIES = [
+    'Avalon', 'Brookfield', 'Cedar Falls', 'Dunmore', 'Eastport', 'Fairhaven',
+    'Glenrock', 'Harborview', 'Ironwood', 'Juniper', 'Kingsbridge', 'Lakemont',
+    'Millbrook', 'Northgate', 'Oakridge', 'Pinecrest', 'Queensport', 'Riverton',
+    'Stonebridge', 'Timberline', 'Union City', 'Valemont', 'Westfield', 'Yorkton',
+]
+
+NICKNAMES = [
+    'Anchors', 'Bison', 'Comets', 'Dragons', 'Eagles', 'Foxes', 'Giants', 'Hornets',
+    'Ibis', 'Jaguars', 'Knights', 'Lynx', 'Mariners', 'Nighthawks', 'Otters',
+    'Pioneers', 'Quakes', 'Ravens', 'Stallions', 'Titans', 'Unicorns', 'Vipers',
+    'Wolves', 'Yetis',
+]
+
+
+def synthetic_teams(count: int, id_offset: int = 1000) -> List[Dict]:
+    """
+    Build `count` teams with unique, non-overlapping names.
+
+    Returns:
+        List of dicts with id, name, abbrev, short_name
+    """
+    teams = []
+    for i in range(count):
+        city = CITIES[i % len(CITIES)]
+        nickname = NICKNAMES[(i // len(CITIES)) % len(NICKNAMES)]
+        suffix = '' if i < len(CITIES) * len(NICKNAMES) else f' {i}'
+        name = f"{city} {nickname}{suffix}"
+        abbrev = (city[:2] + nickname[:2]).upper() + (str(i) if suffix else '')
+        teams.append({
+            'id': str(id_offset + i),
+            'name': name,
+            'abbrev': abbrev,
+            'short_name': nickname + suffix,
+        })
+    return teams
+
+
+def synthetic_fixtures(teams: List[Dict], days: int, games_per_day: int) -> List[Tuple[Dict, Dict, datetime]]:
+    """
+    Pair teams into (away, home, start_utc) fixtures spread over `days` days.
+
+    Each team plays at most once per day, starting today 23:30 UTC.
+    """
+    base = datetime.now(timezone.utc).replace(hour=23, minute=30, second=0, microsecond=0)
+    fixtures = []
+    n = len(teams)
+    for day in range(days):
+        start = base + timedelta(days=day)
+        # Rotate pairings per day so every day has distinct matchups
+        order = teams[day % n:] + teams[:day % n]
+        for g in range(min(games_per_day, n // 2)):
+            away, home = order[2 * g], order[2 * g + 1]
+            fixtures.append((away, home, start))
+    return fixtures
+
+
+def scoreboard_payload(fixtures: List[Tuple[Dict, Dict, datetime]], date_str: str) -> Dict:
+    """ESPN scoreboard JSON for one YYYYMMDD date."""
+    events = []
+    for idx, (away, home, start) in enumerate(fixtures):
+        if start.strftime('%Y%m%d') != date_str:
+            continue
+        event_id = f"40{start.strftime('%m%d')}{idx:04d}"
+        events.append({
+            'id': event_id,
+            'date': start.strftime('%Y-%m-%dT%H:%MZ'),
+            'name': f"{away['name']} at {home['name']}",
+            'shortName': f"{away['abbrev']} @ {home['abbrev']}",
+            'competitions': [{
+                'id': event_id,
+                'date': start.strftime('%Y-%m-%dT%H:%MZ'),
+                'status': {'type': {'name': 'STATUS_SCHEDULED', 'state': 'pre', 'completed': False}},
+                'competitors': [
+                    {'homeAway': 'home', 'team': {
+                        'id': home['id'], 'displayName': home['name'],
+                        'abbreviation': home['abbrev'], 'shortDisplayName': home['short_name']}},
+                    {'homeAway': 'away', 'team': {
+                        'id': away['id'], 'displayName': away['name'],
+                        'abbreviation': away['abbrev'], 'shortDisplayName': away['short_name']}},
+                ],
+                'venue': {'fullName': f"{home['name']} Arena"},
+                'broadcasts': [],
+            }],
+        })
+    return {'events': events}
+
+
+def synthetic_streams(fixtures: List[Tuple[Dict, Dict, datetime]], count: int,
+                      prefix: str = 'NBA', noise_every: int = 10) -> List[Dict]:
+    """
+    Dispatcharr-shaped stream dicts whose names reference the fixtures.
+
+    Every `noise_every`-th stream is a non-game stream (studio show) so
+    filters see a realistic mix.
+    """
+    streams = []
+    for i in range(count):
+        if noise_every and i % noise_every == noise_every - 1:
+            name = f"{prefix} {i:04d} | {prefix} Tonight Studio Show"
+        else:
+            away, home, start = fixtures[i % len(fixtures)]
+            local = start - timedelta(hours=5)
+            name = f"{prefix} {i:04d} | {away['name']} @ {home['name']} {local.strftime('%I:%M %p')} ET"
+        streams.append({'id': 100000 + i, 'name': name, 'm3u_account': 1})
+    return streams
+
+
+class OfflineESPNClient(ESPNClient):
+    """
+    ESPNClient that answers from synthetic fixtures instead of the network.
+
+    Only the transport (_make_request) is replaced, so all caching and
+    parsing in ESPNClient runs exactly as in production. Request counts
+    are tallied per endpoint for reporting.
+    """
+
+    # Keep runs offline and repeatable - never read or write the on-disk response cache
+    persistent_cache = False
+
+    def __init__(self, fixtures: List[Tuple[Dict, Dict, datetime]], latency: float = 0.0):
+        super().__init__()
+        self.fixtures = fixtures
+        self.latency = latency
+        self.request_counts: Dict[str, int] = {}
+        self._count_lock = threading.Lock()
+
+    def _count(self, endpoint: str):
+        with self._count_lock:
+            self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+
+    def _make_request(self, url: str) -> Optional[Dict]:
+        if self.latency:
+            import time
+            time.sleep(self.latency)
+
+        if '/scoreboard' in url:
+            self._count('scoreboard')
+            date_str = url.split('dates=')[1][:8] if 'dates=' in url else datetime.now().strftime('%Y%m%d')
+            return scoreboard_payload(self.fixtures, date_str)
+        if '/schedule' in url:
+            self._count('schedule')
+            return {'events': []}
+        if '/summary' in url:
+            self._count('summary')
+            return None
+        self._count('other')
+        return None
+
+    @staticmethod
+    def clear_all_caches():
+        """Reset ESPNClient's class-level caches between benchmark runs."""
+        ESPNClient._scoreboard_cache.clear()
+        ESPNClient._scoreboard_index_cache.clear()
+        ESPNClient._schedule_cache.clear()
+        ESPNClient._team_info_cache.clear()
+        ESPNClient._roster_cache.clear()
+        ESPNClient._group_cache.clear()
+
+
+def create_temp_database(league: str, teams: List[Dict], sport: str = 'basketball') -> str:
+    """
+    Create a fresh Teamarr database in a temp dir and point database.DB_PATH at it.
+
+    The league's teams are loaded into team_league_cache so TeamMatcher never
+    falls back to the ESPN teams endpoint.
+
+    Returns:
+        Path to the temporary database file
+    """
+    import contextlib
+    import io
+    import database
+
+    db_dir = tempfile.mkdtemp(prefix='teamarr-bench-')
+    database.DB_PATH = os.path.join(db_dir, 'teamarr.db')
+
+    # init_database() prints progress - keep benchmark output clean
+    with contextlib.redirect_stdout(io.StringIO()):
+        database.init_database()
+
+    # Saved the way TeamLeagueCache.refresh_cache saves them (with precomputed search names)
+    from epg.team_league_cache import TeamLeagueCache
+    TeamLeagueCache._save_cache([
+        {
+            'league_code': league, 'espn_team_id': t['id'], 'team_name': t['name'],
+            'team_abbrev': t['abbrev'], 'team_short_name': t['short_name'], 'sport': sport,
+        }
+        for t in teams
+    ])
+
+    return database.DB_PATH
@@ -3,6 +3,8 @@ import sqlite3
 import os
 import json
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -42,11 +44,281 @@ def get_db_path():
 
 DB_PATH = get_db_path()
 
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+# Connections are reused instead of opened on every get_connection() call.
+# Callers keep the usual "conn = get_connection() ... conn.close()" pattern:
+# close() rolls back anything uncommitted and hands the connection back.
+
+# Threads that may hold pooled connections at once (others wait in acquire)
+POOL_MAX_OPEN = 32
+
+# How long a thread waits for a free slot before acquire gives up with an
+# error (slots held this long usually mean connections missing a close())
+POOL_SLOT_TIMEOUT_SECONDS = 60
+
+# Idle connections kept for reuse (extra connections are closed on release)
+POOL_MAX_IDLE = 32
+
+# How long a statement waits on a locked database before failing
+BUSY_TIMEOUT_SECONDS = 5
+
+# Prepared statements cached per connection
+STATEMENT_CACHE_SIZE = 256
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() returns it to the pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_path = None
+        self.pool_state = 'in_use'  # in_use | idle | closed
+        self.pool_holder = None     # Per-thread holder state of the acquiring thread
+
+    def close(self):
+        _pool.release(self)
+
+    def close_for_real(self):
+        """Close the underlying SQLite connection."""
+        self.pool_state = 'closed'
+        super().close()
+
+
+class ConnectionPool:
+    """
+    Pool of SQLite connections shared by all threads.
+
+    New connections use WAL journaling (readers don't block the writer),
+    synchronous=NORMAL, a busy timeout and a larger prepared statement cache.
+
+    At most max_open threads hold connections at once; a thread's first
+    connection waits for a slot, further (nested) connections of the same
+    thread don't, so helpers that open a connection while their caller holds
+    one can't deadlock. A thread that waits longer than slot_timeout gets an
+    sqlite3.OperationalError instead of blocking forever. At most max_idle
+    connections are kept once released.
+    """
+
+    def __init__(self, max_open: int = POOL_MAX_OPEN, max_idle: int = POOL_MAX_IDLE,
+                 slot_timeout: float = POOL_SLOT_TIMEOUT_SECONDS):
+        self.max_open = max_open
+        self.max_idle = max_idle
+        self.slot_timeout = slot_timeout
+        self._idle: List[PooledConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_open)
+        self._holders = threading.local()
+        self._wal_paths = set()
+        self._stats = {
+            'acquired': 0,
+            'reused': 0,
+            'created': 0,
+            'closed': 0,
+            'in_use': 0,
+            'peak_in_use': 0,
+            'slot_waits': 0,
+            'slot_wait_seconds': 0.0,
+            'slot_timeouts': 0,
+            'match_cache_lock_errors': 0,
+            'match_cache_lock_wait_seconds': 0.0,
+        }
+
+    def _connect(self, path: str) -> PooledConnection:
+        conn = sqlite3.connect(
+            path,
+            timeout=BUSY_TIMEOUT_SECONDS,
+            factory=PooledConnection,
+            check_same_thread=False,  # Released connections are reused by other threads
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.pool_path = path
+
+        # journal_mode is persistent - only needs setting once per database file
+        with self._lock:
+            needs_wal = path not in self._wal_paths
+            self._wal_paths.add(path)
+        if needs_wal:
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.DatabaseError as e:
+                logger.warning(f"Could not enable WAL mode for {path}: {e}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _take_slot(self):
+        """Reserve a connection slot for the calling thread (nested calls share it)."""
+        holder = getattr(self._holders, 'state', None)
+        if holder is None:
+            holder = self._holders.state = {'held': 0}
+
+        with self._lock:
+            if holder['held'] > 0:
+                holder['held'] += 1
+                return holder
+
+        if not self._slots.acquire(blocking=False):
+            started = time.perf_counter()
+            acquired = self._slots.acquire(timeout=self.slot_timeout)
+            with self._lock:
+                self._stats['slot_waits'] += 1
+                self._stats['slot_wait_seconds'] += time.perf_counter() - started
+                if not acquired:
+                    self._stats['slot_timeouts'] += 1
+            if not acquired:
+                raise sqlite3.OperationalError(
+                    f"No database connection slot free after {self.slot_timeout}s "
+                    f"({self.max_open} threads hold connections)"
+                )
+
+        with self._lock:
+            holder['held'] += 1
+        return holder
+
+    def _give_slot(self, holder):
+        """Drop one connection of a holder, freeing its slot after the last one."""
+        with self._lock:
+            holder['held'] -= 1
+            last = holder['held'] == 0
+        if last:
+            self._slots.release()
+
+    def acquire(self, path: str) -> PooledConnection:
+        """Get an idle connection for path, or open a new one (waits for a free slot)."""
+        holder = self._take_slot()
+        try:
+            conn = self._acquire(path)
+        except Exception:
+            self._give_slot(holder)
+            raise
+        conn.pool_holder = holder
+        return conn
+
+    def _acquire(self, path: str) -> PooledConnection:
+        conn = None
+        stale = []
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.pool_path == path:
+                    conn = candidate
+                    break
+                stale.append(candidate)  # DB_PATH changed since it was pooled
+
+            self._stats['acquired'] += 1
+            if conn is not None:
+                self._stats['reused'] += 1
+            self._stats['in_use'] += 1
+            self._stats['peak_in_use'] = max(self._stats['peak_in_use'], self._stats['in_use'])
+
+        for candidate in stale:
+            self._discard(candidate)
+
+        if conn is None:
+            try:
+                conn = self._connect(path)
+            except Exception:
+                with self._lock:
+                    self._stats['in_use'] -= 1
+                raise
+            with self._lock:
+                self._stats['created'] += 1
+
+        conn.row_factory = sqlite3.Row
+        conn.pool_state = 'in_use'
+        return conn
+
+    def release(self, conn: PooledConnection):
+        """Return a connection to the pool (called by conn.close())."""
+        with self._lock:
+            if conn.pool_state != 'in_use':
+                return  # Already released or closed
+            conn.pool_state = 'idle'
+            self._stats['in_use'] -= 1
+            holder, conn.pool_holder = conn.pool_holder, None
+
+        if holder is not None:
+            self._give_slot(holder)
+
+        try:
+            # Same outcome as closing: uncommitted changes are discarded
+            if conn.in_transaction:
+                conn.rollback()
+            # Callers may raise it for their own work (stream match cache);
+            # the next holder gets the default again
+            conn.execute(f"PRAGMA busy_timeout = {int(BUSY_TIMEOUT_SECONDS * 1000)}")
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+
+        with self._lock:
+            if conn.pool_path == DB_PATH and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+
+        self._discard(conn)
+
+    def _discard(self, conn: PooledConnection):
+        try:
+            conn.close_for_real()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._stats['closed'] += 1
+
+    def close_all(self):
+        """Close every idle connection (in-use ones are closed when released)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._wal_paths.clear()
+        for conn in idle:
+            self._discard(conn)
+
+    def record_match_cache_lock_wait(self, seconds: float):
+        """
+        Record time the stream match cache lost to a 'database is locked'
+        error (including retry back-off). Busy-timeout waits of other
+        statements aren't measured.
+        """
+        with self._lock:
+            self._stats['match_cache_lock_errors'] += 1
+            self._stats['match_cache_lock_wait_seconds'] += seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool utilization, slot wait and match cache lock wait counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['idle'] = len(self._idle)
+        stats['max_open'] = self.max_open
+        stats['max_idle'] = self.max_idle
+        stats['slot_wait_seconds'] = round(stats['slot_wait_seconds'], 3)
+        stats['match_cache_lock_wait_seconds'] = round(stats['match_cache_lock_wait_seconds'], 3)
+        stats['reuse_ratio'] = round(stats['reused'] / stats['acquired'], 3) if stats['acquired'] else 0.0
+        return stats
+
+
+_pool = ConnectionPool()
+
+
 def get_connection():
     """Get database connection with row factory for dict-like access"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    return _pool.acquire(DB_PATH)
+
+
+def close_all_connections():
+    """Close pooled connections (e.g. before the database file is replaced)."""
+    _pool.close_all()
+
+
+def record_match_cache_lock_wait(seconds: float):
+    """Report time the stream match cache spent on a locked database to the pool metrics."""
+    _pool.record_match_cache_lock_wait(seconds)
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Connection pool utilization, slot waits and match cache lock waits."""
+    return _pool.get_stats()
 
 
 # =============================================================================
@@ -336,7 +608,7 @@ def get_league_alias(slug: str) -> str:
 #   23: Stream fingerprint cache for EPG generation optimization
 # =============================================================================
 
-CURRENT_SCHEMA_VERSION = 24
+CURRENT_SCHEMA_VERSION = 26
 
 
 def get_schema_version(conn) -> int:
@@ -1669,6 +1941,59 @@ def run_migrations(conn):
             print(f"    ⚠️ Migration 24 error: {e}")
             conn.rollback()
 
+    # =========================================================================
+    # 25. Persistent ESPN Response Cache
+    # =========================================================================
+    # ESPN responses kept across generations/restarts (api/response_cache.py).
+    # Bounded by total body size with LRU eviction on last_access.
+    if current_version < 25:
+        print("  🔄 Migration 25: Creating ESPN response cache table...")
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS espn_response_cache (
+                    url TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL,
+                    last_access REAL NOT NULL,
+                    size_bytes INTEGER NOT NULL
+                )
+            """)
+
+            # Index for LRU eviction
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_erc_last_access
+                ON espn_response_cache(last_access)
+            """)
+
+            conn.commit()
+            migrations_run += 1
+            print("    ✅ Migration 25 complete: espn_response_cache table")
+        except Exception as e:
+            print(f"    ⚠️ Migration 25 error: {e}")
+            conn.rollback()
+
+    # =========================================================================
+    # 26. Precomputed team search names
+    # =========================================================================
+    # Normalized primary/secondary names built once by TeamLeagueCache.refresh_cache
+    # (JSON [version, [primary...], [secondary...]], see epg.team_matcher
+    # SEARCH_NAMES_VERSION). NULL until the next refresh; TeamMatcher rebuilds
+    # NULL or other-version names on load and writes them back.
+    if current_version < 26:
+        print("  🔄 Running migration 26: Add team_league_cache.search_names column")
+
+        add_columns_if_missing('team_league_cache', [
+            ('search_names', 'TEXT'),
+        ])
+
+        conn.commit()
+        migrations_run += 1
+        print("    ✅ Migration 26 complete: Added precomputed team search names")
+
     # =========================================================================
     # REPAIR: Ensure critical columns exist (catches failed migrations)
     # =========================================================================
@@ -1764,9 +2089,14 @@ def init_database():
 
 def reset_database():
     """Drop all tables and reinitialize (for development)"""
+    close_all_connections()
     if os.path.exists(DB_PATH):
         os.remove(DB_PATH)
         print(f"🗑️  Removed existing database at {DB_PATH}")
+    # WAL sidecar files belong to the removed database
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(DB_PATH + suffix):
+            os.remove(DB_PATH + suffix)
     init_database()
 
 # =============================================================================
@@ -3012,6 +3342,10 @@ def get_next_available_channel_range(dispatcharr_url: str = None, dispatcharr_us
         conn.close()
 
 
+# Guards auto-assignment of channel ranges (see get_next_channel_number)
+_channel_range_lock = threading.Lock()
+
+
 def get_next_channel_number(group_id: int, auto_assign: bool = True) -> Optional[int]:
     """
     Get the next available channel number for a group.
@@ -3046,14 +3380,21 @@ def get_next_channel_number(group_id: int, auto_assign: bool = True) -> Optional
 
         # If no channel_start, auto-assign the next available range
         if not channel_start and auto_assign:
-            channel_start = get_next_available_channel_range()
-            # Save to the group
-            cursor.execute(
-                "UPDATE event_epg_groups SET channel_start = ? WHERE id = ?",
-                (channel_start, group_id)
-            )
-            conn.commit()
-            logger.info(f"Auto-assigned channel_start {channel_start} to group {group_id}")
+            # Groups refresh in parallel - two of them must not claim the same range
+            with _channel_range_lock:
+                channel_start = cursor.execute(
+                    "SELECT channel_start FROM event_epg_groups WHERE id = ?",
+                    (group_id,)
+                ).fetchone()['channel_start']
+                if not channel_start:
+                    channel_start = get_next_available_channel_range()
+                    # Save to the group
+                    cursor.execute(
+                        "UPDATE event_epg_groups SET channel_start = ? WHERE id = ?",
+                        (channel_start, group_id)
+                    )
+                    conn.commit()
+                    logger.info(f"Auto-assigned channel_start {channel_start} to group {group_id}")
 
         if not channel_start:
             return None
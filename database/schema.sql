@@ -1023,6 +1023,7 @@ CREATE TABLE IF NOT EXISTS team_league_cache (
     team_abbrev TEXT,                        -- "NSH"
     team_short_name TEXT,                    -- "Predators"
     sport TEXT NOT NULL,                     -- "hockey", "basketball", etc.
+    search_names TEXT,                       -- Precomputed matcher names: [[primary...], [secondary...]]
     UNIQUE(league_code, espn_team_id)
 );
 
@@ -20,6 +20,9 @@ from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+# Shared by every ChannelLifecycleManager instance
+_dispatcharr_lock = threading.Lock()
+
 
 def generate_event_tvg_id(espn_event_id: str) -> str:
     """
@@ -48,16 +51,9 @@ def get_global_lifecycle_settings() -> Dict[str, str]:
         and reconciliation settings
     """
     try:
-        from database import get_connection
-        conn = get_connection()
-        row = conn.execute("""
-            SELECT channel_create_timing, channel_delete_timing,
-                   default_duplicate_event_handling,
-                   reconcile_on_epg_generation, reconcile_on_startup,
-                   auto_fix_orphan_teamarr, auto_fix_orphan_dispatcharr, auto_fix_duplicates
-            FROM settings WHERE id = 1
-        """).fetchone()
-        conn.close()
+        # Shared settings snapshot - no settings query per channel/group
+        from utils.settings_snapshot import get_settings_snapshot
+        row = get_settings_snapshot()
 
         if row:
             return {
@@ -473,7 +469,8 @@ class ChannelLifecycleManager:
         self.settings = settings or {}
         # Lock to serialize Dispatcharr channel operations (create/update/delete)
         # Prevents race conditions when multiple groups are processed in parallel
-        self._dispatcharr_lock = threading.Lock()
+        # (module-level: each group gets its own manager from get_lifecycle_manager())
+        self._dispatcharr_lock = _dispatcharr_lock
 
     def clear_cache(self):
         """
@@ -2306,11 +2303,14 @@ class ChannelLifecycleManager:
         else:
             # Get all active managed channels
             conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM managed_channels WHERE deleted_at IS NULL"
-            )
-            channels = [dict(row) for row in cursor.fetchall()]
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT * FROM managed_channels WHERE deleted_at IS NULL"
+                )
+                channels = [dict(row) for row in cursor.fetchall()]
+            finally:
+                conn.close()
 
         if not channels:
             logger.debug("No managed channels to associate EPG with")
@@ -2478,13 +2478,13 @@ def get_lifecycle_manager() -> Optional[ChannelLifecycleManager]:
     Returns:
         ChannelLifecycleManager or None if Dispatcharr not configured
     """
-    from database import get_connection
+    from utils.settings_snapshot import get_settings_snapshot
 
-    conn = get_connection()
-    try:
-        settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
-    finally:
-        conn.close()
+    snapshot = get_settings_snapshot()
+    if snapshot is None:
+        logger.warning("Could not read settings - channel lifecycle unavailable")
+        return None
+    settings = snapshot.as_dict()
 
     if not settings.get('dispatcharr_enabled'):
         return None
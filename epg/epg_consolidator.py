@@ -17,7 +17,16 @@ Single-stage consolidation: teams.xml + all event_epg_*.xml → teamarr.xml
 import os
 import glob
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, List, Optional, TextIO, Tuple
+
+from epg.programme_index import (
+    GameProgramme, game_programme_from_element, index_path_for, write_programme_index
+)
+from epg.xmltv_writer import (
+    XMLTVWriter, atomic_write, file_sha256, iter_parse_xmltv, serialize_element, write_gzip_sidecar
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +34,191 @@ logger = logging.getLogger(__name__)
 DEFAULT_DATA_DIR = '/app/data'
 
 
+@dataclass
+class SourceFragment:
+    """Pre-serialized channels/programmes of one source EPG file."""
+    signature: Tuple[int, int]            # (size, mtime_ns) - cheap change check
+    content_hash: str                     # SHA256 of file bytes
+    channels: List[Tuple[str, str]] = field(default_factory=list)  # (channel_id, fragment)
+    programmes: str = ''
+    programme_count: int = 0
+    games: List[GameProgramme] = field(default_factory=list)  # For the programme index
+
+
+# Fragment cache keyed by absolute source path.
+# A single-group refresh only re-parses the file that changed; every other
+# source is spliced back into teamarr.xml from its cached fragment.
+_fragment_cache: Dict[str, SourceFragment] = {}
+_fragment_cache_lock = threading.Lock()
+
+# Serializes merges into teamarr.xml - event groups may finish (and merge) concurrently
+_merge_lock = threading.Lock()
+
+
+def clear_fragment_cache():
+    """Drop all cached source fragments (next merge re-parses every file)."""
+    with _fragment_cache_lock:
+        _fragment_cache.clear()
+
+
+def _parse_source_fragment(file_path: str, signature: Tuple[int, int], content_hash: str) -> SourceFragment:
+    """Parse a source EPG file into pre-serialized channel/programme fragments."""
+    fragment = SourceFragment(signature=signature, content_hash=content_hash)
+    programme_parts = []
+
+    def handle_element(elem):
+        if elem.tag == 'channel':
+            channel_id = elem.get('id')
+            if channel_id:
+                fragment.channels.append((channel_id, serialize_element(elem)))
+        elif elem.tag == 'programme':
+            game = game_programme_from_element(elem)
+            if game:
+                fragment.games.append(game)
+            programme_parts.append(serialize_element(elem))
+
+    iter_parse_xmltv(file_path, handle_element)
+
+    fragment.programmes = ''.join(programme_parts)
+    fragment.programme_count = len(programme_parts)
+    return fragment
+
+
+def get_source_fragment(file_path: str) -> Tuple[SourceFragment, bool]:
+    """
+    Get the pre-serialized fragment for a source file, re-parsing only on change.
+
+    Unchanged size/mtime reuses the cached fragment without reading the file.
+    Otherwise the file is hashed and only parsed if the content hash differs.
+
+    Returns:
+        Tuple of (fragment, reparsed)
+
+    Raises:
+        OSError if the file can't be read, ET.ParseError if it is malformed
+    """
+    key = os.path.abspath(file_path)
+    st = os.stat(key)
+    signature = (st.st_size, st.st_mtime_ns)
+
+    with _fragment_cache_lock:
+        cached = _fragment_cache.get(key)
+
+    if cached and cached.signature == signature:
+        return cached, False
+
+    content_hash = file_sha256(key)
+    if cached and cached.content_hash == content_hash:
+        # Rewritten with identical content - just refresh the signature
+        cached.signature = signature
+        return cached, False
+
+    fragment = _parse_source_fragment(key, signature, content_hash)
+    with _fragment_cache_lock:
+        _fragment_cache[key] = fragment
+    return fragment, True
+
+
+def merge_source_fragments(
+    file_paths: List[str],
+    output_path: str,
+    generator_name: str = "Teamarr"
+) -> Dict[str, Any]:
+    """
+    Merge source EPG files by splicing their cached fragments.
+
+    Channels are deduplicated by ID and written before all programmes;
+    files whose content hash is unchanged since the last merge are not
+    parsed again.
+
+    Args:
+        file_paths: List of XMLTV file paths to merge
+        output_path: Path for merged output file
+        generator_name: Generator name for output
+
+    Returns:
+        Dict with success status and stats
+    """
+    import xml.etree.ElementTree as ET
+    from epg.event_epg_generator import xmltv_root_attrs, xmltv_watermark
+
+    try:
+        fragments = []
+        reparsed_count = 0
+
+        for file_path in file_paths:
+            if not os.path.exists(file_path):
+                logger.warning(f"Skipping missing file: {file_path}")
+                continue
+            try:
+                fragment, reparsed = get_source_fragment(file_path)
+            except (ET.ParseError, OSError) as e:
+                logger.warning(f"Error parsing {file_path}: {e}")
+                with _fragment_cache_lock:
+                    _fragment_cache.pop(os.path.abspath(file_path), None)
+                continue
+            if reparsed:
+                reparsed_count += 1
+            fragments.append(fragment)
+
+        # Forget fragments for files that are no longer part of the merge
+        live_keys = {os.path.abspath(f) for f in file_paths}
+        with _fragment_cache_lock:
+            for key in [k for k in _fragment_cache if k not in live_keys]:
+                del _fragment_cache[key]
+
+        # XMLTV spec requires all <channel> elements before all <programme> elements
+        seen_channels = set()
+        total_programmes = 0
+
+        with atomic_write(output_path) as out:
+            with XMLTVWriter(
+                out,
+                root_attrs=xmltv_root_attrs(generator_name),
+                watermark=xmltv_watermark()
+            ) as writer:
+                for fragment in fragments:
+                    for channel_id, channel_xml in fragment.channels:
+                        if channel_id not in seen_channels:
+                            seen_channels.add(channel_id)
+                            writer.write_raw(channel_xml)
+                for fragment in fragments:
+                    writer.write_raw(fragment.programmes)
+                    total_programmes += fragment.programme_count
+
+        # Precompressed copy for clients that accept gzip
+        write_gzip_sidecar(output_path)
+
+        # Game programme index for live stats (written last so it is never older than the XML)
+        write_programme_index(
+            index_path_for(output_path),
+            [game for fragment in fragments for game in fragment.games]
+        )
+
+        logger.info(
+            f"Merged {len(fragments)} files -> {output_path} ({len(seen_channels)} channels, "
+            f"{total_programmes} programmes, {reparsed_count} re-parsed, "
+            f"{len(fragments) - reparsed_count} reused)"
+        )
+
+        return {
+            'success': True,
+            'output_path': output_path,
+            'channel_count': len(seen_channels),
+            'programme_count': total_programmes,
+            'files_merged': len(fragments),
+            'files_reparsed': reparsed_count,
+            'files_reused': len(fragments) - reparsed_count
+        }
+
+    except Exception as e:
+        logger.error(f"Error merging XMLTV files: {e}", exc_info=True)
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+
 def get_data_dir(from_output_path: str = None) -> str:
     """
     Get data directory for intermediate EPG files.
@@ -140,6 +334,14 @@ def archive_intermediate_files(files: List[str]) -> int:
                 archived += 1
             except Exception as e:
                 logger.warning(f"Could not archive {filepath}: {e}")
+
+        # Precompressed sidecar belongs to the file that was just archived
+        gz_path = filepath + '.gz'
+        if os.path.exists(gz_path):
+            try:
+                os.remove(gz_path)
+            except Exception as e:
+                logger.warning(f"Could not remove {gz_path}: {e}")
     return archived
 
 
@@ -151,6 +353,9 @@ def merge_all_epgs(final_output_path: str = None, cleanup: bool = True) -> Dict[
     - teams.xml (team-based EPG)
     - All event_epg_*.xml files (per-group event EPGs)
 
+    Only files whose content changed since the last merge are parsed;
+    the rest are spliced in from cached fragments (see merge_source_fragments).
+
     After successful merge, intermediate files are archived (.bak) and
     old archives from previous cycles are deleted.
 
@@ -161,8 +366,12 @@ def merge_all_epgs(final_output_path: str = None, cleanup: bool = True) -> Dict[
     Returns:
         Dict with success status and stats
     """
-    from epg.event_epg_generator import merge_xmltv_files
+    with _merge_lock:
+        return _merge_all_epgs(final_output_path, cleanup)
+
 
+def _merge_all_epgs(final_output_path: str, cleanup: bool) -> Dict[str, Any]:
+    """merge_all_epgs() body; caller holds _merge_lock."""
     paths = get_epg_paths(final_output_path)
     data_dir = paths['data_dir']
 
@@ -182,7 +391,7 @@ def merge_all_epgs(final_output_path: str = None, cleanup: bool = True) -> Dict[
 
     # Include all event_epg_*.xml files
     event_pattern = os.path.join(data_dir, 'event_epg_*.xml')
-    event_files = glob.glob(event_pattern)
+    event_files = sorted(glob.glob(event_pattern))
     if event_files:
         files_to_merge.extend(event_files)
         logger.debug(f"Including {len(event_files)} event EPG files in merge")
@@ -194,8 +403,10 @@ def merge_all_epgs(final_output_path: str = None, cleanup: bool = True) -> Dict[
 <tv generator-info-name="Teamarr">
 </tv>'''
         os.makedirs(data_dir, exist_ok=True)
-        with open(paths['combined'], 'w') as f:
+        with atomic_write(paths['combined']) as f:
             f.write(empty_xml)
+        write_gzip_sidecar(paths['combined'])
+        write_programme_index(index_path_for(paths['combined']), [])
         return {
             'success': True,
             'files_merged': 0,
@@ -206,7 +417,7 @@ def merge_all_epgs(final_output_path: str = None, cleanup: bool = True) -> Dict[
     for f in files_to_merge:
         logger.debug(f"  - {os.path.basename(f)}")
 
-    result = merge_xmltv_files(
+    result = merge_source_fragments(
         file_paths=files_to_merge,
         output_path=paths['combined'],
         generator_name="Teamarr"
@@ -225,7 +436,11 @@ def merge_all_epgs(final_output_path: str = None, cleanup: bool = True) -> Dict[
     return result
 
 
-def after_team_epg_generation(xml_content: str, final_output_path: str = None) -> Dict[str, Any]:
+def after_team_epg_generation(
+    xml_content: Optional[str],
+    final_output_path: str = None,
+    write_xml: Optional[Callable[[TextIO], Any]] = None
+) -> Dict[str, Any]:
     """
     Called after team EPG is generated.
 
@@ -233,8 +448,10 @@ def after_team_epg_generation(xml_content: str, final_output_path: str = None) -
     then triggers merge to final output.
 
     Args:
-        xml_content: Generated team XMLTV content
+        xml_content: Generated team XMLTV content (None when write_xml is given)
         final_output_path: Final merged destination (from settings' epg_output_path)
+        write_xml: Optional callback that streams the team XMLTV into an open
+                   file (e.g. XMLTVGenerator.write) instead of passing a string
 
     Returns:
         Dict with file paths and merge result
@@ -255,8 +472,11 @@ def after_team_epg_generation(xml_content: str, final_output_path: str = None) -
             logger.warning(f"Could not archive teams.xml: {e}")
 
     # Save new teams.xml
-    with open(paths['teams'], 'w', encoding='utf-8') as f:
-        f.write(xml_content)
+    with atomic_write(paths['teams']) as f:
+        if write_xml is not None:
+            write_xml(f)
+        else:
+            f.write(xml_content)
     logger.info(f"Saved team EPG to {paths['teams']}")
 
     # Trigger merge WITHOUT cleanup - cleanup happens after full generation cycle
@@ -118,6 +118,15 @@ class EventEnricher:
             self._league_config_cache
         )
 
+    def warm_league(self, league_code: str) -> None:
+        """
+        Load a league's config into the cache ahead of enrichment.
+
+        Args:
+            league_code: League code (e.g., 'nfl')
+        """
+        self._get_league_config(league_code)
+
     # =========================================================================
     # NORMALIZATION HELPERS
     # =========================================================================
@@ -8,10 +8,11 @@ Reuses core XMLTV formatting from the team-based generator.
 import os
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional
 from zoneinfo import ZoneInfo
 
 from epg.xmltv_generator import XMLTVGenerator
+from epg.xmltv_writer import atomic_write, write_gzip_sidecar
 from epg.event_template_engine import EventTemplateEngine, build_event_context
 
 logger = logging.getLogger(__name__)
@@ -170,6 +171,30 @@ class EventEPGGenerator:
         Returns:
             XMLTV XML string
         """
+        tv = self.build_tree(
+            matched_streams, group_info,
+            settings=settings, template=template,
+            epg_start_datetime=epg_start_datetime
+        )
+        return self._xmltv.serialize(tv)
+
+    def build_tree(
+        self,
+        matched_streams: List[Dict],
+        group_info: Dict,
+        settings: Optional[Dict] = None,
+        template: Optional[Dict] = None,
+        epg_start_datetime: Optional[datetime] = None
+    ):
+        """
+        Build the <tv> element tree for matched streams.
+
+        Same arguments as generate(). The tree can be streamed straight to
+        disk with save_to_file() without materializing the XML string.
+
+        Returns:
+            xml.etree.ElementTree.Element for the <tv> root
+        """
         import xml.etree.ElementTree as ET
 
         settings = settings or {}
@@ -229,11 +254,7 @@ class EventEPGGenerator:
                     epg_start_datetime, days_ahead
                 )
 
-        # Convert to pretty XML
-        xml_str = self._xmltv._prettify(tv)
-        xml_with_doctype = self._xmltv._add_doctype(xml_str)
-
-        return xml_with_doctype
+        return tv
 
     def _get_channel_id(self, stream: Dict, event: Dict = None) -> str:
         """
@@ -269,18 +290,20 @@ class EventEPGGenerator:
 
         # Display name - use template channel_name if available, else stream name
         display_name = ET.SubElement(channel, 'display-name')
-        if template and template.get('channel_name'):
+        template_ctx = template_vars = None
+        if template and (template.get('channel_name') or template.get('channel_logo_url')):
             epg_timezone = settings.get('default_timezone', 'America/Detroit') if settings else 'America/Detroit'
             template_ctx = build_event_context(event, stream, group_info, epg_timezone, settings)
-            display_name.text = self._template_engine.resolve(template['channel_name'], template_ctx)
+            template_vars = self._template_engine.variables_for(template_ctx)
+
+        if template and template.get('channel_name'):
+            display_name.text = self._template_engine.resolve(template['channel_name'], template_ctx, template_vars)
         else:
             display_name.text = stream.get('name', '')
 
         # Channel icon/logo - use template channel_logo_url if available
         if template and template.get('channel_logo_url'):
-            epg_timezone = settings.get('default_timezone', 'America/Detroit') if settings else 'America/Detroit'
-            template_ctx = build_event_context(event, stream, group_info, epg_timezone, settings)
-            logo_url = self._template_engine.resolve(template['channel_logo_url'], template_ctx)
+            logo_url = self._template_engine.resolve(template['channel_logo_url'], template_ctx, template_vars)
             if logo_url:
                 icon = ET.SubElement(channel, 'icon')
                 icon.set('src', logo_url)
@@ -319,12 +342,13 @@ class EventEPGGenerator:
         # Build template context for variable resolution
         epg_timezone = settings.get('default_timezone', 'America/Detroit')
         template_ctx = build_event_context(event, stream, group_info, epg_timezone, settings)
+        template_vars = self._template_engine.variables_for(template_ctx)
 
         # Title - from template (required)
         title = ET.SubElement(programme, 'title')
         title.set('lang', 'en')
         if template and template.get('title_format'):
-            title.text = self._template_engine.resolve(template['title_format'], template_ctx)
+            title.text = self._template_engine.resolve(template['title_format'], template_ctx, template_vars)
         else:
             # Minimal fallback - just team names
             home = event.get('home_team', {}).get('name', '')
@@ -333,7 +357,7 @@ class EventEPGGenerator:
 
         # Sub-title - from template only
         if template and template.get('subtitle_template'):
-            subtitle_text = self._template_engine.resolve(template['subtitle_template'], template_ctx)
+            subtitle_text = self._template_engine.resolve(template['subtitle_template'], template_ctx, template_vars)
             if subtitle_text:
                 sub_title = ET.SubElement(programme, 'sub-title')
                 sub_title.set('lang', 'en')
@@ -346,14 +370,14 @@ class EventEPGGenerator:
                 template_ctx
             )
             if desc_template:
-                desc_text = self._template_engine.resolve(desc_template, template_ctx)
+                desc_text = self._template_engine.resolve(desc_template, template_ctx, template_vars)
                 if desc_text:
                     desc = ET.SubElement(programme, 'desc')
                     desc.set('lang', 'en')
                     desc.text = desc_text
 
         # Categories - from template with variable resolution (respects categories_apply_to)
-        self._add_categories(programme, template, template_ctx, is_filler=False)
+        self._add_categories(programme, template, template_ctx, is_filler=False, variables=template_vars)
 
         # Date - convert to user's timezone for correct local date
         from zoneinfo import ZoneInfo
@@ -367,7 +391,7 @@ class EventEPGGenerator:
 
         # Programme Icon/Art - from template only
         if template and template.get('program_art_url'):
-            icon_url = self._template_engine.resolve(template['program_art_url'], template_ctx)
+            icon_url = self._template_engine.resolve(template['program_art_url'], template_ctx, template_vars)
             if icon_url:
                 icon = ET.SubElement(programme, 'icon')
                 icon.set('src', icon_url)
@@ -594,16 +618,19 @@ class EventEPGGenerator:
         programme.set('stop', stop_time)
         programme.set('channel', self._get_channel_id(stream, event))
 
+        # Shared by every template of this programme
+        template_vars = self._template_engine.variables_for(template_ctx)
+
         # Title - use {filler_type}_title from template
         title = ET.SubElement(programme, 'title')
         title.set('lang', 'en')
         title_template = template.get(f'{filler_type}_title', f'{filler_type.capitalize()} Coverage')
-        title.text = self._template_engine.resolve(title_template, template_ctx)
+        title.text = self._template_engine.resolve(title_template, template_ctx, template_vars)
 
         # Sub-title - use {filler_type}_subtitle from template
         subtitle_template = template.get(f'{filler_type}_subtitle', '')
         if subtitle_template:
-            subtitle_text = self._template_engine.resolve(subtitle_template, template_ctx)
+            subtitle_text = self._template_engine.resolve(subtitle_template, template_ctx, template_vars)
             if subtitle_text:
                 sub_title = ET.SubElement(programme, 'sub-title')
                 sub_title.set('lang', 'en')
@@ -617,7 +644,7 @@ class EventEPGGenerator:
             desc_template = template.get(f'{filler_type}_description', '')
 
         if desc_template:
-            desc_text = self._template_engine.resolve(desc_template, template_ctx)
+            desc_text = self._template_engine.resolve(desc_template, template_ctx, template_vars)
             if desc_text and desc_text.strip():
                 desc = ET.SubElement(programme, 'desc')
                 desc.set('lang', 'en')
@@ -626,13 +653,13 @@ class EventEPGGenerator:
         # Art URL if available
         art_url_key = f'{filler_type}_art_url'
         if template.get(art_url_key):
-            icon_url = self._template_engine.resolve(template[art_url_key], template_ctx)
+            icon_url = self._template_engine.resolve(template[art_url_key], template_ctx, template_vars)
             if icon_url:
                 icon = ET.SubElement(programme, 'icon')
                 icon.set('src', icon_url)
 
         # Categories - respects categories_apply_to setting
-        self._add_categories(programme, template, template_ctx, is_filler=True)
+        self._add_categories(programme, template, template_ctx, is_filler=True, variables=template_vars)
 
         # Teamarr metadata (invisible to EPG readers, used internally)
         programme.append(ET.Comment(f"teamarr:event-filler-{filler_type}"))
@@ -642,7 +669,8 @@ class EventEPGGenerator:
         programme,
         template: Optional[Dict],
         context: Dict = None,
-        is_filler: bool = False
+        is_filler: bool = False,
+        variables: Mapping = None
     ):
         """
         Add category elements from template, resolving any variables.
@@ -654,6 +682,7 @@ class EventEPGGenerator:
             template: Template dict
             context: Variable resolution context
             is_filler: True if this is a filler programme (pregame/postgame)
+            variables: Optional variables from EventTemplateEngine.variables_for(context)
         """
         import xml.etree.ElementTree as ET
         import json
@@ -693,7 +722,7 @@ class EventEPGGenerator:
                 # Resolve any template variables in category
                 resolved_cat = cat
                 if context and '{' in cat:
-                    resolved_cat = self._template_engine.resolve(cat, context)
+                    resolved_cat = self._template_engine.resolve(cat, context, variables)
                 # Avoid duplicates
                 if resolved_cat not in added_categories:
                     cat_elem = ET.SubElement(programme, 'category')
@@ -789,12 +818,13 @@ class EventEPGGenerator:
 
         return None
 
-    def save_to_file(self, xml_content: str, group_id: int, data_dir: str = None) -> str:
+    def save_to_file(self, xml_content, group_id: int, data_dir: str = None) -> str:
         """
         Save generated XMLTV to file.
 
         Args:
-            xml_content: Generated XMLTV XML string
+            xml_content: Generated XMLTV XML string, or a <tv> element tree from
+                build_tree() which is streamed to disk element by element
             group_id: Event EPG group ID
             data_dir: Directory to save file (default: ./data)
 
@@ -808,8 +838,14 @@ class EventEPGGenerator:
 
         file_path = os.path.join(data_dir, f'event_epg_{group_id}.xml')
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(xml_content)
+        with atomic_write(file_path) as f:
+            if isinstance(xml_content, str):
+                f.write(xml_content)
+            else:
+                self._xmltv.write_tree(xml_content, f)
+
+        # Precompressed copy served to clients that accept gzip
+        write_gzip_sidecar(file_path)
 
         logger.info(f"Saved event EPG to {file_path}")
         return file_path
@@ -839,7 +875,7 @@ def generate_event_epg(
     Returns:
         Dict with:
         - success: bool
-        - xml_content: str (if successful)
+        - xml_content: str (if successful and not saved - saved EPG is streamed to disk)
         - file_path: str (if saved)
         - channel_count: int
         - programme_count: int (total programmes including filler)
@@ -850,7 +886,7 @@ def generate_event_epg(
     try:
         generator = EventEPGGenerator()
 
-        xml_content = generator.generate(
+        tv = generator.build_tree(
             matched_streams,
             group_info,
             settings=settings,
@@ -876,7 +912,6 @@ def generate_event_epg(
 
         result = {
             'success': True,
-            'xml_content': xml_content,
             'channel_count': len(matched_streams),
             'programme_count': total_programmes,
             'event_count': event_count,
@@ -885,12 +920,15 @@ def generate_event_epg(
         }
 
         if save:
+            # Stream the tree straight to disk - no intermediate XML string
             file_path = generator.save_to_file(
-                xml_content,
+                tv,
                 group_info['id'],
                 data_dir
             )
             result['file_path'] = file_path
+        else:
+            result['xml_content'] = generator._xmltv.serialize(tv)
 
         return result
 
@@ -902,115 +940,21 @@ def generate_event_epg(
         }
 
 
-def merge_xmltv_files(
-    file_paths: List[str],
-    output_path: str,
-    generator_name: str = "Teamarr"
-) -> Dict[str, Any]:
-    """
-    Merge multiple XMLTV files into one.
-
-    Combines channels and programmes from multiple sources,
-    removing duplicates by channel ID.
+def xmltv_root_attrs(generator_name: str = "Teamarr") -> Dict[str, str]:
+    """Attributes for the <tv> root of the final merged EPG."""
+    return {
+        'generator-info-name': generator_name,
+        'generator-info-url': 'https://github.com/egyptiangio/teamarr',
+    }
 
-    Args:
-        file_paths: List of XMLTV file paths to merge
-        output_path: Path for merged output file
-        generator_name: Generator name for output
 
-    Returns:
-        Dict with success status and stats
-    """
-    import xml.etree.ElementTree as ET
-    from xml.dom import minidom
+def xmltv_watermark() -> str:
+    """Teamarr watermark comment placed at the top of the final merged EPG."""
     from config import VERSION
 
-    try:
-        # Create root element
-        tv = ET.Element('tv')
-        tv.set('generator-info-name', generator_name)
-        tv.set('generator-info-url', 'https://github.com/egyptiangio/teamarr')
-
-        # Collect all channels and programmes separately first
-        # XMLTV spec requires all <channel> elements before all <programme> elements
-        seen_channels = set()
-        all_channels = []
-        all_programmes = []
-
-        for file_path in file_paths:
-            if not os.path.exists(file_path):
-                logger.warning(f"Skipping missing file: {file_path}")
-                continue
-
-            try:
-                # Parse with comments enabled to preserve teamarr metadata
-                parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
-                tree = ET.parse(file_path, parser)
-                root = tree.getroot()
-
-                # Collect channels (skip duplicates)
-                for channel in root.findall('channel'):
-                    channel_id = channel.get('id')
-                    if channel_id and channel_id not in seen_channels:
-                        all_channels.append(channel)
-                        seen_channels.add(channel_id)
-
-                # Collect all programmes
-                for programme in root.findall('programme'):
-                    all_programmes.append(programme)
-
-            except ET.ParseError as e:
-                logger.warning(f"Error parsing {file_path}: {e}")
-                continue
-
-        # Add all channels first, then all programmes (per XMLTV spec)
-        for channel in all_channels:
-            tv.append(channel)
-        for programme in all_programmes:
-            tv.append(programme)
-
-        total_programmes = len(all_programmes)
-
-        # Convert to pretty XML
-        rough_string = ET.tostring(tv, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        pretty = reparsed.toprettyxml(indent='  ')
-
-        # Clean up XML
-        lines = [line for line in pretty.split('\n') if line.strip()]
-        if lines and lines[0].startswith('<?xml'):
-            lines = lines[1:]
-        xml_str = '\n'.join(lines)
-
-        # Add declaration, watermark, and doctype
-        declaration = '<?xml version="1.0" encoding="UTF-8"?>'
-        watermark = (
-            '<!--\n'
-            f'  Generated with Teamarr v{VERSION} - Dynamic EPG Generator for Sports Channels\n'
-            '  https://github.com/egyptiangio/teamarr\n'
-            '-->'
-        )
-        doctype = '<!DOCTYPE tv SYSTEM "xmltv.dtd">'
-        final_xml = f"{declaration}\n{watermark}\n{doctype}\n{xml_str}"
-
-        # Write output
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(final_xml)
-
-        logger.info(f"Merged {len(file_paths)} files -> {output_path} ({len(seen_channels)} channels, {total_programmes} programmes)")
-
-        return {
-            'success': True,
-            'output_path': output_path,
-            'channel_count': len(seen_channels),
-            'programme_count': total_programmes,
-            'files_merged': len([f for f in file_paths if os.path.exists(f)])
-        }
-
-    except Exception as e:
-        logger.error(f"Error merging XMLTV files: {e}", exc_info=True)
-        return {
-            'success': False,
-            'error': str(e)
-        }
+    return (
+        '<!--\n'
+        f'  Generated with Teamarr v{VERSION} - Dynamic EPG Generator for Sports Channels\n'
+        '  https://github.com/egyptiangio/teamarr\n'
+        '-->'
+    )
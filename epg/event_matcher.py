@@ -21,6 +21,7 @@ from utils.logger import get_logger
 
 if TYPE_CHECKING:
     from epg.event_enricher import EventEnricher
+    from utils.settings_snapshot import SettingsSnapshot
 
 logger = get_logger(__name__)
 
@@ -60,7 +61,8 @@ class EventMatcher:
         espn_client,
         db_connection_func=None,
         lookahead_days: int = None,
-        enricher: 'EventEnricher' = None
+        enricher: 'EventEnricher' = None,
+        settings: 'SettingsSnapshot' = None
     ):
         """
         Initialize EventMatcher.
@@ -70,11 +72,14 @@ class EventMatcher:
             db_connection_func: Function that returns DB connection (for league config)
             lookahead_days: How many days ahead to search for events (default from setting or 7)
             enricher: EventEnricher instance for event enrichment (optional, created if not provided)
+            settings: Settings snapshot of the current generation (optional, the
+                      shared snapshot from utils.settings_snapshot is used if not provided)
         """
         self.espn = espn_client
         self.db_connection_func = db_connection_func
         self.lookahead_days = lookahead_days or self.DEFAULT_SEARCH_DAYS_AHEAD
         self.enricher = enricher
+        self.settings = settings
 
         # Cache for league config
         self._league_config: Dict[str, Dict] = {}
@@ -94,6 +99,15 @@ class EventMatcher:
         """Get league configuration (sport, api_path) using shared module."""
         return get_league_config(league_code, self.db_connection_func, self._league_config)
 
+    def warm_league(self, league_code: str) -> None:
+        """
+        Load a league's config into the cache ahead of matching.
+
+        Args:
+            league_code: League code (e.g., 'nfl')
+        """
+        self._get_league_config(league_code)
+
     def clear_scoreboard_cache(self):
         """Clear scoreboard cache. Call at start of each EPG generation."""
         with self._scoreboard_cache_lock:
@@ -175,22 +189,20 @@ class EventMatcher:
             - matching_events: List of {event, event_date, event_id} dicts
             - skip_reason: None, 'past_game', or 'today_final' indicating why game was skipped
         """
-        from utils.time_format import get_today_in_user_tz, get_user_timezone
+        from utils.settings_snapshot import get_settings_snapshot
 
         now = datetime.now(ZoneInfo('UTC'))
         cutoff_past = now - timedelta(days=self.SEARCH_DAYS_BACK)
         cutoff_future = now + timedelta(days=self.lookahead_days)
 
+        # Get user timezone for event date conversion (from the settings snapshot,
+        # so matching thousands of streams doesn't re-read the settings row)
+        settings = self.settings or get_settings_snapshot(self.db_connection_func)
+        user_tz = settings.tz if settings else ZoneInfo('America/Detroit')
+
         # Use user's timezone for "today" to avoid games becoming "yesterday"
         # when UTC crosses midnight but user's local time hasn't
-        today = get_today_in_user_tz(self.db_connection_func)
-
-        # Get user timezone for event date conversion
-        user_tz_str = get_user_timezone(self.db_connection_func)
-        try:
-            user_tz = ZoneInfo(user_tz_str)
-        except Exception:
-            user_tz = ZoneInfo('America/Detroit')
+        today = now.astimezone(user_tz).date()
 
         matching_events = []
         skip_reason = None  # 'past_game' or 'today_final'
@@ -437,41 +449,34 @@ class EventMatcher:
 
             logger.debug(f"[TRACE] _search_scoreboard | checking {date_str} for teams {team1_id} vs {team2_id}")
 
-            # Use cached scoreboard fetch
+            # Use cached scoreboard fetch; the index finds games with both teams
+            # without scanning every event on the scoreboard
             scoreboard_data = self._get_scoreboard_cached(sport, api_league, date_str)
-            if not scoreboard_data or 'events' not in scoreboard_data:
+            scoreboard_index = self.espn.get_scoreboard_index(sport, api_league, date_str, scoreboard_data)
+            if not scoreboard_index:
                 continue
 
-            for sb_event in scoreboard_data.get('events', []):
-                # Check if this event involves both teams
-                competitions = sb_event.get('competitions', [])
-                if not competitions:
-                    continue
+            for sb_event in scoreboard_index.events_between(team1_id, team2_id):
+                candidate_events.append(sb_event)
+                logger.debug(f"[TRACE] _search_scoreboard | candidate: {sb_event.get('name')} on {sb_event.get('date')}")
 
-                competitors = competitions[0].get('competitors', [])
-                team_ids_in_event = {str(c.get('team', {}).get('id', '')) for c in competitors}
-
-                if str(team1_id) in team_ids_in_event and str(team2_id) in team_ids_in_event:
-                    candidate_events.append(sb_event)
-                    logger.debug(f"[TRACE] _search_scoreboard | candidate: {sb_event.get('name')} on {sb_event.get('date')}")
-
-                    # Only early exit if we have an exact time match
-                    # This handles the edge case where men's and women's teams with
-                    # the same name play on the same day (e.g., hockey doubleheaders)
-                    if game_time:
-                        try:
-                            event_date_str = sb_event.get('date', '')
-                            event_dt = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
-                            # Check if times match within 5 minutes
-                            time_diff = abs((event_dt - game_time).total_seconds())
-                            if time_diff < 300:  # 5 minutes tolerance
-                                logger.debug(f"[TRACE] _search_scoreboard | exact time match, early exit")
-                                exact_time_match_found = True
-                                break
-                        except (ValueError, TypeError):
-                            pass
-                    # No game_time provided - keep collecting candidates for later selection
-                    # Don't break here; there might be multiple games (men's + women's)
+                # Only early exit if we have an exact time match
+                # This handles the edge case where men's and women's teams with
+                # the same name play on the same day (e.g., hockey doubleheaders)
+                if game_time:
+                    try:
+                        event_date_str = sb_event.get('date', '')
+                        event_dt = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
+                        # Check if times match within 5 minutes
+                        time_diff = abs((event_dt - game_time).total_seconds())
+                        if time_diff < 300:  # 5 minutes tolerance
+                            logger.debug(f"[TRACE] _search_scoreboard | exact time match, early exit")
+                            exact_time_match_found = True
+                            break
+                    except (ValueError, TypeError):
+                        pass
+                # No game_time provided - keep collecting candidates for later selection
+                # Don't break here; there might be multiple games (men's + women's)
 
             if exact_time_match_found:
                 break  # Found exact time match, no need to check more days
@@ -818,13 +823,15 @@ class EventMatcher:
                 # (e.g., eng.fa, esp.copa_del_rey, etc.)
                 from database import get_connection
                 conn = get_connection()
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT 1 FROM soccer_leagues_cache WHERE league_slug = ?",
-                    (league,)
-                )
-                is_soccer = cursor.fetchone() is not None
-                conn.close()
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        "SELECT 1 FROM soccer_leagues_cache WHERE league_slug = ?",
+                        (league,)
+                    )
+                    is_soccer = cursor.fetchone() is not None
+                finally:
+                    conn.close()
 
                 if is_soccer:
                     sport = 'soccer'
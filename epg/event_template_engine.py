@@ -11,14 +11,83 @@ Unlike the team-based TemplateEngine, this engine:
 import re
 import json
 import logging
+import threading
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 
+from epg.template_compiler import LazyVariables, compile_template
 from utils import to_pascal_case
 from utils.time_format import format_time as fmt_time, get_time_settings
 
 logger = logging.getLogger(__name__)
 
+# Matches {variable_name}
+VARIABLE_PATTERN = re.compile(r'\{([a-z_][a-z0-9_]*)\}', re.IGNORECASE)
+
+MULTI_SPACE_PATTERN = re.compile(r'  +')
+
+SPORT_DISPLAY_NAMES = {
+    'basketball': 'Basketball',
+    'football': 'Football',
+    'hockey': 'Hockey',
+    'baseball': 'Baseball',
+    'soccer': 'Soccer'
+}
+
+# Regulation periods per sport
+OVERTIME_THRESHOLDS = {
+    'basketball': 4,  # NBA/NCAAM = 4 quarters/halves
+    'hockey': 3,      # NHL = 3 periods
+    'football': 4,    # NFL/NCAAF = 4 quarters
+    'baseball': 9     # MLB = 9 innings
+}
+
+# Per-team variables, prefixed with home_team / away_team
+TEAM_VAR_SUFFIXES = (
+    '', '_abbrev', '_abbrev_lower', '_pascal', '_logo', '_record',
+    '_college_conference', '_college_conference_abbrev', '_pro_conference', '_pro_conference_abbrev',
+    '_pro_division', '_rank', '_seed', '_streak',
+)
+
+# Templates with empty optional variables stripped, per (template, empty vars)
+_stripped_templates: Dict[Tuple[str, FrozenSet[str]], str] = {}
+_stripped_templates_lock = threading.Lock()
+
+
+def _strip_optional_vars(template: str, empty_vars: FrozenSet[str]) -> str:
+    """
+    Remove empty optional variables together with their surrounding brackets,
+    parens or dash separator (cached per template).
+    """
+    key = (template, empty_vars)
+    stripped = _stripped_templates.get(key)
+    if stripped is not None:
+        return stripped
+
+    stripped = template
+    for var_name in sorted(empty_vars):
+        # Remove patterns like "({var})" or "( {var} )" or "[ {var} ]" etc.
+        stripped = re.sub(
+            r'\s*[\(\[]\s*\{' + var_name + r'\}\s*[\)\]]\s*',
+            '',
+            stripped,
+            flags=re.IGNORECASE
+        )
+        # Also remove standalone " - {var}" or " {var}" patterns
+        stripped = re.sub(
+            r'\s*[-–—]\s*\{' + var_name + r'\}',
+            '',
+            stripped,
+            flags=re.IGNORECASE
+        )
+
+    with _stripped_templates_lock:
+        if len(_stripped_templates) >= 1024:
+            _stripped_templates.clear()
+        _stripped_templates[key] = stripped
+    return stripped
+
 
 class EventTemplateEngine:
     """
@@ -34,13 +103,18 @@ class EventTemplateEngine:
     # Variables that should be gracefully removed with surrounding chars when empty
     OPTIONAL_VARS = {'exception_keyword', 'exception_keyword_title'}
 
-    def resolve(self, template: str, context: Dict[str, Any]) -> str:
+    def resolve(self, template: str, context: Dict[str, Any], variables: Optional[Mapping] = None) -> str:
         """
         Resolve all template variables in a string.
 
+        The template is compiled once and only the variables it references are
+        computed. Pass `variables` (from variables_for) when resolving several
+        templates against the same context so they share the computed values.
+
         Args:
             template: String with {variable} placeholders
             context: Dictionary containing event data
+            variables: Optional EventVariables already built for this context
 
         Returns:
             String with all variables replaced with actual values
@@ -48,48 +122,40 @@ class EventTemplateEngine:
         if not template:
             return ""
 
-        # Build all variables from context
-        variables = self._build_variable_dict(context)
+        if variables is None:
+            variables = self.variables_for(context)
+
+        compiled = compile_template(template, VARIABLE_PATTERN)
 
         # First pass: Remove optional variables with their surrounding brackets/parens when empty
-        # Pattern matches: (optional_var), [optional_var], or just the var with surrounding spaces
-        for var_name in self.OPTIONAL_VARS:
-            var_value = variables.get(var_name, '')
-            if not var_value:
-                # Remove patterns like "({var})" or "( {var} )" or "[ {var} ]" etc.
-                template = re.sub(
-                    r'\s*[\(\[]\s*\{' + var_name + r'\}\s*[\)\]]\s*',
-                    '',
-                    template,
-                    flags=re.IGNORECASE
-                )
-                # Also remove standalone " - {var}" or " {var}" patterns
-                template = re.sub(
-                    r'\s*[-–—]\s*\{' + var_name + r'\}',
-                    '',
-                    template,
-                    flags=re.IGNORECASE
-                )
+        empty_optional = frozenset(
+            var_name for var_name in self.OPTIONAL_VARS
+            if var_name in {v.lower() for v in compiled.variables} and not variables.get(var_name, '')
+        )
+        if empty_optional:
+            compiled = compile_template(_strip_optional_vars(template, empty_optional), VARIABLE_PATTERN)
 
         # Second pass: Replace all remaining {variable} patterns
-        pattern = r'\{([a-z_][a-z0-9_]*)\}'
-
-        def replace_variable(match):
-            var_name = match.group(1)
-            var_value = variables.get(var_name, '')
-            return str(var_value)
-
-        result = re.sub(pattern, replace_variable, template, flags=re.IGNORECASE)
+        result = compiled.render(variables)
 
         # Clean up any double spaces left behind
-        result = re.sub(r'  +', ' ', result).strip()
+        return MULTI_SPACE_PATTERN.sub(' ', result).strip()
 
-        return result
+    def variables_for(self, context: Dict[str, Any]) -> 'EventVariables':
+        """
+        Lazy variable mapping for an event context.
+
+        Variables are computed on first lookup and memoized, so one mapping can
+        be shared by every template resolved for the same programme.
+        """
+        return EventVariables(context)
 
     def _build_variable_dict(self, context: Dict[str, Any]) -> Dict[str, str]:
         """
         Build complete dictionary of event variables.
 
+        Eager form of variables_for(); only needed when every variable is wanted.
+
         Args:
             context: Event context containing:
                 - event: ESPN event data
@@ -99,106 +165,163 @@ class EventTemplateEngine:
         Returns:
             Dictionary of variable_name: value pairs
         """
-        variables = {}
+        return self.variables_for(context).build_all()
 
-        event = context.get('event', {}) or {}
-        stream = context.get('stream', {}) or {}
-        group_info = context.get('group_info', {}) or {}
-        epg_timezone = context.get('epg_timezone', 'America/Detroit')
-        time_format_settings = context.get('time_format_settings', {})
+    def select_description(self, description_options: Any, context: Dict[str, Any]) -> str:
+        """
+        Select the best description template based on conditional logic.
+
+        Simplified version for events - mainly uses fallback descriptions
+        since events don't have the same complex conditions as team channels.
+
+        Args:
+            description_options: JSON string or list of description options
+            context: Event context for evaluation
+
+        Returns:
+            Selected description template string
+        """
+        # Parse description_options if it's a JSON string
+        if isinstance(description_options, str):
+            try:
+                options = json.loads(description_options) if description_options else []
+            except:
+                return ''
+        elif isinstance(description_options, list):
+            options = description_options
+        else:
+            return ''
+
+        if not options:
+            return ''
+
+        # For events, prioritize by priority value (lower = higher priority)
+        # Filter to options that have templates
+        valid_options = [opt for opt in options if opt.get('template')]
+
+        if not valid_options:
+            return ''
+
+        # Sort by priority (default 50 if not specified)
+        valid_options.sort(key=lambda x: x.get('priority', 50))
+
+        # For now, just return the highest priority template
+        # Future: Add condition evaluation for event-specific conditions
+        return valid_options[0]['template']
+
+
+class EventVariables(LazyVariables):
+    """
+    Variables for one event context, built lazily section by section.
+
+    Keeps template resolution from running the league-name database lookup,
+    date formatting and result logic for templates that never use them.
+    """
+
+    SECTIONS = (
+        ('_identification', ('event_name', 'matchup', 'matchup_abbrev')),
+        ('_home_team', tuple(f'home_team{suffix}' for suffix in TEAM_VAR_SUFFIXES)),
+        ('_away_team', tuple(f'away_team{suffix}' for suffix in TEAM_VAR_SUFFIXES)),
+        ('_sport', ('sport',)),
+        ('_league', ('league_id', 'league', 'league_name')),
+        ('_date_time', (
+            'game_date', 'game_date_short', 'game_time', 'game_day', 'game_day_short',
+            'today_tonight', 'today_tonight_title',
+        )),
+        ('_venue', ('venue', 'venue_city', 'venue_state', 'venue_full')),
+        ('_scores', ('home_team_score', 'away_team_score')),
+        ('_result', (
+            'event_result', 'event_result_abbrev', 'winner', 'winner_abbrev', 'loser', 'loser_abbrev',
+            'overtime_text',
+        )),
+        ('_broadcast', ('broadcast_simple', 'broadcast_network')),
+        ('_status', ('status_detail', 'status_state', 'is_final')),
+        ('_odds', (
+            'odds_spread', 'odds_over_under', 'odds_provider', 'odds_details',
+            'odds_moneyline', 'odds_opponent_moneyline', 'odds_opponent_spread',
+        )),
+        ('_weather', ('weather',)),
+        ('_stream', ('stream_name', 'stream_id', 'channel_id')),
+        ('_exception_keyword', ('exception_keyword', 'exception_keyword_title')),
+    )
+
+    def __init__(self, context: Dict[str, Any]):
+        """
+        Args:
+            context: Event context (see build_event_context)
+        """
+        super().__init__()
+        self.context = context
+        self.event = event = context.get('event', {}) or {}
+        self.stream = context.get('stream', {}) or {}
+        self.group_info = group_info = context.get('group_info', {}) or {}
 
         # Extract team data
-        home_team = event.get('home_team', {}) or {}
-        away_team = event.get('away_team', {}) or {}
-        venue = event.get('venue', {}) or {}
-        status = event.get('status', {}) or {}
+        self.home_team = event.get('home_team', {}) or {}
+        self.away_team = event.get('away_team', {}) or {}
+        self.status = event.get('status', {}) or {}
 
-        # =====================================================================
-        # EVENT IDENTIFICATION
-        # =====================================================================
+        # For multi-sport groups, use the event's sport/league (detected per-stream)
+        # Fall back to group's assigned values for single-sport groups
+        # event['league'] contains the ESPN slug (e.g., 'aus.1', 'eng.1', 'nfl')
+        self.sport_code = event.get('sport', '') or group_info.get('assigned_sport', '')
+        self.event_league = event.get('league', '') or group_info.get('assigned_league', '')
 
-        variables['event_name'] = event.get('short_name') or event.get('name', '')
+    # =========================================================================
+    # EVENT IDENTIFICATION
+    # =========================================================================
+
+    def _identification(self, variables: Dict[str, str]):
+        home_team, away_team = self.home_team, self.away_team
+        variables['event_name'] = self.event.get('short_name') or self.event.get('name', '')
         variables['matchup'] = f"{away_team.get('name', '')} @ {home_team.get('name', '')}"
         variables['matchup_abbrev'] = f"{away_team.get('abbrev', '')} @ {home_team.get('abbrev', '')}"
 
-        # =====================================================================
-        # HOME TEAM VARIABLES
-        # =====================================================================
+    # =========================================================================
+    # HOME / AWAY TEAM VARIABLES
+    # =========================================================================
 
-        variables['home_team'] = home_team.get('name', '')
-        variables['home_team_abbrev'] = home_team.get('abbrev', '')
-        variables['home_team_abbrev_lower'] = variables['home_team_abbrev'].lower()
-        variables['home_team_pascal'] = to_pascal_case(variables['home_team'])
-        variables['home_team_logo'] = home_team.get('logo', '')
+    def _home_team(self, variables: Dict[str, str]):
+        self._team_variables(variables, 'home_team', self.home_team)
 
-        # Home team record
-        home_record = home_team.get('record', {})
-        if isinstance(home_record, dict):
-            variables['home_team_record'] = home_record.get('summary', home_record.get('displayValue', ''))
-        else:
-            variables['home_team_record'] = str(home_record) if home_record else ''
-
-        # Home team conference/division (from enrich_with_team_stats)
-        variables['home_team_college_conference'] = home_team.get('college_conference', '')
-        variables['home_team_college_conference_abbrev'] = home_team.get('college_conference_abbrev', '')
-        variables['home_team_pro_conference'] = home_team.get('pro_conference', '')
-        variables['home_team_pro_conference_abbrev'] = home_team.get('pro_conference_abbrev', '')
-        variables['home_team_pro_division'] = home_team.get('pro_division', '')
-
-        # Home team rank/seed/streak (from enrich_with_team_stats)
-        variables['home_team_rank'] = home_team.get('rank', '')
-        variables['home_team_seed'] = home_team.get('seed', '')
-        variables['home_team_streak'] = home_team.get('streak', '')
-
-        # =====================================================================
-        # AWAY TEAM VARIABLES
-        # =====================================================================
-
-        variables['away_team'] = away_team.get('name', '')
-        variables['away_team_abbrev'] = away_team.get('abbrev', '')
-        variables['away_team_abbrev_lower'] = variables['away_team_abbrev'].lower()
-        variables['away_team_pascal'] = to_pascal_case(variables['away_team'])
-        variables['away_team_logo'] = away_team.get('logo', '')
-
-        # Away team record
-        away_record = away_team.get('record', {})
-        if isinstance(away_record, dict):
-            variables['away_team_record'] = away_record.get('summary', away_record.get('displayValue', ''))
+    def _away_team(self, variables: Dict[str, str]):
+        self._team_variables(variables, 'away_team', self.away_team)
+
+    def _team_variables(self, variables: Dict[str, str], prefix: str, team: Dict):
+        variables[prefix] = team.get('name', '')
+        variables[f'{prefix}_abbrev'] = team.get('abbrev', '')
+        variables[f'{prefix}_abbrev_lower'] = variables[f'{prefix}_abbrev'].lower()
+        variables[f'{prefix}_pascal'] = to_pascal_case(variables[prefix])
+        variables[f'{prefix}_logo'] = team.get('logo', '')
+
+        # Team record
+        record = team.get('record', {})
+        if isinstance(record, dict):
+            variables[f'{prefix}_record'] = record.get('summary', record.get('displayValue', ''))
         else:
-            variables['away_team_record'] = str(away_record) if away_record else ''
-
-        # Away team conference/division (from enrich_with_team_stats)
-        variables['away_team_college_conference'] = away_team.get('college_conference', '')
-        variables['away_team_college_conference_abbrev'] = away_team.get('college_conference_abbrev', '')
-        variables['away_team_pro_conference'] = away_team.get('pro_conference', '')
-        variables['away_team_pro_conference_abbrev'] = away_team.get('pro_conference_abbrev', '')
-        variables['away_team_pro_division'] = away_team.get('pro_division', '')
-
-        # Away team rank/seed/streak (from enrich_with_team_stats)
-        variables['away_team_rank'] = away_team.get('rank', '')
-        variables['away_team_seed'] = away_team.get('seed', '')
-        variables['away_team_streak'] = away_team.get('streak', '')
-
-        # =====================================================================
-        # SPORT AND LEAGUE
-        # For multi-sport groups, use the event's sport/league (detected per-stream)
-        # Fall back to group's assigned values for single-sport groups
-        # =====================================================================
-
-        # Get sport from event first (for multi-sport), then group (for single-sport)
-        sport_code = event.get('sport', '') or group_info.get('assigned_sport', '')
-        sport_display_names = {
-            'basketball': 'Basketball',
-            'football': 'Football',
-            'hockey': 'Hockey',
-            'baseball': 'Baseball',
-            'soccer': 'Soccer'
-        }
-        variables['sport'] = sport_display_names.get(sport_code, sport_code.capitalize())
-
-        # Get league from event first (for multi-sport), then group (for single-sport)
-        # event['league'] contains the ESPN slug (e.g., 'aus.1', 'eng.1', 'nfl')
-        event_league = event.get('league', '') or group_info.get('assigned_league', '')
+            variables[f'{prefix}_record'] = str(record) if record else ''
+
+        # Conference/division (from enrich_with_team_stats)
+        variables[f'{prefix}_college_conference'] = team.get('college_conference', '')
+        variables[f'{prefix}_college_conference_abbrev'] = team.get('college_conference_abbrev', '')
+        variables[f'{prefix}_pro_conference'] = team.get('pro_conference', '')
+        variables[f'{prefix}_pro_conference_abbrev'] = team.get('pro_conference_abbrev', '')
+        variables[f'{prefix}_pro_division'] = team.get('pro_division', '')
+
+        # Rank/seed/streak (from enrich_with_team_stats)
+        variables[f'{prefix}_rank'] = team.get('rank', '')
+        variables[f'{prefix}_seed'] = team.get('seed', '')
+        variables[f'{prefix}_streak'] = team.get('streak', '')
+
+    # =========================================================================
+    # SPORT AND LEAGUE
+    # =========================================================================
+
+    def _sport(self, variables: Dict[str, str]):
+        variables['sport'] = SPORT_DISPLAY_NAMES.get(self.sport_code, self.sport_code.capitalize())
+
+    def _league(self, variables: Dict[str, str]):
+        event_league = self.event_league
 
         # {league_id} - Check aliases table for friendly name, fallback to ESPN slug
         # This ensures consistent output whether from single-sport or multi-sport groups
@@ -211,7 +334,7 @@ class EventTemplateEngine:
         # For US sports: use league_config.league_name (e.g., 'nfl' -> 'NFL')
         league_display_name = ''
         if event_league:
-            if sport_code == 'soccer':
+            if self.sport_code == 'soccer':
                 # Soccer leagues use the soccer cache (240+ leagues)
                 from epg.soccer_multi_league import SoccerMultiLeague
                 league_display_name = SoccerMultiLeague.get_league_name(event_league)
@@ -221,12 +344,14 @@ class EventTemplateEngine:
                 from database import get_connection
                 try:
                     conn = get_connection()
-                    cursor = conn.cursor()
-                    result = cursor.execute(
-                        "SELECT league_name FROM league_config WHERE league_code = ?",
-                        (event_league.lower(),)
-                    ).fetchone()
-                    conn.close()
+                    try:
+                        cursor = conn.cursor()
+                        result = cursor.execute(
+                            "SELECT league_name FROM league_config WHERE league_code = ?",
+                            (event_league.lower(),)
+                        ).fetchone()
+                    finally:
+                        conn.close()
                     if result and result[0]:
                         league_display_name = result[0]
                 except Exception:
@@ -237,39 +362,47 @@ class EventTemplateEngine:
         # {league_name} is the full display name (e.g., "English Premier League")
         variables['league_name'] = league_display_name
 
-        # =====================================================================
-        # DATE & TIME
-        # =====================================================================
+    # =========================================================================
+    # DATE & TIME
+    # =========================================================================
 
-        game_date_str = event.get('date', '')
-        if game_date_str:
-            try:
-                from zoneinfo import ZoneInfo
-                game_datetime = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-                local_datetime = game_datetime.astimezone(ZoneInfo(epg_timezone))
+    def _date_time(self, variables: Dict[str, str]):
+        game_date_str = self.event.get('date', '')
+        if not game_date_str:
+            return
+
+        try:
+            from zoneinfo import ZoneInfo
+            epg_timezone = self.context.get('epg_timezone', 'America/Detroit')
+            time_format_settings = self.context.get('time_format_settings', {})
 
-                variables['game_date'] = local_datetime.strftime('%A, %B %d, %Y')
-                variables['game_date_short'] = local_datetime.strftime('%b %d')
+            game_datetime = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
+            local_datetime = game_datetime.astimezone(ZoneInfo(epg_timezone))
 
-                # Use user's time format preferences for game_time
-                if time_format_settings:
-                    tf, show_tz = get_time_settings(time_format_settings)
-                    variables['game_time'] = fmt_time(local_datetime, tf, show_tz)
-                else:
-                    variables['game_time'] = local_datetime.strftime('%I:%M %p %Z')
+            variables['game_date'] = local_datetime.strftime('%A, %B %d, %Y')
+            variables['game_date_short'] = local_datetime.strftime('%b %d')
 
-                variables['game_day'] = local_datetime.strftime('%A')
-                variables['game_day_short'] = local_datetime.strftime('%a')
-                variables['today_tonight'] = 'tonight' if local_datetime.hour >= 17 else 'today'
-                variables['today_tonight_title'] = 'Tonight' if local_datetime.hour >= 17 else 'Today'
+            # Use user's time format preferences for game_time
+            if time_format_settings:
+                tf, show_tz = get_time_settings(time_format_settings)
+                variables['game_time'] = fmt_time(local_datetime, tf, show_tz)
+            else:
+                variables['game_time'] = local_datetime.strftime('%I:%M %p %Z')
 
-            except Exception as e:
-                logger.debug(f"Could not parse event date: {e}")
+            variables['game_day'] = local_datetime.strftime('%A')
+            variables['game_day_short'] = local_datetime.strftime('%a')
+            variables['today_tonight'] = 'tonight' if local_datetime.hour >= 17 else 'today'
+            variables['today_tonight_title'] = 'Tonight' if local_datetime.hour >= 17 else 'Today'
 
-        # =====================================================================
-        # VENUE
-        # =====================================================================
+        except Exception as e:
+            logger.debug(f"Could not parse event date: {e}")
 
+    # =========================================================================
+    # VENUE
+    # =========================================================================
+
+    def _venue(self, variables: Dict[str, str]):
+        venue = self.event.get('venue', {}) or {}
         venue_name = venue.get('name') or venue.get('fullName', '')
         venue_city = venue.get('city') or venue.get('address', {}).get('city', '')
         venue_state = venue.get('state') or venue.get('address', {}).get('state', '')
@@ -285,86 +418,77 @@ class EventTemplateEngine:
         else:
             variables['venue_full'] = venue_name
 
-        # =====================================================================
-        # SCORES (for completed/live games)
-        # =====================================================================
-
-        home_score_raw = home_team.get('score', 0)
-        away_score_raw = away_team.get('score', 0)
-
-        # Extract numeric score
-        if isinstance(home_score_raw, dict):
-            home_score = int(home_score_raw.get('value', 0) or home_score_raw.get('displayValue', '0') or 0)
-        else:
-            home_score = int(home_score_raw) if home_score_raw else 0
+    # =========================================================================
+    # SCORES & EVENT RESULT (for completed/live games)
+    # =========================================================================
+
+    def _numeric_scores(self) -> Tuple[int, int]:
+        """(home_score, away_score) as ints."""
+        scores = []
+        for team in (self.home_team, self.away_team):
+            raw = team.get('score', 0)
+            if isinstance(raw, dict):
+                scores.append(int(raw.get('value', 0) or raw.get('displayValue', '0') or 0))
+            else:
+                scores.append(int(raw) if raw else 0)
+        return scores[0], scores[1]
 
-        if isinstance(away_score_raw, dict):
-            away_score = int(away_score_raw.get('value', 0) or away_score_raw.get('displayValue', '0') or 0)
-        else:
-            away_score = int(away_score_raw) if away_score_raw else 0
+    def _is_final(self) -> bool:
+        status = self.status
+        return status.get('name', '') in ['STATUS_FINAL', 'Final'] or status.get('state', '') == 'post'
 
+    def _scores(self, variables: Dict[str, str]):
+        home_score, away_score = self._numeric_scores()
         variables['home_team_score'] = str(home_score)
         variables['away_team_score'] = str(away_score)
 
-        # =====================================================================
-        # EVENT RESULT (for completed games)
-        # =====================================================================
-
-        is_final = status.get('name', '') in ['STATUS_FINAL', 'Final'] or status.get('state', '') == 'post'
-
-        if is_final and (home_score > 0 or away_score > 0):
-            # Full result: "Giants 24 - Patriots 17"
-            variables['event_result'] = f"{home_team.get('name', '')} {home_score} - {away_team.get('name', '')} {away_score}"
-            # Abbreviated result: "NYG 24 - NE 17"
-            variables['event_result_abbrev'] = f"{home_team.get('abbrev', '')} {home_score} - {away_team.get('abbrev', '')} {away_score}"
-
-            # Winner/Loser variables
-            if home_score > away_score:
-                variables['winner'] = home_team.get('name', '')
-                variables['winner_abbrev'] = home_team.get('abbrev', '')
-                variables['loser'] = away_team.get('name', '')
-                variables['loser_abbrev'] = away_team.get('abbrev', '')
-            elif away_score > home_score:
-                variables['winner'] = away_team.get('name', '')
-                variables['winner_abbrev'] = away_team.get('abbrev', '')
-                variables['loser'] = home_team.get('name', '')
-                variables['loser_abbrev'] = home_team.get('abbrev', '')
-            else:
-                # Tie
-                variables['winner'] = 'Tie'
-                variables['winner_abbrev'] = 'TIE'
-                variables['loser'] = 'Tie'
-                variables['loser_abbrev'] = 'TIE'
-
-            # Check for overtime - compare periods to regulation threshold per sport
-            periods = status.get('period', 0) or 0
-            overtime_thresholds = {
-                'basketball': 4,  # NBA/NCAAM = 4 quarters/halves
-                'hockey': 3,      # NHL = 3 periods
-                'football': 4,    # NFL/NCAAF = 4 quarters
-                'baseball': 9     # MLB = 9 innings
-            }
-            overtime_threshold = overtime_thresholds.get(sport_code, 4)
-
-            if periods > overtime_threshold:
-                variables['overtime_text'] = 'in overtime'
-            else:
-                variables['overtime_text'] = ''
-        else:
+    def _result(self, variables: Dict[str, str]):
+        home_team, away_team = self.home_team, self.away_team
+        home_score, away_score = self._numeric_scores()
+
+        if not (self._is_final() and (home_score > 0 or away_score > 0)):
             # Game not final - empty results
-            variables['event_result'] = ''
-            variables['event_result_abbrev'] = ''
-            variables['winner'] = ''
-            variables['winner_abbrev'] = ''
-            variables['loser'] = ''
-            variables['loser_abbrev'] = ''
-            variables['overtime_text'] = ''
-
-        # =====================================================================
-        # BROADCAST
-        # =====================================================================
-
-        broadcasts = event.get('broadcasts', [])
+            for var in ('event_result', 'event_result_abbrev', 'winner', 'winner_abbrev',
+                        'loser', 'loser_abbrev', 'overtime_text'):
+                variables[var] = ''
+            return
+
+        # Full result: "Giants 24 - Patriots 17"
+        variables['event_result'] = f"{home_team.get('name', '')} {home_score} - {away_team.get('name', '')} {away_score}"
+        # Abbreviated result: "NYG 24 - NE 17"
+        variables['event_result_abbrev'] = f"{home_team.get('abbrev', '')} {home_score} - {away_team.get('abbrev', '')} {away_score}"
+
+        # Winner/Loser variables
+        if home_score > away_score:
+            winner, loser = home_team, away_team
+        elif away_score > home_score:
+            winner, loser = away_team, home_team
+        else:
+            winner = loser = None
+
+        if winner is not None:
+            variables['winner'] = winner.get('name', '')
+            variables['winner_abbrev'] = winner.get('abbrev', '')
+            variables['loser'] = loser.get('name', '')
+            variables['loser_abbrev'] = loser.get('abbrev', '')
+        else:
+            # Tie
+            variables['winner'] = 'Tie'
+            variables['winner_abbrev'] = 'TIE'
+            variables['loser'] = 'Tie'
+            variables['loser_abbrev'] = 'TIE'
+
+        # Check for overtime - compare periods to regulation threshold per sport
+        periods = self.status.get('period', 0) or 0
+        overtime_threshold = OVERTIME_THRESHOLDS.get(self.sport_code, 4)
+        variables['overtime_text'] = 'in overtime' if periods > overtime_threshold else ''
+
+    # =========================================================================
+    # BROADCAST, STATUS, ODDS, WEATHER
+    # =========================================================================
+
+    def _broadcast(self, variables: Dict[str, str]):
+        broadcasts = self.event.get('broadcasts', [])
         if broadcasts:
             # Filter out None values and get network names
             broadcast_names = [b for b in broadcasts if b is not None]
@@ -374,19 +498,13 @@ class EventTemplateEngine:
             variables['broadcast_simple'] = ''
             variables['broadcast_network'] = ''
 
-        # =====================================================================
-        # STATUS
-        # =====================================================================
-
-        variables['status_detail'] = status.get('detail', '')
-        variables['status_state'] = status.get('state', 'pre')
-        variables['is_final'] = 'true' if is_final else 'false'
-
-        # =====================================================================
-        # ODDS
-        # =====================================================================
+    def _status(self, variables: Dict[str, str]):
+        variables['status_detail'] = self.status.get('detail', '')
+        variables['status_state'] = self.status.get('state', 'pre')
+        variables['is_final'] = 'true' if self._is_final() else 'false'
 
-        odds = event.get('odds', {}) or {}
+    def _odds(self, variables: Dict[str, str]):
+        odds = self.event.get('odds', {}) or {}
         variables['odds_spread'] = str(odds.get('spread', '')) if odds.get('spread') else ''
         variables['odds_over_under'] = str(odds.get('over_under', '')) if odds.get('over_under') else ''
         variables['odds_provider'] = odds.get('provider', '') or ''
@@ -399,17 +517,17 @@ class EventTemplateEngine:
         variables['odds_opponent_moneyline'] = str(away_ml) if away_ml else ''
         variables['odds_opponent_spread'] = ''  # Not available in current data extraction
 
-        # =====================================================================
-        # WEATHER (outdoor venues)
-        # =====================================================================
-
-        weather = event.get('weather', {}) or {}
+    def _weather(self, variables: Dict[str, str]):
+        # Outdoor venues only
+        weather = self.event.get('weather', {}) or {}
         variables['weather'] = weather.get('display', '')
 
-        # =====================================================================
-        # STREAM INFO
-        # =====================================================================
+    # =========================================================================
+    # STREAM INFO & EXCEPTION KEYWORD
+    # =========================================================================
 
+    def _stream(self, variables: Dict[str, str]):
+        stream, event = self.stream, self.event
         variables['stream_name'] = stream.get('name', '')
         variables['stream_id'] = str(stream.get('id', ''))
 
@@ -420,59 +538,13 @@ class EventTemplateEngine:
         else:
             variables['channel_id'] = stream.get('tvg_id') or f"event-{stream.get('id', 'unknown')}"
 
-        # =====================================================================
-        # EXCEPTION KEYWORD (for sub-consolidation)
-        # =====================================================================
-
-        exception_keyword = context.get('exception_keyword', '')
+    def _exception_keyword(self, variables: Dict[str, str]):
+        # For sub-consolidation
+        exception_keyword = self.context.get('exception_keyword', '')
         variables['exception_keyword'] = exception_keyword or ''
         # Title case version for display (e.g., "Prime Vision")
         variables['exception_keyword_title'] = exception_keyword.title() if exception_keyword else ''
 
-        return variables
-
-    def select_description(self, description_options: Any, context: Dict[str, Any]) -> str:
-        """
-        Select the best description template based on conditional logic.
-
-        Simplified version for events - mainly uses fallback descriptions
-        since events don't have the same complex conditions as team channels.
-
-        Args:
-            description_options: JSON string or list of description options
-            context: Event context for evaluation
-
-        Returns:
-            Selected description template string
-        """
-        # Parse description_options if it's a JSON string
-        if isinstance(description_options, str):
-            try:
-                options = json.loads(description_options) if description_options else []
-            except:
-                return ''
-        elif isinstance(description_options, list):
-            options = description_options
-        else:
-            return ''
-
-        if not options:
-            return ''
-
-        # For events, prioritize by priority value (lower = higher priority)
-        # Filter to options that have templates
-        valid_options = [opt for opt in options if opt.get('template')]
-
-        if not valid_options:
-            return ''
-
-        # Sort by priority (default 50 if not specified)
-        valid_options.sort(key=lambda x: x.get('priority', 50))
-
-        # For now, just return the highest priority template
-        # Future: Add condition evaluation for event-specific conditions
-        return valid_options[0]['template']
-
 
 def build_event_context(
     event: Dict,
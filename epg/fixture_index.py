@@ -0,0 +1,122 @@
+"""
+Fixture Index - "who plays whom when" over already fetched ESPN data
+
+Multi-sport disambiguation tries every candidate league for a matchup:
+regex team extraction per league, then a scoreboard search and a schedule
+fetch per league. Most candidate leagues have no game between the two
+teams, and the scoreboards and schedules that prove it have often been
+fetched already (by single-league groups, by an earlier stream of the same
+matchup, or by the detector's own schedule search).
+
+FixtureIndex answers "do these two teams play in the window?" from the
+ESPNClient's per-generation caches only (scoreboard indexes and team
+schedules), never fetching:
+
+    True   a fetched scoreboard or schedule lists a game between them
+    False  every scoreboard day of the window and both teams' schedules
+           have been fetched, and none lists one - the same sources
+           EventMatcher.find_event() searches (scoreboard, then schedule
+           fallback), so find_event() could not find a game either
+    None   not enough has been fetched to tell
+
+Callers skip the game search for (team IDs, league) pairs that answer
+False; None keeps the full search. The IDs must be the ones the search
+itself would use (extracted or resolved team IDs), so skipping never
+changes the result.
+
+Usage:
+    fixtures = FixtureIndex(espn_client, lookahead_days=7)
+    fixtures.has_fixture('basketball', 'nba', '8', '5')
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional
+from zoneinfo import ZoneInfo
+
+from epg.schedule_index import parse_event_datetime
+
+
+class FixtureIndex:
+    """
+    Read-only fixture lookups over ESPNClient's per-generation caches.
+
+    Holds no data of its own, so it's always in step with the caches (which
+    are cleared at the start of each generation) and safe to share.
+    """
+
+    # Days before now the matchers search (EventMatcher.SEARCH_DAYS_BACK)
+    DAYS_BACK = 1
+
+    def __init__(self, espn_client, lookahead_days: int = 7):
+        self.espn = espn_client
+        self.lookahead_days = lookahead_days
+
+    def scoreboard_dates(self, now: datetime) -> List[str]:
+        """Scoreboard dates (YYYYMMDD) the matchers check for the window"""
+        return [
+            (now + timedelta(days=day_offset)).strftime('%Y%m%d')
+            for day_offset in range(-self.DAYS_BACK, self.lookahead_days)
+        ]
+
+    def has_fixture(
+        self,
+        sport: str,
+        api_league: str,
+        team1_id: str,
+        team2_id: str,
+        now: datetime = None
+    ) -> Optional[bool]:
+        """
+        Whether two teams play each other in the search window.
+
+        Args:
+            sport: Sport for API calls (e.g., 'basketball')
+            api_league: League for API calls (e.g., 'nba', 'eng.1')
+            team1_id: ESPN team ID
+            team2_id: ESPN team ID
+            now: Reference time (defaults to now, UTC)
+
+        Returns:
+            True / False / None (unknown) - see module docstring
+        """
+        if not team1_id or not team2_id:
+            return None
+
+        if now is None:
+            now = datetime.now(ZoneInfo('UTC'))
+
+        all_fetched = True
+        for date_str in self.scoreboard_dates(now):
+            scoreboard_index = self.espn.peek_scoreboard_index(sport, api_league, date_str)
+            if scoreboard_index is None:
+                all_fetched = False
+            elif scoreboard_index.events_between(team1_id, team2_id):
+                return True
+
+        # Schedules list games scoreboards don't (D2/D3/NAIA, exhibitions)
+        window_start = now - timedelta(days=self.DAYS_BACK)
+        window_end = now + timedelta(days=self.lookahead_days)
+        for team_id, opponent_id in ((team1_id, team2_id), (team2_id, team1_id)):
+            schedule = self.espn.peek_team_schedule(sport, api_league, team_id)
+            if not schedule or 'events' not in schedule:
+                all_fetched = False
+            elif self._schedule_has_game(schedule, str(opponent_id), window_start, window_end):
+                return True
+
+        return False if all_fetched else None
+
+    @staticmethod
+    def _schedule_has_game(schedule: dict, opponent_id: str, window_start: datetime, window_end: datetime) -> bool:
+        """Whether a schedule lists a game against the opponent inside the window"""
+        for event in schedule.get('events') or []:
+            event_dt = parse_event_datetime(event)
+            if event_dt is None or event_dt < window_start or event_dt > window_end:
+                continue
+            try:
+                competitors = event.get('competitions', [{}])[0].get('competitors', [])
+            except (IndexError, AttributeError):
+                continue
+            for c in competitors:
+                if str(c.get('team', {}).get('id', c.get('id'))) == opponent_id:
+                    return True
+        return False
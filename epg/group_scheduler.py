@@ -0,0 +1,208 @@
+"""
+Dependency-Aware Event Group Scheduler
+
+Runs the event groups of one EPG generation in parallel while keeping the
+ordering guarantees the old sequential loop gave:
+
+- Child groups add streams to their parent's channels, so a child waits
+  for its parent group to finish.
+- Multi-sport groups skip events already owned by other groups
+  (overlap_handling='consolidate'), so they wait for every single-league
+  group in one of their leagues, and for multi-sport groups listed before
+  them (first group wins, as before).
+- Independent single-league parents have no ordering and run concurrently.
+
+A group whose dependency failed still runs (the sequential loop didn't stop
+either); dependencies only order the work.
+
+Groups can also be gated on external work via Futures (e.g. their M3U
+account's refresh from M3URefreshTracker): a gated group becomes ready once
+its gate resolves, so groups on finished accounts start while other
+accounts are still refreshing.
+
+Usage:
+    scheduler = GroupScheduler(groups, max_workers=4)
+    scheduler.run(process_group, on_complete=handle_result)
+"""
+
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Groups processed at once. Each group already fans its streams out over
+# up to 100 threads, and ESPN requests are capped globally, so a handful of
+# groups is enough to overlap one group's M3U/DB/XML work with another's matching.
+DEFAULT_MAX_PARALLEL_GROUPS = 4
+
+
+def _group_leagues(group: Dict) -> Optional[Set[str]]:
+    """
+    Leagues a multi-sport group checks, or None if it may check any league.
+
+    'soccer_all' (every cached soccer league) and unparseable settings are
+    treated as "any league" so the group waits for all single-league groups.
+    """
+    try:
+        raw_leagues = json.loads(group.get('enabled_leagues') or '[]')
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+    if not raw_leagues or 'soccer_all' in raw_leagues:
+        return None
+
+    from database import normalize_league_codes
+    return {l.lower() for l in normalize_league_codes(raw_leagues)}
+
+
+def build_group_dependencies(groups: List[Dict]) -> Dict[int, Set[int]]:
+    """
+    Map each group ID to the IDs of groups that must finish before it starts.
+
+    Only dependencies on groups in `groups` are recorded (a child whose
+    parent is disabled runs unconstrained).
+
+    Args:
+        groups: Event group dicts (as returned by get_all_event_epg_groups)
+
+    Returns:
+        Dict of group_id -> set of prerequisite group_ids
+    """
+    from database import normalize_league_code
+
+    group_ids = {g['id'] for g in groups}
+    single_league = [g for g in groups if not g.get('is_multi_sport')]
+
+    # Single-league groups by normalized league
+    by_league: Dict[str, Set[int]] = {}
+    for g in single_league:
+        if g.get('assigned_league'):
+            league = normalize_league_code(g['assigned_league']).lower()
+            by_league.setdefault(league, set()).add(g['id'])
+
+    deps: Dict[int, Set[int]] = {g['id']: set() for g in groups}
+    earlier_multi_sport: List[int] = []
+
+    for g in groups:
+        parent_id = g.get('parent_group_id')
+        if parent_id and parent_id in group_ids:
+            deps[g['id']].add(parent_id)
+
+        if g.get('is_multi_sport'):
+            leagues = _group_leagues(g)
+            if leagues is None:
+                deps[g['id']].update(s['id'] for s in single_league)
+            else:
+                for league in leagues:
+                    deps[g['id']].update(by_league.get(league, ()))
+            deps[g['id']].update(earlier_multi_sport)
+            earlier_multi_sport.append(g['id'])
+
+    return deps
+
+
+class GroupScheduler:
+    """
+    Runs event groups on a bounded thread pool in dependency order.
+
+    Groups become ready when all their prerequisites have completed; among
+    ready groups the input order is kept, so with max_workers=1 the run is
+    identical to the old sequential loop.
+    """
+
+    def __init__(
+        self,
+        groups: List[Dict],
+        max_workers: int = DEFAULT_MAX_PARALLEL_GROUPS,
+        gates: Optional[Dict[int, Future]] = None
+    ):
+        """
+        Args:
+            groups: Event groups in preferred processing order
+            max_workers: Maximum number of groups processed at once
+            gates: Optional group_id -> Future; the group doesn't start until its
+                   Future is done (its result/exception is ignored)
+        """
+        self.groups = list(groups)
+        self.max_workers = max(1, max_workers)
+        self.dependencies = build_group_dependencies(self.groups)
+        self.gates = gates or {}
+
+    def run(
+        self,
+        process: Callable[[Dict], Any],
+        on_start: Optional[Callable[[Dict], None]] = None,
+        on_complete: Optional[Callable[[Dict, Any, Optional[str]], None]] = None
+    ) -> List[tuple]:
+        """
+        Process all groups.
+
+        `process` runs on worker threads. `on_start` and `on_complete` run on
+        the calling thread, one at a time, so they can update shared stats
+        without locking.
+
+        Args:
+            process: Callable(group) -> result
+            on_start: Optional callable(group) invoked when a group is submitted
+            on_complete: Optional callable(group, result, error) invoked as
+                         each group finishes (error is a string if process raised)
+
+        Returns:
+            List of (group, result, error) tuples in completion order
+        """
+        remaining = {g['id']: set(self.dependencies[g['id']]) for g in self.groups}
+        pending = list(self.groups)
+        running = {}
+        results = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='event-group') as executor:
+            while pending or running:
+                # Submit ready groups in input order, up to the worker budget
+                for group in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    if remaining[group['id']]:
+                        continue
+                    gate = self.gates.get(group['id'])
+                    if gate is not None and not gate.done():
+                        continue
+                    pending.remove(group)
+                    if on_start:
+                        on_start(group)
+                    running[executor.submit(process, group)] = group
+
+                closed_gates = {
+                    self.gates[g['id']] for g in pending
+                    if g['id'] in self.gates and not self.gates[g['id']].done()
+                }
+
+                if not running and not closed_gates:
+                    # Only possible with a dependency cycle - run the rest unconstrained
+                    logger.warning(f"Group dependency cycle detected, releasing {len(pending)} group(s)")
+                    for group in pending:
+                        remaining[group['id']].clear()
+                    continue
+
+                # Wake when a group finishes or a gate opens
+                done, _ = wait(set(running) | closed_gates, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future not in running:
+                        continue
+                    group = running.pop(future)
+                    try:
+                        result, error = future.result(), None
+                    except Exception as e:
+                        logger.warning(f"Error refreshing event group '{group.get('group_name')}': {e}")
+                        result, error = None, str(e)
+
+                    for prerequisites in remaining.values():
+                        prerequisites.discard(group['id'])
+
+                    results.append((group, result, error))
+                    if on_complete:
+                        on_complete(group, result, error)
+
+        return results
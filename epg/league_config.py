@@ -52,12 +52,14 @@ def get_league_config(
     if db_connection_func:
         try:
             conn = db_connection_func()
-            cursor = conn.cursor()
-            result = cursor.execute(
-                "SELECT sport, api_path FROM league_config WHERE league_code = ?",
-                (league_lower,)
-            ).fetchone()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                result = cursor.execute(
+                    "SELECT sport, api_path FROM league_config WHERE league_code = ?",
+                    (league_lower,)
+                ).fetchone()
+            finally:
+                conn.close()
 
             if result:
                 config = {'sport': result[0], 'api_path': result[1]}
@@ -122,12 +124,15 @@ def is_soccer_league(league_code: str) -> bool:
     try:
         from database import get_connection
         conn = get_connection()
-        cursor = conn.execute(
-            "SELECT 1 FROM soccer_team_leagues WHERE league_slug = ? LIMIT 1",
-            (league_lower,)
-        )
-        if cursor.fetchone():
-            return True
+        try:
+            cursor = conn.execute(
+                "SELECT 1 FROM soccer_team_leagues WHERE league_slug = ? LIMIT 1",
+                (league_lower,)
+            )
+            if cursor.fetchone():
+                return True
+        finally:
+            conn.close()
     except Exception:
         pass
 
@@ -273,6 +273,65 @@ SPORT_INDICATORS = {
     r'\bSoccer\b': ['ncaas', 'ncaaws'],  # NCAA soccer handled like other college sports
 }
 
+
+class IndicatorMatcher:
+    """
+    Single-pass matcher for an ordered {pattern: value} indicator dict.
+
+    Gives the same answer as trying each pattern in dict order with
+    re.search() and taking the first one that matches anywhere, but scans
+    the text once. All patterns are combined into one alternation inside a
+    lookahead, so every start position reports the first pattern matching
+    there (without consuming text, so overlapping matches aren't hidden),
+    and the lowest-ordered pattern reported wins.
+
+    Python's re tries every alternative at every position, so a leading \\b
+    shared by all patterns is hoisted out and positions are gated on the
+    patterns' possible first characters before the alternation is tried.
+    """
+
+    def __init__(self, indicators: Dict[str, Any], flags: int = re.IGNORECASE):
+        self._entries = list(indicators.items())
+
+        patterns = list(indicators)
+        prefix = ''
+        if patterns and all(pattern.startswith(r'\b') for pattern in patterns):
+            patterns = [pattern[2:] for pattern in patterns]
+            prefix = r'\b'
+            # Gate only when every pattern starts with a required literal character
+            if all(pattern[:1].isalnum() and pattern[1:2] not in ('?', '*', '{') for pattern in patterns):
+                first_chars = ''.join(sorted({pattern[0] for pattern in patterns}))
+                prefix += f'(?=[{first_chars}])'
+
+        alternation = '|'.join(f'(?P<i{n}>{pattern})' for n, pattern in enumerate(patterns))
+        self._regex = re.compile(f'{prefix}(?=(?:{alternation}))', flags)
+
+    def search(self, text: str) -> Optional[Tuple[str, Any]]:
+        """
+        Find the first indicator (in dict order) present in the text.
+
+        Args:
+            text: Text to search (e.g., stream name)
+
+        Returns:
+            (pattern, value) of the matched indicator, or None
+        """
+        best = None
+        for match in self._regex.finditer(text):
+            n = int(match.lastgroup[1:])
+            if best is None or n < best:
+                best = n
+                if n == 0:
+                    break
+        return None if best is None else self._entries[best]
+
+
+# Compiled once per process. Only the patterns are baked in: league alias
+# normalization and league -> sport lookups stay live lookups, so changes
+# to league_config or league aliases need no rebuild.
+LEAGUE_INDICATOR_MATCHER = IndicatorMatcher(LEAGUE_INDICATORS)
+SPORT_INDICATOR_MATCHER = IndicatorMatcher(SPORT_INDICATORS)
+
 # =============================================================================
 # LEAGUE TO SPORT MAPPING - Single source of truth: league_config table
 # =============================================================================
@@ -300,11 +359,13 @@ def _load_league_to_sport_cache() -> Dict[str, str]:
     try:
         from database import get_connection
         conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT league_code, sport FROM league_config")
-        for row in cursor.fetchall():
-            _LEAGUE_TO_SPORT_CACHE[row[0]] = row[1]
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT league_code, sport FROM league_config")
+            for row in cursor.fetchall():
+                _LEAGUE_TO_SPORT_CACHE[row[0]] = row[1]
+        finally:
+            conn.close()
         _LEAGUE_TO_SPORT_LOADED = True
         logger.debug(f"Loaded {len(_LEAGUE_TO_SPORT_CACHE)} leagues from league_config")
     except Exception as e:
@@ -473,23 +534,20 @@ class LeagueDetector:
         self.espn = espn_client
         self.lookahead_days = lookahead_days
 
+        # league code -> (sport, api_league), or None if the league is unknown.
+        # Resolved once per detector instead of per schedule search.
+        self._league_api_paths: Dict[str, Optional[Tuple[str, str]]] = {}
+
+        # Fixture lookups over already fetched scoreboards/schedules
+        from epg.fixture_index import FixtureIndex
+        self.fixtures = FixtureIndex(espn_client, lookahead_days)
+
         # Default to all non-soccer leagues if not specified
         if enabled_leagues is None:
             self.enabled_leagues = list(LEAGUE_TO_SPORT.keys())
         else:
             self.enabled_leagues = [l for l in enabled_leagues if l in LEAGUE_TO_SPORT]
 
-        # Pre-compile league indicator patterns
-        self._league_patterns = [
-            (re.compile(pattern, re.IGNORECASE), league)
-            for pattern, league in LEAGUE_INDICATORS.items()
-        ]
-
-        # Pre-compile sport indicator patterns
-        self._sport_patterns = [
-            (re.compile(pattern, re.IGNORECASE), leagues)
-            for pattern, leagues in SPORT_INDICATORS.items()
-        ]
 
     def is_league_enabled(self, league: str) -> bool:
         """Check if a league is in the enabled list for this detector."""
@@ -1268,17 +1326,13 @@ class LeagueDetector:
 
         IMPORTANT: Only returns success if an event_id is found!
         """
-        detected_league = None
-
-        for pattern, league in self._league_patterns:
-            if pattern.search(stream_name):
-                # Found a league indicator - use it (don't filter by enabled)
-                detected_league = league
-                break
-
-        if not detected_league:
+        indicator = LEAGUE_INDICATOR_MATCHER.search(stream_name)
+        if not indicator:
             return DetectionResult(detected=False)
 
+        # Found a league indicator - use it (don't filter by enabled)
+        detected_league = indicator[1]
+
         # Validate teams exist in this league
         if team1 and team2:
             candidates = self.find_candidate_leagues(team1, team2)
@@ -1358,12 +1412,11 @@ class LeagueDetector:
         detected_sport = None
         sport_leagues = []
 
-        for pattern, leagues in self._sport_patterns:
-            if pattern.search(stream_name):
-                detected_sport = pattern.pattern.strip(r'\b')
-                # Don't filter by enabled - search all leagues for this sport
-                sport_leagues = leagues
-                break
+        indicator = SPORT_INDICATOR_MATCHER.search(stream_name)
+        if indicator:
+            detected_sport = indicator[0].strip(r'\b')
+            # Don't filter by enabled - search all leagues for this sport
+            sport_leagues = indicator[1]
 
         if not sport_leagues:
             return DetectionResult(detected=False)
@@ -1782,40 +1835,41 @@ class LeagueDetector:
             )
 
         conn = get_connection()
-        cursor = conn.cursor()
-
-        # Find all (team_id, league_code, team_name) entries for each raw team
-        team1_entries = []
-        team2_entries = []
+        try:
+            cursor = conn.cursor()
 
-        for team_name, entries_list in [(team1, team1_entries), (team2, team2_entries)]:
-            variants = get_abbreviation_variants(team_name)
-            for variant in variants:
-                # Check US sports cache - search team_name, team_abbrev, and team_short_name
-                cursor.execute("""
-                    SELECT espn_team_id, league_code, team_name
-                    FROM team_league_cache
-                    WHERE LOWER(team_name) LIKE ?
-                       OR LOWER(team_abbrev) LIKE ?
-                       OR LOWER(team_short_name) LIKE ?
-                """, (f'%{variant}%', f'%{variant}%', f'%{variant}%'))
-                for row in cursor.fetchall():
-                    entry = (row[0], row[1], row[2], 'us_sports')
-                    if entry not in entries_list:
-                        entries_list.append(entry)
+            # Find all (team_id, league_code, team_name) entries for each raw team
+            team1_entries = []
+            team2_entries = []
 
-                # Check soccer cache
-                cursor.execute("""
-                    SELECT espn_team_id, league_slug, team_name
-                    FROM soccer_team_leagues
-                    WHERE LOWER(team_name) LIKE ?
-                """, (f'%{variant}%',))
-                for row in cursor.fetchall():
-                    entry = (row[0], row[1], row[2], 'soccer')
-                    if entry not in entries_list:
-                        entries_list.append(entry)
+            for team_name, entries_list in [(team1, team1_entries), (team2, team2_entries)]:
+                variants = get_abbreviation_variants(team_name)
+                for variant in variants:
+                    # Check US sports cache - search team_name, team_abbrev, and team_short_name
+                    cursor.execute("""
+                        SELECT espn_team_id, league_code, team_name
+                        FROM team_league_cache
+                        WHERE LOWER(team_name) LIKE ?
+                           OR LOWER(team_abbrev) LIKE ?
+                           OR LOWER(team_short_name) LIKE ?
+                    """, (f'%{variant}%', f'%{variant}%', f'%{variant}%'))
+                    for row in cursor.fetchall():
+                        entry = (row[0], row[1], row[2], 'us_sports')
+                        if entry not in entries_list:
+                            entries_list.append(entry)
 
-        conn.close()
+                    # Check soccer cache
+                    cursor.execute("""
+                        SELECT espn_team_id, league_slug, team_name
+                        FROM soccer_team_leagues
+                        WHERE LOWER(team_name) LIKE ?
+                    """, (f'%{variant}%',))
+                    for row in cursor.fetchall():
+                        entry = (row[0], row[1], row[2], 'soccer')
+                        if entry not in entries_list:
+                            entries_list.append(entry)
+        finally:
+            conn.close()
 
         # Determine tier based on what we found
         if team1_entries and team2_entries:
@@ -1995,13 +2049,15 @@ class LeagueDetector:
                 # Fallback for soccer leagues not in league_config but in soccer cache
                 # (e.g., eng.fa, esp.copa_del_rey, etc.)
                 conn_check = get_connection()
-                cursor_check = conn_check.cursor()
-                cursor_check.execute(
-                    "SELECT 1 FROM soccer_leagues_cache WHERE league_slug = ?",
-                    (league_code,)
-                )
-                is_soccer = cursor_check.fetchone() is not None
-                conn_check.close()
+                try:
+                    cursor_check = conn_check.cursor()
+                    cursor_check.execute(
+                        "SELECT 1 FROM soccer_leagues_cache WHERE league_slug = ?",
+                        (league_code,)
+                    )
+                    is_soccer = cursor_check.fetchone() is not None
+                finally:
+                    conn_check.close()
 
                 if is_soccer:
                     sport = 'soccer'
@@ -2099,26 +2155,18 @@ class LeagueDetector:
             check_date = now + timedelta(days=day_offset)
             date_str = check_date.strftime('%Y%m%d')
 
-            # Use cached scoreboard fetch (from ESPNClient class-level cache)
-            scoreboard = self.espn.get_scoreboard(sport, api_league, date_str)
-            if not scoreboard or 'events' not in scoreboard:
+            # Use cached scoreboard index (from ESPNClient class-level cache)
+            scoreboard_index = self.espn.get_scoreboard_index(sport, api_league, date_str)
+            if not scoreboard_index:
                 continue
 
-            for event in scoreboard.get('events', []):
-                competitions = event.get('competitions', [])
-                if not competitions:
-                    continue
-
-                competitors = competitions[0].get('competitors', [])
-                if len(competitors) != 2:
-                    continue
-
-                # Check if our known team is in this game
-                team_ids_in_game = [str(c.get('team', {}).get('id', '')) for c in competitors]
-                if team_id not in team_ids_in_game:
+            # Games our known team plays that day
+            for ref in scoreboard_index.events_for_team(team_id):
+                if ref.competitor_count != 2:
                     continue
 
                 # Known team is in this game - check if opponent name matches
+                event = ref.event
                 event_name = event.get('name', '')
                 event_name_lower = event_name.lower()
 
@@ -2126,13 +2174,8 @@ class LeagueDetector:
                     continue
 
                 # Found a match!
-                event_date_str = event.get('date', '')
-                if not event_date_str:
-                    continue
-
-                try:
-                    event_dt = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
-                except Exception:
+                event_dt = ref.start
+                if event_dt is None:
                     continue
 
                 # Check if within window
@@ -2275,21 +2318,13 @@ class LeagueDetector:
             date_str = check_date.strftime('%Y%m%d')
 
             try:
-                scoreboard_data = self.espn.get_scoreboard(sport, api_league, date_str)
-                if not scoreboard_data or 'events' not in scoreboard_data:
+                scoreboard_index = self.espn.get_scoreboard_index(sport, api_league, date_str)
+                if not scoreboard_index:
                     continue
 
-                for sb_event in scoreboard_data.get('events', []):
-                    competitions = sb_event.get('competitions', [])
-                    if not competitions:
-                        continue
-
-                    competitors = competitions[0].get('competitors', [])
-                    team_ids_in_event = {str(c.get('team', {}).get('id', '')) for c in competitors}
-
-                    if str(team1_id) in team_ids_in_event and str(team2_id) in team_ids_in_event:
-                        candidate_events.append(sb_event)
-                        logger.debug(f"Soccer scoreboard match: {sb_event.get('name')} on {sb_event.get('date')}")
+                for sb_event in scoreboard_index.events_between(team1_id, team2_id):
+                    candidate_events.append(sb_event)
+                    logger.debug(f"Soccer scoreboard match: {sb_event.get('name')} on {sb_event.get('date')}")
 
             except Exception as e:
                 logger.debug(f"Error fetching scoreboard for {api_league} on {date_str}: {e}")
@@ -2297,6 +2332,50 @@ class LeagueDetector:
 
         return candidate_events
 
+    def _get_league_api_path(self, league: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolve a league code to (sport, api_league) for ESPN API calls.
+
+        Looks up league_config first; soccer leagues that are only in
+        soccer_leagues_cache use "soccer/{league_slug}". Memoized per detector.
+
+        Args:
+            league: League code or soccer league slug
+
+        Returns:
+            (sport, api_league), or None if the league is unknown
+        """
+        if league in self._league_api_paths:
+            return self._league_api_paths[league]
+
+        from database import get_connection
+        from epg.league_config import get_league_config, parse_api_path
+
+        api_path = None
+        config = get_league_config(league, get_connection)
+        if config:
+            sport, api_league = parse_api_path(config['api_path'])
+            if sport:
+                api_path = (sport, api_league)
+        else:
+            # Fallback for soccer leagues not in league_config but in soccer cache
+            # ESPN soccer API path is simply "soccer/{league_slug}"
+            conn_check = get_connection()
+            try:
+                is_soccer = conn_check.execute(
+                    "SELECT 1 FROM soccer_leagues_cache WHERE league_slug = ?",
+                    (league,)
+                ).fetchone() is not None
+            finally:
+                conn_check.close()
+
+            if is_soccer:
+                api_path = ('soccer', league)
+                logger.debug(f"Using soccer fallback for league {league}")
+
+        self._league_api_paths[league] = api_path
+        return api_path
+
     def _search_schedules(
         self,
         team1_name: str,
@@ -2318,7 +2397,6 @@ class LeagueDetector:
         Returns:
             List of ScheduleMatch objects
         """
-        from epg.league_config import get_league_config, parse_api_path
         from epg.team_league_cache import TeamLeagueCache
 
         matches = []
@@ -2328,31 +2406,10 @@ class LeagueDetector:
 
         for league in candidates:
             try:
-                from database import get_connection
-                config = get_league_config(league, get_connection)
-                if config:
-                    sport, api_league = parse_api_path(config['api_path'])
-                    if not sport:
-                        continue
-                else:
-                    # Fallback for soccer leagues not in league_config but in soccer cache
-                    # ESPN soccer API path is simply "soccer/{league_slug}"
-                    from database import get_connection
-                    conn_check = get_connection()
-                    cursor_check = conn_check.cursor()
-                    cursor_check.execute(
-                        "SELECT 1 FROM soccer_leagues_cache WHERE league_slug = ?",
-                        (league,)
-                    )
-                    is_soccer = cursor_check.fetchone() is not None
-                    conn_check.close()
-
-                    if is_soccer:
-                        sport = 'soccer'
-                        api_league = league
-                        logger.debug(f"Using soccer fallback for league {league}")
-                    else:
-                        continue
+                api_path = self._get_league_api_path(league)
+                if not api_path:
+                    continue
+                sport, api_league = api_path
 
                 # Resolve team IDs for THIS specific league
                 # Critical: same team name can have different IDs in different leagues
@@ -2378,6 +2435,12 @@ class LeagueDetector:
                         logger.debug(f"Could not resolve team2 '{team2_name}' in {league}")
                         continue
 
+                # Skip the scoreboard scan and schedule fetch when the already
+                # fetched scoreboards/schedules show no game between the teams
+                if self.fixtures.has_fixture(sport, api_league, team1_id, team2_id, now) is False:
+                    logger.debug(f"No {team1_id} vs {team2_id} fixture in {league}, skipping schedule search")
+                    continue
+
                 # Collect events from both schedule AND scoreboard
                 # Schedule API has future games, but some events (NCAA tournaments)
                 # only appear on scoreboard. Fetch scoreboard for multiple days.
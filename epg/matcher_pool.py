@@ -0,0 +1,164 @@
+"""
+Shared Matcher Pool for Event Group Processing
+
+Holds one set of matcher instances that all worker threads of an event
+group refresh (or a whole EPG generation) share, instead of building a
+TeamMatcher / EventMatcher / EventEnricher / LeagueDetector per stream.
+
+The matchers are safe to share:
+- TeamMatcher team lists live in the module-level _shared_team_cache (locked)
+- EventMatcher / EventEnricher scoreboard caches use double-checked locking
+- League config caches are plain dicts filled with idempotent values
+- LeagueDetector only holds compiled patterns after construction
+
+Per-league data (team search names, league config) is built once via
+prepare_leagues() rather than lazily by whichever thread gets there first.
+
+Usage:
+    pool = MatcherPool(lookahead_days=7)
+    pool.prepare_leagues(['nfl', 'nba'])
+
+    # In worker threads
+    team_result = pool.team_matcher.extract_teams(stream_name, 'nfl')
+    event_result = pool.event_matcher.find_and_enrich(...)
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MatcherPool:
+    """
+    Thread-safe, reusable matcher instances for one EPG generation.
+
+    All matchers share a single ESPNClient (and therefore its HTTP session
+    and class-level response caches).
+    """
+
+    def __init__(
+        self,
+        lookahead_days: int = None,
+        espn_client=None,
+        db_connection_func: Optional[Callable] = None,
+        settings=None
+    ):
+        """
+        Initialize MatcherPool.
+
+        Args:
+            lookahead_days: How many days ahead EventMatcher searches for events
+            espn_client: ESPNClient to share (created if not provided)
+            db_connection_func: Function that returns a DB connection
+                               (defaults to database.get_connection)
+            settings: SettingsSnapshot of the generation, shared by the matchers
+                      (defaults to the current shared snapshot)
+        """
+        from epg.team_matcher import TeamMatcher
+        from epg.event_matcher import EventMatcher
+        from epg.event_enricher import EventEnricher
+
+        if espn_client is None:
+            from api.espn_client import ESPNClient
+            espn_client = ESPNClient()
+        if db_connection_func is None:
+            from database import get_connection
+            db_connection_func = get_connection
+
+        self.espn = espn_client
+        self.db_connection_func = db_connection_func
+        self.lookahead_days = lookahead_days
+        self.settings = settings
+
+        self.team_matcher = TeamMatcher(espn_client, db_connection_func=db_connection_func)
+        self.enricher = EventEnricher(espn_client, db_connection_func=db_connection_func)
+        self.event_matcher = EventMatcher(
+            espn_client,
+            db_connection_func=db_connection_func,
+            lookahead_days=lookahead_days,
+            enricher=self.enricher,
+            settings=settings
+        )
+
+        # LeagueDetectors keyed by their enabled league set
+        self._league_detectors: Dict[Tuple[str, ...], object] = {}
+        self._league_detectors_lock = threading.Lock()
+
+        # (league, load_teams) pairs already prepared
+        self._prepared = set()
+        self._prepare_lock = threading.Lock()
+
+    def get_league_detector(self, enabled_leagues: Optional[List[str]] = None):
+        """
+        Get a shared LeagueDetector for a set of enabled leagues.
+
+        Indicator patterns are compiled once per distinct league set.
+
+        Args:
+            enabled_leagues: League codes to consider (None = all non-soccer)
+
+        Returns:
+            LeagueDetector instance
+        """
+        from epg.league_detector import LeagueDetector
+
+        key = tuple(sorted(enabled_leagues)) if enabled_leagues is not None else ('*',)
+
+        detector = self._league_detectors.get(key)
+        if detector is not None:
+            return detector
+
+        with self._league_detectors_lock:
+            detector = self._league_detectors.get(key)
+            if detector is None:
+                detector = LeagueDetector(
+                    espn_client=self.espn,
+                    enabled_leagues=enabled_leagues,
+                    lookahead_days=self.lookahead_days or 7
+                )
+                self._league_detectors[key] = detector
+            return detector
+
+    def prepare_leagues(self, leagues: Iterable[str], load_teams: bool = True) -> int:
+        """
+        Build per-league data up front (before worker threads start).
+
+        Fills the league config caches of every matcher and, if load_teams,
+        loads team lists with their normalized search names into the shared
+        team cache.
+
+        Args:
+            leagues: League codes to prepare
+            load_teams: Also load team lists (skip for multi-sport groups,
+                        where only candidate leagues are ever searched)
+
+        Returns:
+            Number of leagues newly prepared
+        """
+        prepared = 0
+        for league in leagues:
+            if not league:
+                continue
+            league_lower = league.lower()
+            with self._prepare_lock:
+                if (league_lower, load_teams) in self._prepared or (league_lower, True) in self._prepared:
+                    continue
+                self._prepared.add((league_lower, load_teams))
+
+            try:
+                self.team_matcher.warm_league(league_lower, load_teams=load_teams)
+                self.event_matcher.warm_league(league_lower)
+                self.enricher.warm_league(league_lower)
+                prepared += 1
+            except Exception as e:
+                # Let a later call retry this league
+                with self._prepare_lock:
+                    self._prepared.discard((league_lower, load_teams))
+                logger.warning(f"Could not prepare matcher data for {league}: {e}")
+
+        if prepared:
+            logger.debug(f"MatcherPool prepared {prepared} league(s)")
+        return prepared
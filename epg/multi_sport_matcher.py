@@ -180,6 +180,11 @@ class MultiSportMatcher:
         self.league_detector = league_detector
         self.config = config
 
+        # Fixture lookups over already fetched scoreboards/schedules, used to
+        # skip find_event() for candidates whose teams have no game
+        from epg.fixture_index import FixtureIndex
+        self.fixtures = FixtureIndex(event_matcher.espn, event_matcher.lookahead_days)
+
     def match_stream(self, stream: Dict) -> MatchResult:
         """
         Match a stream to an ESPN event using tiered detection.
@@ -710,6 +715,17 @@ class MultiSportMatcher:
 
         return None, None, None, None, None
 
+    def _league_api_path(self, league: str, api_path_override: str = None) -> tuple:
+        """(sport, api_league) for a league code, or (None, None) if unknown."""
+        from epg.league_config import parse_api_path
+
+        if api_path_override:
+            return parse_api_path(api_path_override)
+        config = self.event_matcher._get_league_config(league)
+        if not config:
+            return None, None
+        return parse_api_path(config['api_path'])
+
     def _disambiguate_candidates(
         self, matched_candidates: List[tuple], game_date, game_time
     ) -> tuple:
@@ -725,6 +741,13 @@ class MultiSportMatcher:
         leagues_with_final_games = []
 
         for league, candidate, api_path_override in matched_candidates:
+            # Skip the find_event() search where fetched data rules out a game
+            sport, api_league = self._league_api_path(league, api_path_override)
+            if sport and self.fixtures.has_fixture(
+                sport, api_league, candidate['away_team_id'], candidate['home_team_id']
+            ) is False:
+                continue
+
             test_result = self.event_matcher.find_event(
                 candidate['away_team_id'],
                 candidate['home_team_id'],
@@ -994,40 +1017,41 @@ class MultiSportMatcher:
         # Collect all (team_id, league_code) pairs for each raw team name
         # This searches ALL leagues each team appears in
         conn = get_connection()
-        cursor = conn.cursor()
-
-        # Build list of (team_id, league, team_name, opponent_raw, opponent_primary)
-        teams_to_search = []
-
-        # For team1 (raw_away): search for events where opponent matches raw_home
-        # Check both non-soccer and soccer caches
-        for raw_name, opponent_raw, opponent_primary in [
-            (raw_away, raw_home_lower, raw_home_primary),
-            (raw_home, raw_away_lower, raw_away_primary)
-        ]:
-            # Search non-soccer cache (team_league_cache)
-            cursor.execute("""
-                SELECT espn_team_id, league_code, team_name
-                FROM team_league_cache
-                WHERE LOWER(team_name) LIKE ?
-            """, (f'%{raw_name}%',))
-            for row in cursor.fetchall():
-                teams_to_search.append((
-                    row[0], row[1], row[2], opponent_raw, opponent_primary
-                ))
-
-            # Also search soccer cache
-            cursor.execute("""
-                SELECT espn_team_id, league_slug, team_name
-                FROM soccer_team_leagues
-                WHERE LOWER(team_name) LIKE ?
-            """, (f'%{raw_name}%',))
-            for row in cursor.fetchall():
-                teams_to_search.append((
-                    row[0], row[1], row[2], opponent_raw, opponent_primary
-                ))
-
-        conn.close()
+        try:
+            cursor = conn.cursor()
+
+            # Build list of (team_id, league, team_name, opponent_raw, opponent_primary)
+            teams_to_search = []
+
+            # For team1 (raw_away): search for events where opponent matches raw_home
+            # Check both non-soccer and soccer caches
+            for raw_name, opponent_raw, opponent_primary in [
+                (raw_away, raw_home_lower, raw_home_primary),
+                (raw_home, raw_away_lower, raw_away_primary)
+            ]:
+                # Search non-soccer cache (team_league_cache)
+                cursor.execute("""
+                    SELECT espn_team_id, league_code, team_name
+                    FROM team_league_cache
+                    WHERE LOWER(team_name) LIKE ?
+                """, (f'%{raw_name}%',))
+                for row in cursor.fetchall():
+                    teams_to_search.append((
+                        row[0], row[1], row[2], opponent_raw, opponent_primary
+                    ))
+
+                # Also search soccer cache
+                cursor.execute("""
+                    SELECT espn_team_id, league_slug, team_name
+                    FROM soccer_team_leagues
+                    WHERE LOWER(team_name) LIKE ?
+                """, (f'%{raw_name}%',))
+                for row in cursor.fetchall():
+                    teams_to_search.append((
+                        row[0], row[1], row[2], opponent_raw, opponent_primary
+                    ))
+        finally:
+            conn.close()
 
         if not teams_to_search:
             logger.debug("Tier 4b+ fallback: no team entries found in caches")
@@ -8,6 +8,7 @@ This module orchestrates the EPG generation process:
 5. Generates filler content
 6. Returns data ready for XMLTV generation
 """
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from zoneinfo import ZoneInfo
@@ -20,11 +21,22 @@ from database import get_connection
 from api.espn_client import ESPNClient
 from epg.template_engine import TemplateEngine
 from epg.league_config import SoccerCompat, is_soccer_league
+from epg.schedule_index import EMPTY_STREAKS, ScheduleIndex
 from epg.soccer_multi_league import SoccerMultiLeague
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class FillerInterval:
+    """A gap in a team's timeline to be filled with one type of filler"""
+    start: datetime
+    end: datetime
+    filler_type: str  # 'pregame', 'postgame' or 'idle'
+    next_event: Optional[dict]  # Game the filler leads up to (.next context)
+    last_event: Optional[dict]  # Most recent started game (.last context)
+
+
 class EPGOrchestrator:
     """Orchestrates EPG generation workflow"""
 
@@ -39,6 +51,11 @@ class EPGOrchestrator:
         self._scoreboard_cache = {}
         self._scoreboard_cache_lock = threading.Lock()
 
+        # Schedule indexes by (id(events), team_id) - cleared each generation
+        # Streaks, H2H and last-game lookups share one parse of each schedule
+        self._schedule_indexes = {}
+        self._schedule_indexes_lock = threading.Lock()
+
     def _increment_api_calls(self, count: int = 1):
         """Thread-safe increment of API call counter"""
         with self._api_calls_lock:
@@ -76,6 +93,25 @@ class EPGOrchestrator:
         with self._scoreboard_cache_lock:
             self._scoreboard_cache.clear()
 
+    def _get_schedule_index(self, events: List[dict], our_team_id: str = '') -> ScheduleIndex:
+        """
+        Get the ScheduleIndex for an events list, building it on first use.
+
+        Cached by list identity for the current generation, so every game and
+        filler programme of a team reuses one parse of its schedule.
+        """
+        cache_key = (id(events), str(our_team_id))
+
+        cached = self._schedule_indexes.get(cache_key)
+        if cached is not None and cached[0] is events:
+            return cached[1]
+
+        index = ScheduleIndex(events, our_team_id)
+        with self._schedule_indexes_lock:
+            # Keep the events referenced so id() isn't reused while cached
+            self._schedule_indexes[cache_key] = (events, index)
+        return index
+
     def _round_to_last_hour(self, dt: datetime) -> datetime:
         """Round datetime down to the last top of hour"""
         return dt.replace(minute=0, second=0, microsecond=0)
@@ -169,6 +205,8 @@ class EPGOrchestrator:
 
         # Clear caches at start of generation
         self._clear_scoreboard_cache()
+        with self._schedule_indexes_lock:
+            self._schedule_indexes.clear()
 
         # Get active teams with templates
         teams_list = self._get_teams_with_templates()
@@ -184,8 +222,9 @@ class EPGOrchestrator:
 
         logger.info(f"Processing {len(teams_list)} teams")
 
-        # Get settings
-        settings = self._get_settings()
+        # Get settings (the caller's generation snapshot, or the shared one)
+        if settings is None:
+            settings = self._get_settings()
 
         # Calculate EPG start datetime (single source of truth)
         epg_tz = ZoneInfo(epg_timezone)
@@ -342,13 +381,10 @@ class EPGOrchestrator:
             conn.close()
 
     def _get_settings(self) -> Dict[str, Any]:
-        """Get settings from database"""
-        conn = get_connection()
-        try:
-            settings_row = conn.execute("SELECT * FROM settings WHERE id = 1").fetchone()
-            return dict(settings_row) if settings_row else {}
-        finally:
-            conn.close()
+        """Get settings from the shared settings snapshot"""
+        from utils.settings_snapshot import get_settings_snapshot
+        snapshot = get_settings_snapshot()
+        return snapshot.as_dict() if snapshot else {}
 
     def _normalize_scoreboard_broadcasts(self, competition: dict) -> dict:
         """
@@ -467,6 +503,31 @@ class EPGOrchestrator:
 
         return True
 
+    def _scoreboard_lookup_for(self, events: List[dict], scoreboard_index) -> Dict[str, dict]:
+        """
+        Scoreboard lookup (event ID -> parsed scoreboard event) for specific events
+
+        Only the referenced scoreboard events are parsed, with the same window
+        parse_schedule_events(scoreboard_data, 1) applies to a whole scoreboard.
+
+        Args:
+            events: Events to look up (by 'id')
+            scoreboard_index: ScoreboardIndex of one day's scoreboard (or None)
+
+        Returns:
+            Dict mapping event ID to parsed scoreboard event
+        """
+        if not scoreboard_index:
+            return {}
+
+        raw_events = []
+        for event in events:
+            raw_event = scoreboard_index.event(event.get('id'))
+            if raw_event is not None:
+                raw_events.append(raw_event)
+
+        return {e['id']: e for e in self.espn.parse_schedule_events({'events': raw_events}, 1)}
+
     def _fetch_and_enrich_event_with_scoreboard(
         self,
         event: dict,
@@ -497,11 +558,9 @@ class EPGOrchestrator:
             if not scoreboard_data or 'events' not in scoreboard_data:
                 return None
 
-            # Parse scoreboard events
-            scoreboard_events = self.espn.parse_schedule_events(scoreboard_data, 1)
-
-            # Create lookup and enrich
-            scoreboard_lookup = {e['id']: e for e in scoreboard_events}
+            # Look the event up in the scoreboard index and enrich
+            scoreboard_index = self.espn.get_scoreboard_index(api_sport, api_league, date_str, scoreboard_data)
+            scoreboard_lookup = self._scoreboard_lookup_for([event], scoreboard_index)
             if self._enrich_event_from_scoreboard_lookup(event, scoreboard_lookup, normalize_broadcasts, set_odds_flag):
                 return event
 
@@ -925,16 +984,17 @@ class EPGOrchestrator:
             date_str = check_date.strftime('%Y%m%d')
 
             scoreboard_data = self._get_scoreboard_cached(api_sport, api_league, date_str)
+            scoreboard_index = self.espn.get_scoreboard_index(api_sport, api_league, date_str, scoreboard_data)
 
-            if not scoreboard_data or 'events' not in scoreboard_data:
+            if not scoreboard_index:
                 continue
 
-            # Parse scoreboard events for this day
+            # Parse this day's scoreboard events that involve our team
             # Use _parse_event directly since we already control the date via the loop
             # (parse_schedule_events would filter by date which is redundant here)
             scoreboard_events = []
-            for raw_event in scoreboard_data.get('events', []):
-                parsed = self.espn._parse_event(raw_event)
+            for ref in scoreboard_index.events_for_team(team_id):
+                parsed = self.espn._parse_event(ref.event)
                 if parsed:
                     scoreboard_events.append(parsed)
 
@@ -1046,9 +1106,9 @@ class EPGOrchestrator:
             scoreboard_data = self._get_scoreboard_cached(api_sport, api_league, date_str)
 
             if scoreboard_data and 'events' in scoreboard_data:
-                # Parse scoreboard events
-                scoreboard_events = self.espn.parse_schedule_events(scoreboard_data, 1)
-                scoreboard_lookup = {e['id']: e for e in scoreboard_events}
+                # Parse only the scoreboard events these past events refer to
+                scoreboard_index = self.espn.get_scoreboard_index(api_sport, api_league, date_str, scoreboard_data)
+                scoreboard_lookup = self._scoreboard_lookup_for(past_by_date[date_str], scoreboard_index)
 
                 # Enrich events for this date using the helper (no broadcast normalization for past events)
                 for event in past_by_date[date_str]:
@@ -1296,13 +1356,17 @@ class EPGOrchestrator:
             'last_game': last_context
         }
 
+        # Template variables are computed on demand and shared by every template below
+        # (and by category resolution in XMLTV)
+        template_vars = self.template_engine.variables_for(context)
+
         # Resolve templates
-        title = self.template_engine.resolve(team.get('title_format', '{team_name} Basketball'), context)
-        subtitle = self.template_engine.resolve(team.get('subtitle_template', '{venue_full}'), context)
+        title = self.template_engine.resolve(team.get('title_format', '{team_name} Basketball'), context, template_vars)
+        subtitle = self.template_engine.resolve(team.get('subtitle_template', '{venue_full}'), context, template_vars)
 
         # Resolve program art URL if configured
         program_art_url_template = team.get('program_art_url', '')
-        program_art_url = self.template_engine.resolve(program_art_url_template, context) if program_art_url_template else None
+        program_art_url = self.template_engine.resolve(program_art_url_template, context, template_vars) if program_art_url_template else None
 
         # Select description template based on conditional logic and fallbacks
         description_options = team.get('description_options', '[]')
@@ -1312,7 +1376,7 @@ class EPGOrchestrator:
         )
 
         # Resolve the selected description template
-        description = self.template_engine.resolve(selected_description_template, context)
+        description = self.template_engine.resolve(selected_description_template, context, template_vars)
 
         # Determine status
         status_name = event['status']['name']
@@ -1325,9 +1389,6 @@ class EPGOrchestrator:
         else:
             status = 'scheduled'
 
-        # Build template variables for category resolution in XMLTV
-        template_vars = self.template_engine._build_variable_dict(context)
-
         return {
             'start_datetime': game_datetime,
             'end_datetime': end_datetime,
@@ -1358,6 +1419,12 @@ class EPGOrchestrator:
         """
         Generate pregame, postgame, and idle EPG entries to fill gaps
 
+        The team's timeline is first reduced to a list of FillerIntervals
+        (gaps between games with their filler type and next/last game), then
+        each interval is cut at time-block boundaries. Intervals with the same
+        filler type and next/last game (e.g. every idle day of an off-season)
+        share one template resolution.
+
         Args:
             team: Team configuration with filler settings
             game_events: List of actual game events in EPG window (sorted by date)
@@ -1450,7 +1517,34 @@ class EPGOrchestrator:
                     'event': event  # Store raw event
                 })
 
+        # Events for .last context (extended schedule when available); indexed once, so
+        # each day's lookup is a bisect instead of a scan of every event
+        if extended_game_schedule:
+            last_game_events = extended_events
+        else:
+            last_game_events = [entry['event'] for entries in game_schedule.values() for entry in entries]
+
+        def find_last_started_game(day_end: datetime) -> Optional[dict]:
+            # Most recent game that has started, on this day or earlier
+            cutoff = min(datetime.now(timezone.utc), day_end - timedelta(microseconds=1))
+            return self._find_last_started_game(events=last_game_events, before_datetime=cutoff)
+
+        # Scoreboard enrichment per last game, shared by every interval that references it
+        enriched_games = {}
+
+        def enrich_last_game(game: Optional[dict]) -> Optional[dict]:
+            if game is None:
+                return None
+            key = id(game)
+            if key not in enriched_games:
+                # Keep the raw game referenced so its id() stays unique for this run
+                enriched_games[key] = (game, self._enrich_last_game_with_score(
+                    game, api_sport, api_league, epg_timezone
+                ))
+            return enriched_games[key][1]
+
         # Process each day in the EPG window
+        intervals: List[FillerInterval] = []
         current_date = start_date
         while current_date <= end_date:
             # First day: start from epg_start_datetime; subsequent days: start from midnight
@@ -1481,23 +1575,15 @@ class EPGOrchestrator:
                     # Only create pregame if not already filled by previous day's midnight crossing
                     if not skip_pregame and day_start < first_game_start:
                         # Find most recent game that has started
-                        last_game = self._find_last_started_game(
-                            game_schedule=extended_game_schedule or game_schedule,
-                            game_dates=extended_game_dates or game_dates,
-                            current_date=current_date
-                        )
+                        last_game = find_last_started_game(day_end)
 
                         # Enrich last game with scoreboard data to get final scores
-                        last_game = self._enrich_last_game_with_score(
-                            last_game, api_sport, api_league, epg_timezone
-                        )
+                        last_game = enrich_last_game(last_game)
 
-                        pregame_entries = self._create_filler_chunks(
-                            day_start, first_game_start, max_hours,
-                            team, 'pregame', games_today[0]['event'], team_stats,
-                            last_game, epg_timezone, api_path, schedule_data, settings
-                        )
-                        filler_entries.extend(pregame_entries)
+                        intervals.append(FillerInterval(
+                            day_start, first_game_start, 'pregame',
+                            games_today[0]['event'], last_game
+                        ))
 
                 # POSTGAME: Fill from last game end to midnight (or next game start if game crosses midnight)
                 if team.get('postgame_enabled', True):
@@ -1515,15 +1601,11 @@ class EPGOrchestrator:
 
                             if last_game_end < first_next_game_start:
                                 # Enrich last game with scoreboard data to get final scores
-                                last_game_enriched = self._enrich_last_game_with_score(
-                                    games_today[-1]['event'], api_sport, api_league, epg_timezone
-                                )
-                                pregame_entries = self._create_filler_chunks(
-                                    last_game_end, first_next_game_start, max_hours,
-                                    team, 'pregame', next_day_games[0]['event'], team_stats,
-                                    last_game_enriched, epg_timezone, api_path, schedule_data, settings
-                                )
-                                filler_entries.extend(pregame_entries)
+                                last_game_enriched = enrich_last_game(games_today[-1]['event'])
+                                intervals.append(FillerInterval(
+                                    last_game_end, first_next_game_start, 'pregame',
+                                    next_day_games[0]['event'], last_game_enriched
+                                ))
                         else:
                             # No game next day - apply midnight_crossover_mode
                             next_day_end = day_end + timedelta(days=1)
@@ -1536,15 +1618,11 @@ class EPGOrchestrator:
                                     extended_game_dates or game_dates
                                 )
                                 # Enrich last game with scoreboard data to get final scores
-                                last_game_enriched = self._enrich_last_game_with_score(
-                                    games_today[-1]['event'], api_sport, api_league, epg_timezone
-                                )
-                                postgame_entries = self._create_filler_chunks(
-                                    last_game_end, next_day_end, max_hours,
-                                    team, 'postgame', next_game_for_postgame, team_stats,
-                                    last_game_enriched, epg_timezone, api_path, schedule_data, settings
-                                )
-                                filler_entries.extend(postgame_entries)
+                                last_game_enriched = enrich_last_game(games_today[-1]['event'])
+                                intervals.append(FillerInterval(
+                                    last_game_end, next_day_end, 'postgame',
+                                    next_game_for_postgame, last_game_enriched
+                                ))
                             elif midnight_mode == 'idle':
                                 if team.get('idle_enabled', True):
                                     next_game = self._find_next_game(
@@ -1553,15 +1631,11 @@ class EPGOrchestrator:
                                         extended_game_dates or game_dates
                                     )
                                     # Enrich last game with scoreboard data to get final scores
-                                    last_game_enriched = self._enrich_last_game_with_score(
-                                        games_today[-1]['event'], api_sport, api_league, epg_timezone
-                                    )
-                                    idle_entries = self._create_filler_chunks(
-                                        last_game_end, next_day_end, max_hours,
-                                        team, 'idle', next_game, team_stats,
-                                        last_game_enriched, epg_timezone, api_path, schedule_data, settings
-                                    )
-                                    filler_entries.extend(idle_entries)
+                                    last_game_enriched = enrich_last_game(games_today[-1]['event'])
+                                    intervals.append(FillerInterval(
+                                        last_game_end, next_day_end, 'idle',
+                                        next_game, last_game_enriched
+                                    ))
                     else:
                         # Game ends before midnight - fill to midnight with postgame
                         if last_game_end < day_end:
@@ -1572,15 +1646,11 @@ class EPGOrchestrator:
                                 extended_game_dates or game_dates
                             )
                             # Enrich last game with scoreboard data to get final scores
-                            last_game_enriched = self._enrich_last_game_with_score(
-                                games_today[-1]['event'], api_sport, api_league, epg_timezone
-                            )
-                            postgame_entries = self._create_filler_chunks(
-                                last_game_end, day_end, max_hours,
-                                team, 'postgame', next_game_for_postgame, team_stats,
-                                last_game_enriched, epg_timezone, api_path, schedule_data, settings
-                            )
-                            filler_entries.extend(postgame_entries)
+                            last_game_enriched = enrich_last_game(games_today[-1]['event'])
+                            intervals.append(FillerInterval(
+                                last_game_end, day_end, 'postgame',
+                                next_game_for_postgame, last_game_enriched
+                            ))
 
             else:
                 # IDLE: No game today - check if previous day's game crossed midnight
@@ -1604,28 +1674,30 @@ class EPGOrchestrator:
                     )
 
                     # Find most recent game that has started
-                    last_game = self._find_last_started_game(
-                        game_schedule=extended_game_schedule or game_schedule,
-                        game_dates=extended_game_dates or game_dates,
-                        current_date=current_date
-                    )
+                    last_game = find_last_started_game(day_end)
 
                     # Enrich last game with scoreboard data to get final scores
-                    last_game = self._enrich_last_game_with_score(
-                        last_game, api_sport, api_league, epg_timezone
-                    )
+                    last_game = enrich_last_game(last_game)
 
                     # For idle days, create exactly 4 programs aligned to time blocks
                     # (0000-0600, 0600-1200, 1200-1800, 1800-0000)
-                    idle_entries = self._create_filler_chunks(
-                        day_start, day_end, max_hours,
-                        team, 'idle', next_game, team_stats,
-                        last_game, epg_timezone, api_path, schedule_data, settings
-                    )
-                    filler_entries.extend(idle_entries)
+                    intervals.append(FillerInterval(
+                        day_start, day_end, 'idle',
+                        next_game, last_game
+                    ))
 
             current_date += timedelta(days=1)
 
+        # Cut intervals into time-block chunks, resolving each distinct filler once
+        resolved_filler = {}
+        for interval in intervals:
+            filler_entries.extend(self._create_filler_chunks(
+                interval.start, interval.end, max_hours,
+                team, interval.filler_type, interval.next_event, team_stats,
+                interval.last_event, epg_timezone, api_path, schedule_data, settings,
+                resolved_cache=resolved_filler
+            ))
+
         return filler_entries
 
     def _get_next_time_block(self, dt: datetime) -> datetime:
@@ -1653,6 +1725,28 @@ class EPGOrchestrator:
         next_day = dt + timedelta(days=1)
         return next_day.replace(hour=0, minute=0, second=0, microsecond=0)
 
+    def _time_block_boundaries(self, start_dt: datetime, end_dt: datetime) -> List[tuple]:
+        """
+        Split an interval at 6-hour time block boundaries (0000, 0600, 1200, 1800)
+
+        Only the first boundary needs a lookup; the rest are whole blocks apart.
+
+        Returns:
+            List of (chunk_start, chunk_end) tuples covering start_dt to end_dt
+        """
+        if start_dt >= end_dt:
+            return []
+
+        block = timedelta(hours=6)
+        boundaries = [start_dt]
+        next_block = self._get_next_time_block(start_dt)
+        while next_block < end_dt:
+            boundaries.append(next_block)
+            next_block += block
+        boundaries.append(end_dt)
+
+        return list(zip(boundaries, boundaries[1:]))
+
     def _create_filler_chunks(
         self,
         start_dt: datetime,
@@ -1666,11 +1760,16 @@ class EPGOrchestrator:
         epg_timezone: str = 'America/Detroit',
         api_path: str = '',
         schedule_data: dict = None,
-        settings: dict = None
+        settings: dict = None,
+        resolved_cache: dict = None
     ) -> List[dict]:
         """
         Create filler EPG entries, splitting into chunks based on max_hours
 
+        Every chunk of the interval shows the same resolved filler. Pass the
+        same resolved_cache to several calls to share the resolution between
+        intervals with the same filler type and next/last game objects.
+
         Args:
             start_dt: Start datetime
             end_dt: End datetime
@@ -1682,29 +1781,66 @@ class EPGOrchestrator:
             last_game_event: Last game event (for context)
             epg_timezone: EPG timezone
             api_path: League API path
+            resolved_cache: Optional dict of resolved filler, keyed by
+                (filler_type, id(game_event), id(last_game_event))
 
         Returns:
             List of filler event dictionaries
         """
-        chunks = []
-
         # Use time-block alignment instead of evenly dividing by max_hours
         # Filler extends to next time block boundary (0000, 0600, 1200, 1800)
-        time_blocks_list = []
-
-        current_start = start_dt
-        while current_start < end_dt:
-            # Find the next time block boundary
-            next_block = self._get_next_time_block(current_start)
-
-            # Don't go past end_dt
-            chunk_end = min(next_block, end_dt)
+        time_blocks_list = self._time_block_boundaries(start_dt, end_dt)
+        if not time_blocks_list:
+            return []
+
+        cache_key = (filler_type, id(game_event), id(last_game_event))
+        filler = resolved_cache.get(cache_key) if resolved_cache is not None else None
+        if filler is None:
+            filler = self._resolve_filler(
+                start_dt, team, filler_type, game_event, team_stats,
+                last_game_event, epg_timezone, api_path, schedule_data, settings
+            )
+            if resolved_cache is not None:
+                resolved_cache[cache_key] = filler
 
-            time_blocks_list.append((current_start, chunk_end))
-            current_start = chunk_end
+        # Create chunks using time block boundaries
+        return [
+            {
+                'start_datetime': chunk_start,
+                'end_datetime': chunk_end,
+                'title': filler['title'],
+                'subtitle': filler['subtitle'],
+                'description': filler['description'],
+                'program_art_url': filler['program_art_url'],
+                'status': 'filler',  # Special status to identify filler content
+                'filler_type': filler_type,
+                'context': filler['context']  # Include template variables for category resolution
+            }
+            for chunk_start, chunk_end in time_blocks_list
+        ]
 
-        num_chunks = len(time_blocks_list)
+    def _resolve_filler(
+        self,
+        start_dt: datetime,
+        team: dict,
+        filler_type: str,
+        game_event: dict = None,
+        team_stats: dict = None,
+        last_game_event: dict = None,
+        epg_timezone: str = 'America/Detroit',
+        api_path: str = '',
+        schedule_data: dict = None,
+        settings: dict = None
+    ) -> dict:
+        """
+        Resolve the filler templates for one filler type and next/last game
 
+        Returns:
+            Dict with title, subtitle, description, program_art_url and the
+            template variables ('context') for category resolution. The
+            game events are kept referenced so cache keys built from their
+            id() stay valid while the result is cached.
+        """
         # Get templates for this filler type
         title_template = team.get(f'{filler_type}_title', f'{filler_type.capitalize()} Coverage')
         subtitle_template = team.get(f'{filler_type}_subtitle', '')
@@ -1792,35 +1928,18 @@ class EPGOrchestrator:
 
         context['last_game'] = last_context
 
-        # Build template variables for category resolution
-        template_vars = self.template_engine._build_variable_dict(context)
+        # Template variables (computed on demand) for the chunks and category resolution
+        template_vars = self.template_engine.variables_for(context)
 
-        # Create chunks using time block boundaries
-        for i, (chunk_start, chunk_end) in enumerate(time_blocks_list):
-            current_start = chunk_start
-            current_end = chunk_end
-
-            # Resolve templates
-            title = self.template_engine.resolve(title_template, context)
-            subtitle = self.template_engine.resolve(subtitle_template, context) if subtitle_template else ''
-            description = self.template_engine.resolve(desc_template, context)
-            program_art_url = self.template_engine.resolve(art_url_template, context) if art_url_template else None
-
-            chunks.append({
-                'start_datetime': current_start,
-                'end_datetime': current_end,
-                'title': title,
-                'subtitle': subtitle,
-                'description': description,
-                'program_art_url': program_art_url,
-                'status': 'filler',  # Special status to identify filler content
-                'filler_type': filler_type,
-                'context': template_vars  # Include template variables for category resolution
-            })
-
-            current_start = current_end
-
-        return chunks
+        # Resolve templates
+        return {
+            'title': self.template_engine.resolve(title_template, context, template_vars),
+            'subtitle': self.template_engine.resolve(subtitle_template, context, template_vars) if subtitle_template else '',
+            'description': self.template_engine.resolve(desc_template, context, template_vars),
+            'program_art_url': self.template_engine.resolve(art_url_template, context, template_vars) if art_url_template else None,
+            'context': template_vars,
+            'events': (game_event, last_game_event)
+        }
 
     # ========================================================================
     # HELPER FUNCTIONS (ported from old app.py)
@@ -1858,9 +1977,15 @@ class EPGOrchestrator:
         Returns:
             Most recent started event, or None
         """
+        if events is not None:
+            # Events lists are indexed once per generation (start times parsed and sorted)
+            if not events:
+                return None
+            return self._get_schedule_index(events).last_started(before_datetime)
+
         # If game_schedule provided, flatten it to events list
-        if events is None and game_schedule is not None:
-            events = []
+        events = []
+        if game_schedule is not None:
             for game_date in (game_dates or []):
                 if current_date is None or game_date <= current_date:
                     for game_entry in game_schedule.get(game_date, []):
@@ -1871,30 +1996,7 @@ class EPGOrchestrator:
         if not events:
             return None
 
-        # Default to now if no before_datetime specified
-        if before_datetime is None:
-            before_datetime = datetime.now(tz=timezone.utc)
-
-        started_games = []
-
-        for event in events:
-            event_date_str = event.get('date', '')
-            if not event_date_str:
-                continue
-
-            try:
-                event_datetime = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
-                # Only include games that have already started
-                if event_datetime <= before_datetime:
-                    started_games.append((event_datetime, event))
-            except:
-                continue
-
-        if not started_games:
-            return None
-
-        # Return the most recent one (latest start time)
-        return max(started_games, key=lambda x: x[0])[1]
+        return ScheduleIndex(events).last_started(before_datetime)
 
     def _enrich_last_game_with_score(self, last_game: Optional[dict], api_sport: str, api_league: str,
                                       epg_timezone: str = 'America/Detroit') -> Optional[dict]:
@@ -1954,133 +2056,9 @@ class EPGOrchestrator:
     def _calculate_home_away_streaks(self, our_team_id: str, schedule_data: dict) -> dict:
         """Calculate current home and away win/loss streaks"""
         if not schedule_data or 'events' not in schedule_data:
-            return {
-                'home_streak': '',
-                'away_streak': '',
-                'last_5_record': '',
-                'last_10_record': ''
-            }
+            return dict(EMPTY_STREAKS)
 
-        # Collect completed games by location and overall
-        home_games = []
-        away_games = []
-        all_games = []
-
-        for event in schedule_data['events']:
-            try:
-                comp = event.get('competitions', [{}])[0]
-                status = comp.get('status', {}).get('type', {})
-
-                # Only completed games
-                if not status.get('completed', False):
-                    continue
-
-                # Find our team and opponent in competitors
-                competitors = comp.get('competitors', [])
-                our_team = None
-                opponent = None
-                for c in competitors:
-                    if str(c.get('team', {}).get('id')) == str(our_team_id):
-                        our_team = c
-                    else:
-                        opponent = c
-
-                if not our_team:
-                    continue
-
-                # Determine result: win, loss, or draw
-                # For draws in soccer, both teams have winner=False
-                won = our_team.get('winner', False)
-                opponent_won = opponent.get('winner', False) if opponent else False
-
-                # It's a draw if neither team won
-                is_draw = not won and not opponent_won
-
-                # Categorize by home/away
-                home_away = our_team.get('homeAway', '').lower()
-                game_date = event.get('date', '')
-
-                # result: 'W' for win, 'L' for loss, 'D' for draw
-                if won:
-                    result = 'W'
-                elif is_draw:
-                    result = 'D'
-                else:
-                    result = 'L'
-
-                game_data = {'date': game_date, 'won': won, 'result': result}
-                all_games.append(game_data)
-
-                if home_away == 'home':
-                    home_games.append(game_data)
-                elif home_away == 'away':
-                    away_games.append(game_data)
-
-            except (KeyError, IndexError, TypeError):
-                continue
-
-        # Helper to calculate streak
-        # Streaks are consecutive wins or losses; draws break streaks
-        def calc_streak(games, location_text):
-            if not games:
-                return ""
-
-            games.sort(key=lambda x: x['date'], reverse=True)
-
-            # Get the result of the most recent game
-            first_result = games[0].get('result', 'L')
-
-            # Draws don't count as a streak - check for consecutive W or L only
-            if first_result == 'D':
-                # Most recent game was a draw, no active streak
-                return ""
-
-            count = 0
-            for game in games:
-                result = game.get('result', 'L')
-                if result == first_result:
-                    count += 1
-                else:
-                    # Draw or opposite result breaks the streak
-                    break
-
-            # Return streak in W/L format (W3 = 3 wins, L2 = 2 losses)
-            return f"{first_result}{count}"
-
-        # Helper to calculate W-L or W-D-L record
-        def calc_record(games):
-            wins = sum(1 for g in games if g.get('result') == 'W')
-            losses = sum(1 for g in games if g.get('result') == 'L')
-            draws = sum(1 for g in games if g.get('result') == 'D')
-
-            if draws > 0:
-                # Soccer-style: W-D-L
-                return f"{wins}-{draws}-{losses}"
-            else:
-                # US sports: W-L
-                return f"{wins}-{losses}"
-
-        # Calculate last 5 and last 10 records
-        all_games.sort(key=lambda x: x['date'], reverse=True)
-
-        last_5 = all_games[:5]
-        if len(last_5) >= 5:
-            last_5_record = calc_record(last_5)
-        else:
-            last_5_record = ''
-
-        last_10 = all_games[:10]
-        if len(last_10) >= 10:
-            last_10_record = calc_record(last_10)
-        else:
-            last_10_record = ''
-
-        return {
-            'home_streak': calc_streak(home_games, "at home"),
-            'away_streak': calc_streak(away_games, "on road"),
-            'last_5_record': last_5_record,
-            'last_10_record': last_10_record
-        }
+        return self._get_schedule_index(schedule_data['events'], our_team_id).streaks
 
     def _get_head_coach(self, team_id: str, league: str) -> str:
         """Fetch head coach name from roster API (cached per generation)"""
@@ -2275,146 +2253,7 @@ class EPGOrchestrator:
         if not schedule_data or 'events' not in schedule_data:
             return {'season_series': {}, 'previous_game': {}}
 
-        # Find all completed games against this opponent
-        h2h_games = []
-        for event in schedule_data['events']:
-            try:
-                comp = event.get('competitions', [{}])[0]
-                status = comp.get('status', {}).get('type', {})
-
-                # Only look at completed games
-                if not status.get('completed', False):
-                    continue
-
-                # Check if this game involves the opponent
-                competitors = comp.get('competitors', [])
-                opponent_in_game = any(
-                    str(c.get('team', {}).get('id')) == str(opponent_id)
-                    for c in competitors
-                )
-
-                if opponent_in_game:
-                    h2h_games.append(event)
-            except:
-                continue
-
-        # Calculate series record
-        team_wins = 0
-        opp_wins = 0
-
-        for event in h2h_games:
-            try:
-                comp = event.get('competitions', [{}])[0]
-                for competitor in comp.get('competitors', []):
-                    team_id = str(competitor.get('team', {}).get('id'))
-                    if team_id == str(our_team_id):
-                        if competitor.get('winner', False):
-                            team_wins += 1
-                    elif team_id == str(opponent_id):
-                        if competitor.get('winner', False):
-                            opp_wins += 1
-            except:
-                continue
-
-        # Build season series data
-        season_series = {
-            'team_wins': team_wins,
-            'opponent_wins': opp_wins,
-            'games': h2h_games
-        }
-
-        # Get most recent game
-        previous_game = {}
-        if h2h_games:
-            recent = h2h_games[0]  # Schedule is already sorted
-            try:
-                comp = recent.get('competitions', [{}])[0]
-
-                # Find our team and opponent in competitors
-                our_team = None
-                opp_team = None
-                for competitor in comp.get('competitors', []):
-                    team_id = str(competitor.get('team', {}).get('id'))
-                    if team_id == str(our_team_id):
-                        our_team = competitor
-                    elif team_id == str(opponent_id):
-                        opp_team = competitor
-
-                if our_team and opp_team:
-                    # Handle score being either a number or dict
-                    our_score_raw = our_team.get('score', 0)
-                    opp_score_raw = opp_team.get('score', 0)
-
-                    if isinstance(our_score_raw, dict):
-                        our_score = int(our_score_raw.get('value', 0) or our_score_raw.get('displayValue', '0'))
-                    else:
-                        our_score = int(our_score_raw) if our_score_raw else 0
-
-                    if isinstance(opp_score_raw, dict):
-                        opp_score = int(opp_score_raw.get('value', 0) or opp_score_raw.get('displayValue', '0'))
-                    else:
-                        opp_score = int(opp_score_raw) if opp_score_raw else 0
-
-                    if our_score > opp_score:
-                        result = 'Win'
-                        winner = our_team.get('team', {}).get('displayName', '')
-                        loser = opp_team.get('team', {}).get('displayName', '')
-                    elif opp_score > our_score:
-                        result = 'Loss'
-                        winner = opp_team.get('team', {}).get('displayName', '')
-                        loser = our_team.get('team', {}).get('displayName', '')
-                    else:
-                        result = 'Tie'
-                        winner = ''
-                        loser = ''
-
-                    # Parse date
-                    game_date_str = recent.get('date', '')
-                    if game_date_str:
-                        try:
-                            game_dt = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-                            date_formatted = game_dt.strftime('%B %d, %Y')
-                            days_since = (datetime.now(ZoneInfo('UTC')) - game_dt).days
-                        except:
-                            date_formatted = game_date_str
-                            days_since = 0
-                    else:
-                        date_formatted = ''
-                        days_since = 0
-
-                    # Determine home/away
-                    our_home_away = our_team.get('homeAway', '')
-
-                    # Get team abbreviations
-                    our_abbrev = our_team.get('team', {}).get('abbreviation', 'TBD')
-                    opp_abbrev = opp_team.get('team', {}).get('abbreviation', 'TBD')
-
-                    # Build abbreviated score
-                    if our_home_away == 'away':
-                        score_abbrev = f"{our_abbrev} {our_score} @ {opp_abbrev} {opp_score}"
-                    elif our_home_away == 'home':
-                        score_abbrev = f"{our_abbrev} {our_score} vs {opp_abbrev} {opp_score}"
-                    else:
-                        score_abbrev = f"{our_abbrev} {our_score} - {opp_abbrev} {opp_score}"
-
-                    previous_game = {
-                        'result': result,
-                        'score': f"{our_score}-{opp_score}",
-                        'score_abbrev': score_abbrev,
-                        'winner': winner,
-                        'loser': loser,
-                        'date': date_formatted,
-                        'venue': comp.get('venue', {}).get('fullName', ''),
-                        'venue_city': comp.get('venue', {}).get('address', {}).get('city', ''),
-                        'days_since': days_since
-                    }
-            except:
-                pass
-
-        return {
-            'season_series': season_series,
-            'previous_game': previous_game
-        }
+        return self._get_schedule_index(schedule_data['events'], our_team_id).h2h(opponent_id)
 
     def _get_game_duration(self, team: dict, settings: dict) -> float:
         """
@@ -0,0 +1,320 @@
+"""
+Programme Index - binary sidecar of game programmes in the final EPG
+
+The dashboard polls live stats (games today, live now) far more often than
+the EPG changes. Instead of parsing teamarr.xml on every poll, each merge
+writes '<epg>.idx' next to it: one fixed-size record per game programme
+(filler is left out), sorted by start time, followed by a string table
+holding channel IDs and titles.
+
+Readers memory-map the file and binary search on start time, so a query
+only touches the records in the requested window.
+
+File layout (little endian):
+    header   MAGIC, version (uint32), record count (uint32)
+    records  start (int64 epoch s), stop (int64 epoch s), kind (uint8),
+             channel offset/length, title offset/length (uint32 each)
+    strings  UTF-8 bytes referenced by the records
+
+Usage:
+    write_programme_index(index_path_for(epg_path), games)
+    games = query_game_programmes(epg_path, day_start_ts, day_end_ts)
+"""
+
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'TMRXIDX\x00'
+VERSION = 1
+
+HEADER = struct.Struct('<8sII')
+RECORD = struct.Struct('<qqBIIII')
+
+# Programme kinds (from the teamarr:<kind> metadata comment)
+KIND_TEAM = 0    # teamarr:teams-event
+KIND_EVENT = 1   # any other non-filler game programme (event-event)
+KIND_NAMES = ('team', 'event')
+
+
+class GameProgramme(NamedTuple):
+    """One game programme of the EPG"""
+    start: int     # Epoch seconds
+    stop: int      # Epoch seconds
+    kind: int      # KIND_TEAM or KIND_EVENT
+    channel: str
+    title: str
+
+
+def index_path_for(epg_path: str) -> str:
+    """Path of the sidecar index for an EPG file"""
+    return epg_path + '.idx'
+
+
+# =============================================================================
+# EXTRACTION
+# =============================================================================
+
+def parse_xmltv_time(time_str: str) -> Optional[datetime]:
+    """Parse XMLTV datetime format: YYYYMMDDHHmmss +ZZZZ (None if malformed)"""
+    if not time_str:
+        return None
+    try:
+        # Handle format like "20251129220000 -0500"
+        parts = time_str.split()
+        dt_str = parts[0]
+        tz_str = parts[1] if len(parts) > 1 else '+0000'
+
+        dt = datetime.strptime(dt_str, '%Y%m%d%H%M%S')
+
+        # Parse timezone offset
+        tz_sign = 1 if tz_str[0] == '+' else -1
+        tz_hours = int(tz_str[1:3])
+        tz_mins = int(tz_str[3:5])
+        tz_offset = timedelta(hours=tz_sign * tz_hours, minutes=tz_sign * tz_mins)
+        return dt.replace(tzinfo=timezone(tz_offset))
+    except Exception:
+        return None
+
+
+def game_programme_from_element(programme) -> Optional[GameProgramme]:
+    """
+    Index record for a <programme> element (parsed with comments).
+
+    Returns:
+        GameProgramme, or None for filler, programmes without teamarr
+        metadata, or unparseable times
+    """
+    # Look for teamarr metadata comment
+    teamarr_type = None
+    for child in programme:
+        if callable(child.tag):  # Comments have callable tag (ET.Comment)
+            comment_text = child.text or ''
+            if comment_text.startswith('teamarr:'):
+                teamarr_type = comment_text[8:]  # Remove 'teamarr:' prefix
+                break
+
+    # Skip if no teamarr metadata or if it's filler
+    if not teamarr_type or 'filler' in teamarr_type:
+        return None
+
+    start_time = parse_xmltv_time(programme.get('start'))
+    stop_time = parse_xmltv_time(programme.get('stop'))
+    if not start_time or not stop_time:
+        return None
+
+    title_elem = programme.find('title')
+    return GameProgramme(
+        start=int(start_time.timestamp()),
+        stop=int(stop_time.timestamp()),
+        kind=KIND_TEAM if teamarr_type == 'teams-event' else KIND_EVENT,
+        channel=programme.get('channel', ''),
+        title=(title_elem.text or '') if title_elem is not None else ''
+    )
+
+
+# =============================================================================
+# WRITING
+# =============================================================================
+
+def write_programme_index(index_path: str, games: Iterable[GameProgramme]) -> bool:
+    """
+    Write the sidecar index atomically (temp file + rename).
+
+    Args:
+        index_path: Destination path (see index_path_for)
+        games: Game programmes in any order
+
+    Returns:
+        True on success, False if the file could not be written
+    """
+    # Stable sort: programmes starting together keep their document order
+    games = sorted(games, key=lambda g: g.start)
+
+    strings = bytearray()
+    string_offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add_string(value: str) -> Tuple[int, int]:
+        location = string_offsets.get(value)
+        if location is None:
+            encoded = value.encode('utf-8')
+            location = (len(strings), len(encoded))
+            strings.extend(encoded)
+            string_offsets[value] = location
+        return location
+
+    records = bytearray(HEADER.pack(MAGIC, VERSION, len(games)))
+    for game in games:
+        channel_off, channel_len = add_string(game.channel)
+        title_off, title_len = add_string(game.title)
+        records.extend(RECORD.pack(
+            game.start, game.stop, game.kind, channel_off, channel_len, title_off, title_len
+        ))
+
+    # Unique temp file per writer: a merge and a stats-poll rebuild can write
+    # the same index concurrently, and the last rename wins
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(index_path) or '.',
+            prefix=os.path.basename(index_path) + '.',
+            suffix='.tmp'
+        )
+        with os.fdopen(fd, 'wb') as f:
+            f.write(records)
+            f.write(strings)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600
+        os.replace(tmp_path, index_path)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not write programme index {index_path}: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return False
+
+
+def build_programme_index(epg_path: str) -> bool:
+    """
+    Build the sidecar index by streaming an existing EPG file.
+
+    Used when the sidecar is missing or older than the EPG (e.g. an EPG
+    written before indexes existed).
+    """
+    from epg.xmltv_writer import iter_parse_xmltv
+
+    games = []
+
+    def handle_element(elem):
+        if elem.tag == 'programme':
+            game = game_programme_from_element(elem)
+            if game:
+                games.append(game)
+
+    iter_parse_xmltv(epg_path, handle_element)
+    return write_programme_index(index_path_for(epg_path), games)
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+class _StartTimes:
+    """Sequence view of the records' start times for bisect"""
+
+    def __init__(self, index: 'ProgrammeIndex'):
+        self._index = index
+
+    def __len__(self) -> int:
+        return self._index.count
+
+    def __getitem__(self, i: int) -> int:
+        return struct.unpack_from('<q', self._index._buffer, HEADER.size + i * RECORD.size)[0]
+
+
+class ProgrammeIndex:
+    """Memory-mapped, read-only view of a sidecar index"""
+
+    def __init__(self, index_path: str):
+        with open(index_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"Programme index too small: {index_path}")
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self._buffer.close()
+            raise ValueError(f"Unsupported programme index: {index_path}")
+
+        self.count = count
+        self._strings_offset = HEADER.size + count * RECORD.size
+        if self._strings_offset > size:
+            self._buffer.close()
+            raise ValueError(f"Truncated programme index: {index_path}")
+
+    def close(self):
+        self._buffer.close()
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._buffer[start:start + length].decode('utf-8')
+
+    def record(self, i: int) -> GameProgramme:
+        start, stop, kind, channel_off, channel_len, title_off, title_len = \
+            RECORD.unpack_from(self._buffer, HEADER.size + i * RECORD.size)
+        return GameProgramme(
+            start, stop, kind,
+            self._string(channel_off, channel_len),
+            self._string(title_off, title_len)
+        )
+
+    def starting_between(self, start_ts: int, end_ts: int) -> List[GameProgramme]:
+        """Game programmes with start_ts <= start < end_ts, ordered by start"""
+        start_times = _StartTimes(self)
+        first = bisect_left(start_times, start_ts)
+        last = bisect_left(start_times, end_ts, lo=first)
+        return [self.record(i) for i in range(first, last)]
+
+
+# Open indexes by path, reopened when the sidecar file changes
+_open_indexes: Dict[str, Tuple[Tuple[int, int], ProgrammeIndex]] = {}
+_open_indexes_lock = threading.Lock()
+
+
+def _is_fresh(index_path: str, epg_path: str) -> bool:
+    """A sidecar older than its EPG file is stale (same rule as .gz sidecars)"""
+    try:
+        return os.path.getmtime(index_path) >= os.path.getmtime(epg_path)
+    except OSError:
+        return False
+
+
+def open_programme_index(epg_path: str) -> ProgrammeIndex:
+    """
+    Get the index for an EPG file, (re)building the sidecar if missing or stale.
+
+    Raises:
+        OSError / ET.ParseError if the EPG can't be read to build the index
+    """
+    index_path = index_path_for(epg_path)
+
+    with _open_indexes_lock:
+        if not _is_fresh(index_path, epg_path):
+            if not build_programme_index(epg_path):
+                raise OSError(f"Could not build programme index for {epg_path}")
+
+        st = os.stat(index_path)
+        signature = (st.st_size, st.st_mtime_ns)
+
+        cached = _open_indexes.get(index_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        # Earlier mappings stay valid for readers still using them (the
+        # replaced file's inode lives on until they are garbage collected)
+        index = ProgrammeIndex(index_path)
+        _open_indexes[index_path] = (signature, index)
+        return index
+
+
+def query_game_programmes(epg_path: str, start_ts: int, end_ts: int) -> List[GameProgramme]:
+    """
+    Game programmes of an EPG file starting in [start_ts, end_ts).
+
+    Args:
+        epg_path: Path of the final EPG (teamarr.xml)
+        start_ts: Window start (epoch seconds, inclusive)
+        end_ts: Window end (epoch seconds, exclusive)
+    """
+    return open_programme_index(epg_path).starting_between(start_ts, end_ts)
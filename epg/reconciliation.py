@@ -669,13 +669,13 @@ def get_reconciler() -> Optional[ChannelReconciler]:
     Returns:
         ChannelReconciler or None if Dispatcharr not configured
     """
-    from database import get_connection
+    from utils.settings_snapshot import get_settings_snapshot
 
-    conn = get_connection()
-    try:
-        settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
-    finally:
-        conn.close()
+    snapshot = get_settings_snapshot()
+    if snapshot is None:
+        logger.warning("Could not read settings - reconciliation unavailable")
+        return None
+    settings = snapshot.as_dict()
 
     if not settings.get('dispatcharr_enabled'):
         return None
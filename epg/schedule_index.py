@@ -0,0 +1,335 @@
+"""
+Schedule Index for Team EPG Context
+
+Every game and filler programme of a team needs the same schedule-derived
+context: home/away streaks, last 5/10 records, head-to-head against the
+opponent and the most recent game that has started. ScheduleIndex parses a
+schedule's events once (competitors, status, start time) and answers those
+lookups from the parsed records instead of re-scanning the event list.
+
+Streaks and records don't depend on the game being described, so they are
+computed once; head-to-head summaries are computed once per opponent.
+
+Usage:
+    index = ScheduleIndex(schedule_data['events'], our_team_id)
+    index.streaks                 # {'home_streak': 'W3', ...}
+    index.h2h(opponent_id)        # {'season_series': {...}, 'previous_game': {...}}
+    index.last_started()          # most recent event that has started
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+
+EMPTY_STREAKS = {
+    'home_streak': '',
+    'away_streak': '',
+    'last_5_record': '',
+    'last_10_record': ''
+}
+
+
+def parse_event_datetime(event: dict) -> Optional[datetime]:
+    """Parse an ESPN event 'date' (e.g. "2025-11-26T22:00Z"), or None"""
+    event_date_str = event.get('date', '')
+    if not event_date_str:
+        return None
+    try:
+        return datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+class ScheduleIndex:
+    """
+    One-pass index over a team's schedule events.
+
+    Events are kept in schedule order; lookups never mutate them. The index
+    is read-only after construction apart from the per-opponent H2H memo, so
+    it can be shared by the games and filler of one team.
+    """
+
+    def __init__(self, events: List[dict], our_team_id: str = ''):
+        self.our_team_id = str(our_team_id)
+
+        # Completed games for streaks/records: {'date', 'won', 'result', 'home_away'}
+        self._results: List[dict] = []
+        # Completed events per competitor team ID (schedule order)
+        self._games_by_team: Dict[str, List[dict]] = {}
+        # Events with a parseable start time, sorted by start
+        started: List[Tuple[datetime, int, dict]] = []
+
+        for position, event in enumerate(events or []):
+            start = parse_event_datetime(event)
+            if start is not None:
+                started.append((start, position, event))
+
+            try:
+                comp = event.get('competitions', [{}])[0]
+                status = comp.get('status', {}).get('type', {})
+
+                # Only completed games
+                if not status.get('completed', False):
+                    continue
+
+                competitors = comp.get('competitors', [])
+                team_ids = []
+                our_team = None
+                opponent = None
+                for c in competitors:
+                    team_id = str(c.get('team', {}).get('id'))
+                    team_ids.append(team_id)
+                    if team_id == self.our_team_id:
+                        our_team = c
+                    else:
+                        opponent = c
+
+                for team_id in dict.fromkeys(team_ids):
+                    self._games_by_team.setdefault(team_id, []).append(event)
+
+                if not our_team:
+                    continue
+
+                # Determine result: win, loss, or draw
+                # For draws in soccer, both teams have winner=False
+                won = our_team.get('winner', False)
+                opponent_won = opponent.get('winner', False) if opponent else False
+
+                # result: 'W' for win, 'L' for loss, 'D' for draw
+                if won:
+                    result = 'W'
+                elif not opponent_won:
+                    result = 'D'
+                else:
+                    result = 'L'
+
+                self._results.append({
+                    'date': event.get('date', ''),
+                    'won': won,
+                    'result': result,
+                    'home_away': our_team.get('homeAway', '').lower()
+                })
+
+            except (KeyError, IndexError, TypeError, AttributeError):
+                continue
+
+        started.sort(key=lambda item: (item[0], item[1]))
+        self._start_times = [item[0] for item in started]
+        self._started_events = [item[2] for item in started]
+
+        self.streaks = self._build_streaks()
+        self._h2h: Dict[str, dict] = {}
+
+    # =========================================================================
+    # STREAKS AND RECORDS
+    # =========================================================================
+
+    def _build_streaks(self) -> dict:
+        """Current home/away streaks and last 5/10 records"""
+        all_games = sorted(self._results, key=lambda x: x['date'], reverse=True)
+        home_games = [g for g in all_games if g['home_away'] == 'home']
+        away_games = [g for g in all_games if g['home_away'] == 'away']
+
+        last_5 = all_games[:5]
+        last_10 = all_games[:10]
+
+        return {
+            'home_streak': self._streak(home_games),
+            'away_streak': self._streak(away_games),
+            'last_5_record': self._record(last_5) if len(last_5) >= 5 else '',
+            'last_10_record': self._record(last_10) if len(last_10) >= 10 else ''
+        }
+
+    @staticmethod
+    def _streak(games: List[dict]) -> str:
+        """
+        Streak of the most recent games (newest first), e.g. "W3" or "L2".
+
+        Streaks are consecutive wins or losses; draws break streaks.
+        """
+        if not games:
+            return ""
+
+        first_result = games[0].get('result', 'L')
+
+        # Most recent game was a draw, no active streak
+        if first_result == 'D':
+            return ""
+
+        count = 0
+        for game in games:
+            if game.get('result', 'L') != first_result:
+                break
+            count += 1
+
+        return f"{first_result}{count}"
+
+    @staticmethod
+    def _record(games: List[dict]) -> str:
+        """W-L record, or W-D-L when there are draws (soccer)"""
+        wins = sum(1 for g in games if g.get('result') == 'W')
+        losses = sum(1 for g in games if g.get('result') == 'L')
+        draws = sum(1 for g in games if g.get('result') == 'D')
+
+        if draws > 0:
+            return f"{wins}-{draws}-{losses}"
+        return f"{wins}-{losses}"
+
+    # =========================================================================
+    # HEAD-TO-HEAD
+    # =========================================================================
+
+    def h2h(self, opponent_id: str) -> dict:
+        """
+        Head-to-head data against an opponent (memoized per opponent).
+
+        Returns:
+            {'season_series': {'team_wins', 'opponent_wins', 'games'},
+             'previous_game': {...} or {}}
+        """
+        opponent_id = str(opponent_id)
+        summary = self._h2h.get(opponent_id)
+        if summary is None:
+            summary = self._build_h2h(opponent_id)
+            self._h2h[opponent_id] = summary
+        return summary
+
+    def _build_h2h(self, opponent_id: str) -> dict:
+        h2h_games = list(self._games_by_team.get(opponent_id, []))
+
+        # Calculate series record
+        team_wins = 0
+        opp_wins = 0
+        for event in h2h_games:
+            try:
+                comp = event.get('competitions', [{}])[0]
+                for competitor in comp.get('competitors', []):
+                    team_id = str(competitor.get('team', {}).get('id'))
+                    if team_id == self.our_team_id:
+                        if competitor.get('winner', False):
+                            team_wins += 1
+                    elif team_id == opponent_id:
+                        if competitor.get('winner', False):
+                            opp_wins += 1
+            except Exception:
+                continue
+
+        previous_game = {}
+        if h2h_games:
+            try:
+                # Schedule is already sorted
+                previous_game = self._previous_game(h2h_games[0], opponent_id)
+            except Exception:
+                previous_game = {}
+
+        return {
+            'season_series': {
+                'team_wins': team_wins,
+                'opponent_wins': opp_wins,
+                'games': h2h_games
+            },
+            'previous_game': previous_game
+        }
+
+    def _previous_game(self, recent: dict, opponent_id: str) -> dict:
+        """Summary of the most recent meeting, or {} if either team is missing"""
+        comp = recent.get('competitions', [{}])[0]
+
+        # Find our team and opponent in competitors
+        our_team = None
+        opp_team = None
+        for competitor in comp.get('competitors', []):
+            team_id = str(competitor.get('team', {}).get('id'))
+            if team_id == self.our_team_id:
+                our_team = competitor
+            elif team_id == opponent_id:
+                opp_team = competitor
+
+        if not (our_team and opp_team):
+            return {}
+
+        our_score = self._score_value(our_team.get('score', 0))
+        opp_score = self._score_value(opp_team.get('score', 0))
+
+        if our_score > opp_score:
+            result = 'Win'
+            winner = our_team.get('team', {}).get('displayName', '')
+            loser = opp_team.get('team', {}).get('displayName', '')
+        elif opp_score > our_score:
+            result = 'Loss'
+            winner = opp_team.get('team', {}).get('displayName', '')
+            loser = our_team.get('team', {}).get('displayName', '')
+        else:
+            result = 'Tie'
+            winner = ''
+            loser = ''
+
+        # Parse date
+        game_date_str = recent.get('date', '')
+        if game_date_str:
+            try:
+                game_dt = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
+                date_formatted = game_dt.strftime('%B %d, %Y')
+                days_since = (datetime.now(ZoneInfo('UTC')) - game_dt).days
+            except Exception:
+                date_formatted = game_date_str
+                days_since = 0
+        else:
+            date_formatted = ''
+            days_since = 0
+
+        # Build abbreviated score
+        our_home_away = our_team.get('homeAway', '')
+        our_abbrev = our_team.get('team', {}).get('abbreviation', 'TBD')
+        opp_abbrev = opp_team.get('team', {}).get('abbreviation', 'TBD')
+
+        if our_home_away == 'away':
+            score_abbrev = f"{our_abbrev} {our_score} @ {opp_abbrev} {opp_score}"
+        elif our_home_away == 'home':
+            score_abbrev = f"{our_abbrev} {our_score} vs {opp_abbrev} {opp_score}"
+        else:
+            score_abbrev = f"{our_abbrev} {our_score} - {opp_abbrev} {opp_score}"
+
+        return {
+            'result': result,
+            'score': f"{our_score}-{opp_score}",
+            'score_abbrev': score_abbrev,
+            'winner': winner,
+            'loser': loser,
+            'date': date_formatted,
+            'venue': comp.get('venue', {}).get('fullName', ''),
+            'venue_city': comp.get('venue', {}).get('address', {}).get('city', ''),
+            'days_since': days_since
+        }
+
+    @staticmethod
+    def _score_value(score_raw) -> int:
+        """Score as int (ESPN returns either a number or a {'value', 'displayValue'} dict)"""
+        if isinstance(score_raw, dict):
+            return int(score_raw.get('value', 0) or score_raw.get('displayValue', '0'))
+        return int(score_raw) if score_raw else 0
+
+    # =========================================================================
+    # LAST STARTED GAME
+    # =========================================================================
+
+    def last_started(self, before_datetime: datetime = None) -> Optional[dict]:
+        """
+        Most recent event that has STARTED, regardless of completion status.
+
+        Args:
+            before_datetime: Only include events that started at or before
+                this time (defaults to now)
+
+        Returns:
+            Latest started event (earliest in schedule order on ties), or None
+        """
+        if before_datetime is None:
+            before_datetime = datetime.now(tz=timezone.utc)
+
+        i = bisect_right(self._start_times, before_datetime) - 1
+        if i < 0:
+            return None
+        return self._started_events[bisect_left(self._start_times, self._start_times[i])]
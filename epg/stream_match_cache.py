@@ -23,6 +23,7 @@ import hashlib
 import json
 import logging
 import sqlite3
+import threading
 import time
 from datetime import datetime, date
 from typing import Dict, Optional, Any, Tuple, TYPE_CHECKING
@@ -79,6 +80,23 @@ DYNAMIC_EVENT_FIELDS = {
 }
 
 
+# Insert or refresh one cache entry (shared by set() and flush())
+UPSERT_SQL = """
+    INSERT INTO stream_match_cache
+        (fingerprint, group_id, stream_id, stream_name,
+         event_id, league, cached_event_data, last_seen_generation,
+         created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT (fingerprint)
+    DO UPDATE SET
+        event_id = excluded.event_id,
+        league = excluded.league,
+        cached_event_data = excluded.cached_event_data,
+        last_seen_generation = excluded.last_seen_generation,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
 def compute_fingerprint(group_id: int, stream_id: int, stream_name: str) -> str:
     """
     Compute a hash fingerprint for cache lookup.
@@ -100,7 +118,8 @@ class StreamMatchCache:
     Manages stream fingerprint cache for EPG generation optimization.
 
     Usage:
-        cache = StreamMatchCache(get_connection)
+        cache = StreamMatchCache(get_connection, buffer_writes=True)
+        cache.load_group(group_id)  # One query for every fingerprint in the group
 
         # Check cache before tier matching
         cached = cache.get(group_id, m3u_account_id, stream_id, stream_name)
@@ -113,19 +132,25 @@ class StreamMatchCache:
             # Cache successful match
             cache.set(group_id, m3u_account_id, stream_id, stream_name,
                      event_id, league, cached_data, generation)
+
+        # Write all buffered sets/touches in one transaction
+        cache.flush()
     """
 
     # Number of generations to keep unseen fingerprints before purging
     PURGE_AFTER_GENERATIONS = 5
 
-    def __init__(self, get_connection_func):
+    def __init__(self, get_connection_func, buffer_writes: bool = False):
         """
         Initialize cache with database connection factory.
 
         Args:
             get_connection_func: Function that returns a database connection
+            buffer_writes: Queue set()/touch() in memory until flush() instead of
+                           writing each one immediately
         """
         self.get_connection = get_connection_func
+        self.buffer_writes = buffer_writes
         self._stats = {
             'hits': 0,
             'misses': 0,
@@ -133,6 +158,16 @@ class StreamMatchCache:
             'purged': 0,
         }
 
+        # Rows preloaded by load_group(): fingerprint -> (event_id, league, cached_event_data JSON)
+        # JSON is only decoded on a hit
+        self._preloaded: Dict[str, Tuple[str, str, str]] = {}
+        self._preloaded_groups = set()
+
+        # Buffered writes, keyed by fingerprint (last write wins)
+        self._pending_sets: Dict[str, Tuple] = {}
+        self._pending_touches: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
     def _get_connection_with_timeout(self):
         """Get a database connection with busy_timeout set for concurrent access."""
         conn = self.get_connection()
@@ -153,19 +188,26 @@ class StreamMatchCache:
         Raises:
             sqlite3.OperationalError: If all retries exhausted
         """
+        from database import record_match_cache_lock_wait
+
         last_error = None
         for attempt in range(MAX_RETRIES):
             conn = self._get_connection_with_timeout()
+            started = time.perf_counter()
             try:
                 result = operation_func(conn)
                 return result
             except sqlite3.OperationalError as e:
                 last_error = e
-                if "database is locked" in str(e) and attempt < MAX_RETRIES - 1:
+                locked = "database is locked" in str(e)
+                if locked and attempt < MAX_RETRIES - 1:
                     delay = RETRY_BASE_DELAY * (2 ** attempt)
                     logger.debug(f"[CACHE] {operation_name} retry {attempt + 1}/{MAX_RETRIES} after {delay}s: {e}")
                     time.sleep(delay)
+                    record_match_cache_lock_wait(time.perf_counter() - started)
                 else:
+                    if locked:
+                        record_match_cache_lock_wait(time.perf_counter() - started)
                     raise
             finally:
                 conn.close()
@@ -191,6 +233,17 @@ class StreamMatchCache:
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
 
+        if group_id in self._preloaded_groups:
+            row = self._preloaded.get(fingerprint)
+            if row:
+                self._stats['hits'] += 1
+                event_id, league, cached_json = row
+                logger.debug(f"[CACHE HIT] stream_id={stream_id} -> event_id={event_id}")
+                return (event_id, league, json.loads(cached_json))
+
+            self._stats['misses'] += 1
+            return None
+
         conn = self._get_connection_with_timeout()
         try:
             cursor = conn.cursor()
@@ -238,30 +291,28 @@ class StreamMatchCache:
             generation: Current EPG generation counter
 
         Returns:
-            True if cached successfully
+            True if cached successfully (or queued, when writes are buffered)
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
         cached_json = json.dumps(cached_data, cls=DateTimeEncoder)
+        params = (
+            fingerprint, group_id, stream_id, stream_name,
+            event_id, league, cached_json, generation
+        )
+
+        if self.buffer_writes:
+            with self._lock:
+                self._pending_sets[fingerprint] = params
+                self._pending_touches.pop(fingerprint, None)
+                if group_id in self._preloaded_groups:
+                    self._preloaded[fingerprint] = (event_id, league, cached_json)
+            self._stats['sets'] += 1
+            logger.debug(f"[CACHE SET] stream_id={stream_id} -> event_id={event_id} (buffered)")
+            return True
 
         def do_set(conn):
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO stream_match_cache
-                    (fingerprint, group_id, stream_id, stream_name,
-                     event_id, league, cached_event_data, last_seen_generation,
-                     created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                ON CONFLICT (fingerprint)
-                DO UPDATE SET
-                    event_id = excluded.event_id,
-                    league = excluded.league,
-                    cached_event_data = excluded.cached_event_data,
-                    last_seen_generation = excluded.last_seen_generation,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (
-                fingerprint, group_id, stream_id, stream_name,
-                event_id, league, cached_json, generation
-            ))
+            cursor.execute(UPSERT_SQL, params)
             conn.commit()
             self._stats['sets'] += 1
             logger.debug(f"[CACHE SET] stream_id={stream_id} -> event_id={event_id}")
@@ -294,10 +345,19 @@ class StreamMatchCache:
             generation: Current EPG generation counter
 
         Returns:
-            True if updated
+            True if updated (always True when writes are buffered)
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
 
+        if self.buffer_writes:
+            with self._lock:
+                pending_set = self._pending_sets.get(fingerprint)
+                if pending_set:
+                    self._pending_sets[fingerprint] = pending_set[:-1] + (generation,)
+                else:
+                    self._pending_touches[fingerprint] = generation
+            return True
+
         def do_touch(conn):
             cursor = conn.cursor()
             cursor.execute("""
@@ -314,6 +374,84 @@ class StreamMatchCache:
             logger.warning(f"[CACHE] touch failed after retries: {e}")
             return False
 
+    def load_group(self, group_id: int) -> int:
+        """
+        Preload every cached fingerprint for a group with a single query.
+
+        Afterwards get() for this group is answered from memory. Cached event
+        JSON is only decoded for fingerprints that are actually hit.
+
+        Args:
+            group_id: Event group ID
+
+        Returns:
+            Number of cached entries loaded (get() falls back to per-stream
+            queries if loading fails)
+        """
+        def do_load(conn):
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT fingerprint, event_id, league, cached_event_data
+                FROM stream_match_cache
+                WHERE group_id = ?
+            """, (group_id,))
+            return cursor.fetchall()
+
+        try:
+            rows = self._execute_with_retry('load_group', do_load)
+        except sqlite3.Error as e:
+            logger.warning(f"[CACHE] load_group failed for group {group_id}: {e}")
+            return 0
+
+        with self._lock:
+            for row in rows:
+                self._preloaded[row['fingerprint']] = (
+                    row['event_id'], row['league'], row['cached_event_data']
+                )
+            self._preloaded_groups.add(group_id)
+
+        logger.debug(f"[CACHE] Preloaded {len(rows)} fingerprints for group {group_id}")
+        return len(rows)
+
+    def flush(self) -> int:
+        """
+        Write buffered set()/touch() calls in one transaction.
+
+        Returns:
+            Number of entries written (0 if nothing was pending or the write failed)
+        """
+        with self._lock:
+            pending_sets = list(self._pending_sets.values())
+            pending_touches = [(generation, fingerprint) for fingerprint, generation in self._pending_touches.items()]
+            self._pending_sets.clear()
+            self._pending_touches.clear()
+
+        if not pending_sets and not pending_touches:
+            return 0
+
+        def do_flush(conn):
+            cursor = conn.cursor()
+            if pending_sets:
+                cursor.executemany(UPSERT_SQL, pending_sets)
+            if pending_touches:
+                cursor.executemany("""
+                    UPDATE stream_match_cache
+                    SET last_seen_generation = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE fingerprint = ?
+                """, pending_touches)
+            conn.commit()
+            logger.debug(f"[CACHE FLUSH] {len(pending_sets)} sets, {len(pending_touches)} touches")
+            return len(pending_sets) + len(pending_touches)
+
+        try:
+            return self._execute_with_retry('flush', do_flush)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"[CACHE] flush failed after retries: {e}")
+            return 0
+        except Exception as e:
+            logger.error(f"Failed to flush stream match cache: {e}")
+            return 0
+
     def purge_stale(self, current_generation: int) -> int:
         """
         Remove cache entries not seen in the last N generations.
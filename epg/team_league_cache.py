@@ -19,7 +19,10 @@ Usage:
     TeamLeagueCache.refresh_cache()
 """
 
+import re
+import string
 import time
+import threading
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Set, Any, Tuple
@@ -52,6 +55,17 @@ NON_SOCCER_LEAGUES = [
 # Thread pool size for parallel fetching
 MAX_WORKERS = 100
 
+# Substring length indexed by _SubstringIndex
+NGRAM_SIZE = 3
+
+# SQLite's LOWER() and LIKE only fold ASCII letters - mirror that exactly
+_SQL_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Characters removed by the punctuation-insensitive fallback search
+_PUNCTUATION_RE = re.compile(r"[.'`]")
+
+_DIGITS = str.maketrans('', '', string.digits)
+
 
 # =============================================================================
 # DATA CLASSES
@@ -78,6 +92,115 @@ class TeamInfo:
     leagues: List[str]
 
 
+# =============================================================================
+# IN-MEMORY INDEX
+# =============================================================================
+
+def _sql_lower(value: Optional[str]) -> Optional[str]:
+    """LOWER() as SQLite implements it (ASCII only). None (NULL) stays None."""
+    if value is None:
+        return None
+    return value.translate(_SQL_LOWER)
+
+
+def _strip_punctuation(value: Optional[str]) -> Optional[str]:
+    """Remove periods, apostrophes and backticks (None stays None)."""
+    if value is None:
+        return None
+    return _PUNCTUATION_RE.sub('', value)
+
+
+def _strip_numbers(value: str) -> str:
+    """Remove digits, collapse double spaces and trim - the tier 3 SQL expression."""
+    return value.translate(_DIGITS).replace('  ', ' ').strip(' ')
+
+
+class _SubstringIndex:
+    """
+    Trigram index answering "which values contain this substring" (LIKE '%x%').
+
+    Candidates are the intersection of the needle's trigram posting lists and
+    are then verified with a plain substring test, so results are exact.
+    Needles shorter than a trigram fall back to scanning the values in memory.
+    """
+
+    def __init__(self, values: List[Optional[str]]):
+        self.values = values
+        self.grams: Dict[str, Set[int]] = {}
+        for pos, value in enumerate(values):
+            if not value:
+                continue
+            for i in range(len(value) - NGRAM_SIZE + 1):
+                self.grams.setdefault(value[i:i + NGRAM_SIZE], set()).add(pos)
+
+    def search(self, needle: str) -> Set[int]:
+        """Positions of all non-NULL values containing needle."""
+        if len(needle) < NGRAM_SIZE:
+            return {pos for pos, value in enumerate(self.values) if value is not None and needle in value}
+
+        postings = []
+        for i in range(len(needle) - NGRAM_SIZE + 1):
+            posting = self.grams.get(needle[i:i + NGRAM_SIZE])
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+
+        return {pos for pos in candidates if needle in self.values[pos]}
+
+
+class TeamLeagueIndex:
+    """
+    In-memory copy of the team_league_cache table with lookup indexes.
+
+    Rows are kept in table order as
+    (espn_team_id, team_name, team_abbrev, team_short_name, sport, league_code)
+    and lookups return row positions in that order, so results come out in
+    the same order the full-scan SQL queries produced them.
+    """
+
+    def __init__(self, rows: List[Tuple]):
+        self.rows = rows
+
+        self.rows_by_league: Dict[str, List[int]] = {}
+        self.abbrevs: Dict[str, List[int]] = {}
+        for pos, row in enumerate(rows):
+            self.rows_by_league.setdefault(row[5], []).append(pos)
+            if row[2] is not None:
+                self.abbrevs.setdefault(_sql_lower(row[2]), []).append(pos)
+
+        self.lower_names = [_sql_lower(row[1]) for row in rows]
+        lower_short_names = [_sql_lower(row[3]) for row in rows]
+
+        self.names = _SubstringIndex(self.lower_names)
+        self.short_names = _SubstringIndex(lower_short_names)
+        self.names_stripped = _SubstringIndex([_strip_punctuation(n) for n in self.lower_names])
+        self.short_names_stripped = _SubstringIndex([_strip_punctuation(n) for n in lower_short_names])
+
+    def match(self, variant: str) -> List[int]:
+        """
+        Rows where LOWER(team_name) LIKE '%variant%', LOWER(team_abbrev) = variant
+        or LOWER(team_short_name) LIKE '%variant%'.
+        """
+        positions = self.names.search(variant) | self.short_names.search(variant)
+        positions.update(self.abbrevs.get(variant, ()))
+        return sorted(positions)
+
+    def match_normalized(self, normalized: str) -> List[int]:
+        """Rows whose punctuation-stripped team_name or team_short_name contains normalized."""
+        return sorted(self.names_stripped.search(normalized) | self.short_names_stripped.search(normalized))
+
+    def league_rows(self, league_code: str) -> List[Tuple]:
+        """All rows for a league, in table order."""
+        return [self.rows[pos] for pos in self.rows_by_league.get(league_code, ())]
+
+
 # =============================================================================
 # MAIN CLASS
 # =============================================================================
@@ -88,8 +211,42 @@ class TeamLeagueCache:
 
     All methods are static/class methods - no instance needed.
     Parallel structure to SoccerMultiLeague.
+
+    Name lookups are answered from an in-memory TeamLeagueIndex loaded from
+    the table on first use (and after each refresh), so multi-sport matching
+    doesn't open a connection and full-scan the table per team per stream.
     """
 
+    _index: Optional[TeamLeagueIndex] = None
+    _index_lock = threading.Lock()
+
+    # ==========================================================================
+    # PUBLIC API: In-Memory Index
+    # ==========================================================================
+
+    @classmethod
+    def get_index(cls) -> TeamLeagueIndex:
+        """
+        Get the in-memory index, loading it from the database if needed.
+
+        Returns:
+            TeamLeagueIndex over the current team_league_cache contents
+        """
+        index = cls._index
+        if index is not None:
+            return index
+
+        with cls._index_lock:
+            if cls._index is None:
+                cls._index = cls._load_index()
+            return cls._index
+
+    @classmethod
+    def clear_index(cls):
+        """Drop the in-memory index (reloaded on next lookup)."""
+        with cls._index_lock:
+            cls._index = None
+
     # ==========================================================================
     # PUBLIC API: Cache Queries
     # ==========================================================================
@@ -117,42 +274,25 @@ class TeamLeagueCache:
 
         # Get all abbreviation variants (with/without periods in st/st., mt/mt., etc.)
         variants = get_abbreviation_variants(team_name)
+        index = cls.get_index()
         results = set()
 
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        # Try each variant
+        for variant in variants:
+            for pos in index.match(variant):
+                results.add(index.rows[pos][5])
 
-            # Try each variant
-            for variant in variants:
-                cursor.execute("""
-                    SELECT DISTINCT league_code FROM team_league_cache
-                    WHERE LOWER(team_name) LIKE ?
-                       OR LOWER(team_abbrev) = ?
-                       OR LOWER(team_short_name) LIKE ?
-                """, (f'%{variant}%', variant, f'%{variant}%'))
-                for row in cursor.fetchall():
-                    results.add(row[0])
-
-                if results:
-                    return results
-
-            # Fallback: Also try normalized search (strip ALL punctuation)
-            # This handles cases like "mount st mary's" matching "Mount St. Mary's"
-            import re
-            team_normalized = re.sub(r"[.'`]", '', team_name.lower().strip())
+            if results:
+                return results
 
-            if team_normalized not in variants:
-                cursor.execute("""
-                    SELECT DISTINCT league_code FROM team_league_cache
-                    WHERE REPLACE(REPLACE(REPLACE(LOWER(team_name), '.', ''), '''', ''), '`', '') LIKE ?
-                       OR REPLACE(REPLACE(REPLACE(LOWER(team_short_name), '.', ''), '''', ''), '`', '') LIKE ?
-                """, (f'%{team_normalized}%', f'%{team_normalized}%'))
-                results = {row[0] for row in cursor.fetchall()}
+        # Fallback: Also try normalized search (strip ALL punctuation)
+        # This handles cases like "mount st mary's" matching "Mount St. Mary's"
+        team_normalized = _PUNCTUATION_RE.sub('', team_name.lower().strip())
 
-            return results
-        finally:
-            conn.close()
+        if team_normalized not in variants:
+            results = {index.rows[pos][5] for pos in index.match_normalized(team_normalized)}
+
+        return results
 
     @classmethod
     def find_candidate_leagues(cls, team1: str, team2: str, enabled_leagues: List[str] = None) -> List[str]:
@@ -202,57 +342,38 @@ class TeamLeagueCache:
 
         # Get all abbreviation variants (with/without periods in st/st., mt/mt., etc.)
         variants = get_abbreviation_variants(team_name)
+        index = cls.get_index()
         rows = []
 
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        # Try each variant
+        for variant in variants:
+            variant_rows = [index.rows[pos] for pos in index.match(variant)]
+            if variant_rows:
+                rows.extend(variant_rows)
+                break  # Found results, stop searching variants
 
-            # Try each variant
-            for variant in variants:
-                cursor.execute("""
-                    SELECT espn_team_id, team_name, team_abbrev, team_short_name, sport, league_code
-                    FROM team_league_cache
-                    WHERE LOWER(team_name) LIKE ?
-                       OR LOWER(team_abbrev) = ?
-                       OR LOWER(team_short_name) LIKE ?
-                """, (f'%{variant}%', variant, f'%{variant}%'))
-                variant_rows = cursor.fetchall()
-                if variant_rows:
-                    rows.extend(variant_rows)
-                    break  # Found results, stop searching variants
-
-            # Fallback: try normalized search (strip ALL punctuation)
-            if not rows:
-                import re
-                team_normalized = re.sub(r"[.'`]", '', team_name.lower().strip())
-                if team_normalized not in variants:
-                    cursor.execute("""
-                        SELECT espn_team_id, team_name, team_abbrev, team_short_name, sport, league_code
-                        FROM team_league_cache
-                        WHERE REPLACE(REPLACE(REPLACE(LOWER(team_name), '.', ''), '''', ''), '`', '') LIKE ?
-                           OR REPLACE(REPLACE(REPLACE(LOWER(team_short_name), '.', ''), '''', ''), '`', '') LIKE ?
-                    """, (f'%{team_normalized}%', f'%{team_normalized}%'))
-                    rows = cursor.fetchall()
-
-            # Group by team_id
-            teams_by_id = {}
-            for row in rows:
-                team_id = row[0]
-                if team_id not in teams_by_id:
-                    teams_by_id[team_id] = {
-                        'espn_team_id': team_id,
-                        'team_name': row[1],
-                        'team_abbrev': row[2] or '',
-                        'team_short_name': row[3] or '',
-                        'sport': row[4],
-                        'leagues': []
-                    }
-                teams_by_id[team_id]['leagues'].append(row[5])
-
-            return [TeamInfo(**info) for info in teams_by_id.values()]
-        finally:
-            conn.close()
+        # Fallback: try normalized search (strip ALL punctuation)
+        if not rows:
+            team_normalized = _PUNCTUATION_RE.sub('', team_name.lower().strip())
+            if team_normalized not in variants:
+                rows = [index.rows[pos] for pos in index.match_normalized(team_normalized)]
+
+        # Group by team_id
+        teams_by_id = {}
+        for row in rows:
+            team_id = row[0]
+            if team_id not in teams_by_id:
+                teams_by_id[team_id] = {
+                    'espn_team_id': team_id,
+                    'team_name': row[1],
+                    'team_abbrev': row[2] or '',
+                    'team_short_name': row[3] or '',
+                    'sport': row[4],
+                    'leagues': []
+                }
+            teams_by_id[team_id]['leagues'].append(row[5])
+
+        return [TeamInfo(**info) for info in teams_by_id.values()]
 
     @classmethod
     def get_team_id_for_league(cls, team_name: str, league_code: str) -> Optional[str]:
@@ -284,92 +405,64 @@ class TeamLeagueCache:
         from epg.league_detector import (
             get_abbreviation_variants, strip_accents, normalize_team_name
         )
-        import re
 
         team_lower = team_name.lower().strip()
         team_accent_stripped = strip_accents(team_lower)
         team_stripped = normalize_team_name(team_lower, strip_articles=False)
         team_normalized = normalize_team_name(team_lower, strip_articles=True)
 
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-
-            # Tier 1: Direct match with abbreviation variants (st/st., mt/mt.)
-            for variant in get_abbreviation_variants(team_name):
-                cursor.execute("""
-                    SELECT espn_team_id, team_name
-                    FROM team_league_cache
-                    WHERE league_code = ?
-                      AND (LOWER(team_name) LIKE ?
-                           OR LOWER(team_abbrev) = ?
-                           OR LOWER(team_short_name) LIKE ?
-                           OR INSTR(?, LOWER(team_name)) > 0)
-                    ORDER BY LENGTH(team_name) ASC
-                    LIMIT 1
-                """, (league_code, f'%{variant}%', variant, f'%{variant}%', variant))
-                row = cursor.fetchone()
-                if row:
-                    logger.debug(f"Team '{team_name}' matched via direct lookup in {league_code}: {row[1]} (ID {row[0]})")
-                    return str(row[0])
-
-            # Tier 2: Accent-normalized match
-            # Handles "Atletico" (stream) matching "Atlético" (DB)
-            cursor.execute("""
-                SELECT espn_team_id, team_name FROM team_league_cache
-                WHERE league_code = ?
-            """, (league_code,))
-            for row in cursor.fetchall():
+        index = cls.get_index()
+        league_rows = index.league_rows(league_code)
+
+        def shortest(rows):
+            # ORDER BY LENGTH(team_name) ASC LIMIT 1 (ties keep table order)
+            return min(rows, key=lambda row: len(row[1])) if rows else None
+
+        # Tier 1: Direct match with abbreviation variants (st/st., mt/mt.)
+        league_positions = set(index.rows_by_league.get(league_code, ()))
+        for variant in get_abbreviation_variants(team_name):
+            matched = set(pos for pos in index.match(variant) if pos in league_positions)
+            # Also match when the cached name appears inside the search text
+            matched.update(pos for pos in league_positions if index.lower_names[pos] in variant)
+            row = shortest([index.rows[pos] for pos in sorted(matched)])
+            if row:
+                logger.debug(f"Team '{team_name}' matched via direct lookup in {league_code}: {row[1]} (ID {row[0]})")
+                return str(row[0])
+
+        # Tier 2: Accent-normalized match
+        # Handles "Atletico" (stream) matching "Atlético" (DB)
+        for row in league_rows:
+            db_normalized = strip_accents(row[1].lower())
+            if team_accent_stripped in db_normalized or db_normalized in team_accent_stripped:
+                logger.debug(f"Team '{team_name}' matched via accent-stripping in {league_code}: {row[1]} (ID {row[0]})")
+                return str(row[0])
+
+        # Tier 3: Number-stripped match
+        # Handles "SV Elversberg" (stream) matching "SV 07 Elversberg" (DB)
+        if team_stripped != team_lower:
+            row = shortest([
+                row for row in league_rows
+                if team_stripped in _strip_numbers(_sql_lower(row[1]))
+                or _strip_numbers(_sql_lower(row[1])) in team_stripped
+            ])
+            if row:
+                logger.debug(f"Team '{team_name}' matched via number-stripping in {league_code}: {row[1]} (ID {row[0]})")
+                return str(row[0])
+
+        # Tier 4: Article-stripped match (de, del, da, do, di, du)
+        if team_normalized != team_stripped:
+            for row in league_rows:
                 db_normalized = strip_accents(row[1].lower())
-                if team_accent_stripped in db_normalized or db_normalized in team_accent_stripped:
-                    logger.debug(f"Team '{team_name}' matched via accent-stripping in {league_code}: {row[1]} (ID {row[0]})")
-                    return str(row[0])
-
-            # Tier 3: Number-stripped match
-            # Handles "SV Elversberg" (stream) matching "SV 07 Elversberg" (DB)
-            if team_stripped != team_lower:
-                # SQL expression to strip numbers from team_name
-                sql_strip_numbers = """
-                    TRIM(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(
-                        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(
-                            LOWER(team_name), '0', ''), '1', ''), '2', ''), '3', ''), '4', ''),
-                        '5', ''), '6', ''), '7', ''), '8', ''), '9', ''), '  ', ' '))
-                """
-                cursor.execute(f"""
-                    SELECT espn_team_id, team_name FROM team_league_cache
-                    WHERE league_code = ? AND (
-                        {sql_strip_numbers} LIKE ?
-                        OR {sql_strip_numbers} LIKE ?
-                        OR INSTR(?, {sql_strip_numbers}) > 0
-                    )
-                    ORDER BY LENGTH(team_name) ASC
-                    LIMIT 1
-                """, (league_code, f'%{team_stripped}%', f'{team_stripped}%', team_stripped))
-                row = cursor.fetchone()
-                if row:
-                    logger.debug(f"Team '{team_name}' matched via number-stripping in {league_code}: {row[1]} (ID {row[0]})")
+                # Strip articles from DB value too
+                db_articles_stripped = re.sub(r'\b(de|del|da|do|di|du)\b', '', db_normalized, flags=re.I)
+                db_articles_stripped = re.sub(r'\s+', ' ', db_articles_stripped).strip()
+                if team_normalized in db_articles_stripped:
+                    logger.debug(f"Team '{team_name}' matched via article-stripping in {league_code}: {row[1]} (ID {row[0]})")
                     return str(row[0])
 
-            # Tier 4: Article-stripped match (de, del, da, do, di, du)
-            if team_normalized != team_stripped:
-                cursor.execute("""
-                    SELECT espn_team_id, team_name FROM team_league_cache
-                    WHERE league_code = ?
-                """, (league_code,))
-                for row in cursor.fetchall():
-                    db_normalized = strip_accents(row[1].lower())
-                    # Strip articles from DB value too
-                    db_articles_stripped = re.sub(r'\b(de|del|da|do|di|du)\b', '', db_normalized, flags=re.I)
-                    db_articles_stripped = re.sub(r'\s+', ' ', db_articles_stripped).strip()
-                    if team_normalized in db_articles_stripped:
-                        logger.debug(f"Team '{team_name}' matched via article-stripping in {league_code}: {row[1]} (ID {row[0]})")
-                        return str(row[0])
-
-            # No match found
-            logger.debug(f"Team '{team_name}' not found in {league_code}")
-            return None
-        finally:
-            conn.close()
+        # No match found
+        logger.debug(f"Team '{team_name}' not found in {league_code}")
+        return None
 
     @classmethod
     def get_cache_stats(cls) -> CacheStats:
@@ -491,6 +584,9 @@ class TeamLeagueCache:
             # Save to database
             cls._save_cache(all_teams)
 
+            # Load the fresh data into the in-memory index
+            cls.get_index()
+
             # Update metadata
             duration = time.time() - start_time
             cls._update_cache_meta(len(leagues_to_index), len(all_teams), duration)
@@ -651,9 +747,35 @@ class TeamLeagueCache:
     # PRIVATE: Database Operations
     # ==========================================================================
 
+    @classmethod
+    def _load_index(cls) -> TeamLeagueIndex:
+        """Read the whole team_league_cache table into a TeamLeagueIndex."""
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT espn_team_id, team_name, team_abbrev, team_short_name, sport, league_code
+                FROM team_league_cache
+                ORDER BY id
+            """)
+            index = TeamLeagueIndex([tuple(row) for row in cursor.fetchall()])
+            logger.debug(f"Loaded {len(index.rows)} teams into team-league index")
+            return index
+        finally:
+            conn.close()
+
     @classmethod
     def _save_cache(cls, teams: List[Dict]):
-        """Save cache data to database."""
+        """
+        Save cache data to database.
+
+        Each row also stores the team's normalized search names (built once
+        here with TeamMatcher's rules) so matchers load ready-to-use name
+        tables instead of normalizing every team at startup.
+        """
+        from epg.team_matcher import TeamMatcher, team_from_cache_row, pack_search_names
+
+        name_builder = TeamMatcher(espn_client=None)
         conn = get_connection()
         cursor = conn.cursor()
 
@@ -672,10 +794,15 @@ class TeamLeagueCache:
 
             # Insert teams
             for team in unique_teams:
+                search_team = team_from_cache_row(
+                    team['espn_team_id'], team['team_name'], team['team_abbrev'], team['team_short_name']
+                )
+                name_builder._build_search_names(search_team)
+
                 cursor.execute("""
                     INSERT INTO team_league_cache
-                    (league_code, espn_team_id, team_name, team_abbrev, team_short_name, sport)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    (league_code, espn_team_id, team_name, team_abbrev, team_short_name, sport, search_names)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (
                     team['league_code'],
                     team['espn_team_id'],
@@ -683,11 +810,15 @@ class TeamLeagueCache:
                     team['team_abbrev'],
                     team['team_short_name'],
                     team['sport'],
+                    pack_search_names(search_team),
                 ))
 
             conn.commit()
             logger.info(f"Saved {len(unique_teams)} teams to team_league_cache (deduped from {len(teams)})")
 
+            # Lookups must not keep serving the previous data
+            cls.clear_index()
+
         except Exception as e:
             conn.rollback()
             logger.error(f"Failed to save cache: {e}")
@@ -12,6 +12,7 @@ Key Features:
 - Date extraction for disambiguating multiple matchups
 """
 
+import json
 import re
 import threading
 from datetime import datetime, timedelta
@@ -98,6 +99,211 @@ CITY_NAME_VARIANTS = {
 _shared_team_cache: Dict[str, Dict] = {}
 _shared_team_cache_lock = threading.Lock()
 
+# Word tokens as seen by \b in the team-name patterns
+_WORD_TOKEN_RE = re.compile(r'\w+')
+
+
+def team_from_cache_row(espn_team_id: str, team_name: str, team_abbrev: Optional[str],
+                        team_short_name: Optional[str]) -> Dict:
+    """
+    Convert a team_league_cache row into a team dict matching the ESPN API format.
+
+    Shared by TeamMatcher (loading) and TeamLeagueCache (precomputing search
+    names on refresh) so both see the same fields.
+    """
+    return {
+        'id': espn_team_id,
+        'displayName': team_name,
+        'name': team_name,  # Use full name as name too
+        'abbreviation': team_abbrev,
+        'shortName': team_short_name,
+        'slug': team_name.lower().replace(' ', '-') if team_name else '',
+    }
+
+
+# Version of the rules TeamMatcher._build_search_names / _normalize_text apply.
+# Bump it whenever those rules change: persisted search names with another
+# version are ignored and rebuilt.
+SEARCH_NAMES_VERSION = 1
+
+
+def pack_search_names(team: Dict) -> str:
+    """
+    Serialize a team's built search names for team_league_cache.search_names.
+
+    Stored as compact JSON: [version, [primary...], [secondary...]]
+    """
+    return json.dumps(
+        [SEARCH_NAMES_VERSION, team.get('_primary_names', []), team.get('_secondary_names', [])],
+        separators=(',', ':'), ensure_ascii=False
+    )
+
+
+def unpack_search_names(team: Dict, packed: Optional[str]) -> bool:
+    """
+    Restore search names persisted by pack_search_names onto a team dict.
+
+    Sets _primary_names, _secondary_names and _search_names exactly as
+    TeamMatcher._build_search_names would.
+
+    Returns:
+        True if the names were restored, False if missing, unreadable or
+        built with a different SEARCH_NAMES_VERSION
+    """
+    if not packed:
+        return False
+    try:
+        version, primary, secondary = json.loads(packed)
+    except (ValueError, TypeError):
+        return False
+    if version != SEARCH_NAMES_VERSION:
+        return False
+    team['_primary_names'] = primary
+    team['_secondary_names'] = secondary
+    team['_search_names'] = primary + secondary
+    return True
+
+
+class TeamNameIndex:
+    """
+    Precomputed lookup tables for finding a team name in stream text.
+
+    Built once per league in _get_teams_for_league (stored alongside the
+    team list in _shared_team_cache) so _find_team_in_text no longer builds
+    and runs a regex for every name of every team on each stream side.
+
+    Tables (all keyed by lowercase name, values are positions in the team list
+    so ties resolve to the first team, exactly like the linear scan did):
+    - exact: every primary/secondary name
+    - input_prefix: every 3+ char prefix of a primary name
+    - primary / secondary: 3+ char names for word-boundary and name-prefix matching
+
+    Word-boundary candidates are found by looking up the substrings that start
+    and end on word-token boundaries of the input (at most max_name_tokens
+    tokens long), so a lookup costs time linear in the input, not in the
+    number of teams. Names that start or end with a non-word character can't
+    be found that way and keep a precompiled pattern instead.
+    """
+
+    def __init__(self, teams: List[Dict]):
+        """
+        Args:
+            teams: Team dicts with _primary_names/_secondary_names (see _build_search_names)
+        """
+        self.teams = teams
+        self.exact: Dict[str, int] = {}
+        self.input_prefix: Dict[str, int] = {}
+        self.primary: Dict[str, int] = {}
+        self.secondary: Dict[str, int] = {}
+        self.word_names = set()
+        self.max_name_tokens = 0
+        self.pattern_names: List[Tuple[Any, str]] = []
+
+        for idx, team in enumerate(teams):
+            for name in team.get('_primary_names', []):
+                if not name:
+                    continue
+                name = name.lower()
+                self.exact.setdefault(name, idx)
+                for end in range(3, len(name) + 1):
+                    self.input_prefix.setdefault(name[:end], idx)
+                if len(name) >= 3:
+                    self.primary.setdefault(name, idx)
+
+            for name in team.get('_secondary_names', []):
+                if not name:
+                    continue
+                name = name.lower()
+                self.exact.setdefault(name, idx)
+                if len(name) >= 3:
+                    self.secondary.setdefault(name, idx)
+
+        for name in set(self.primary) | set(self.secondary):
+            tokens = _WORD_TOKEN_RE.findall(name)
+            if tokens and name.startswith(tokens[0]) and name.endswith(tokens[-1]):
+                self.word_names.add(name)
+                self.max_name_tokens = max(self.max_name_tokens, len(tokens))
+            else:
+                self.pattern_names.append((re.compile(r'\b' + re.escape(name) + r'\b'), name))
+
+        # Longest first, so the first hit is the longest name-prefix match
+        self.primary_lengths = sorted({len(name) for name in self.primary}, reverse=True)
+
+    def _word_matches(self, text: str):
+        """Yield indexed names that appear in text as whole words."""
+        spans = [(m.start(), m.end()) for m in _WORD_TOKEN_RE.finditer(text)]
+        for i, (start, _) in enumerate(spans):
+            for j in range(i, min(i + self.max_name_tokens, len(spans))):
+                candidate = text[start:spans[j][1]]
+                if candidate in self.word_names:
+                    yield candidate
+
+        for pattern, name in self.pattern_names:
+            if pattern.search(text):
+                yield name
+
+    def find(self, text: str) -> Optional[Dict]:
+        """
+        Find the best matching team for stripped, lowercase text.
+
+        See TeamMatcher._find_team_in_text for the priority rules.
+        """
+        idx = self.exact.get(text)
+        if idx is not None:
+            return self.teams[idx]
+
+        no_team = len(self.teams)
+
+        # Input is prefix of a primary name - first team wins, length is len(text)
+        input_prefix_idx = self.input_prefix.get(text) if len(text) >= 3 else None
+        input_prefix_length = len(text) if input_prefix_idx is not None else 0
+
+        # Whole word match - longest wins, then earliest (team, primary-before-secondary).
+        # A secondary name only counts for teams before the first input-prefix match.
+        word_key = None
+        word_match_length = 0
+        secondary_cutoff = input_prefix_idx if input_prefix_idx is not None else no_team
+        for name in self._word_matches(text):
+            keys = []
+            if name in self.primary:
+                keys.append((self.primary[name], 0))
+            secondary_idx = self.secondary.get(name, no_team)
+            if secondary_idx < secondary_cutoff:
+                keys.append((secondary_idx, 1))
+            for key in keys:
+                if len(name) > word_match_length or (len(name) == word_match_length and key < word_key):
+                    word_key = key
+                    word_match_length = len(name)
+
+        # Primary name is prefix of input - longest wins
+        name_prefix_idx = None
+        name_prefix_length = 0
+        for length in self.primary_lengths:
+            if length <= len(text):
+                idx = self.primary.get(text[:length])
+                if idx is not None:
+                    name_prefix_idx = idx
+                    name_prefix_length = length
+                    break
+
+        input_prefix_match = self.teams[input_prefix_idx] if input_prefix_idx is not None else None
+        word_match = self.teams[word_key[0]] if word_key is not None else None
+        name_prefix_match = self.teams[name_prefix_idx] if name_prefix_idx is not None else None
+
+        # Same cross-tier preference as the original scan
+        if input_prefix_match and input_prefix_length >= word_match_length:
+            return input_prefix_match
+        if word_match and word_match_length > name_prefix_length:
+            return word_match
+        if input_prefix_match:
+            return input_prefix_match
+        if word_match:
+            return word_match
+        if name_prefix_match:
+            return name_prefix_match
+
+        return None
+
 
 def extract_date_from_text(text: str) -> Optional[datetime]:
     """
@@ -319,6 +525,11 @@ class TeamMatcher:
         all teams for non-soccer leagues. This avoids hitting ESPN API during
         EPG generation.
 
+        Search names precomputed by TeamLeagueCache.refresh_cache are restored
+        onto the team dicts. Rows without usable names (cache built before the
+        column existed, or with an older SEARCH_NAMES_VERSION) get them built
+        here and written back, so the next load finds them current.
+
         Args:
             league_code: League code (e.g., 'nfl', 'mens-college-basketball')
 
@@ -328,10 +539,11 @@ class TeamMatcher:
         if not self.db_connection_func:
             return None
 
+        conn = None
         try:
             conn = self.db_connection_func()
             cursor = conn.execute("""
-                SELECT espn_team_id, team_name, team_abbrev, team_short_name, sport
+                SELECT espn_team_id, team_name, team_abbrev, team_short_name, sport, search_names
                 FROM team_league_cache
                 WHERE league_code = ?
             """, (league_code.lower(),))
@@ -342,23 +554,26 @@ class TeamMatcher:
 
             # Convert DB rows to team dicts matching ESPN API format
             teams = []
+            rebuilt = []
             for row in rows:
-                team = {
-                    'id': row[0],
-                    'displayName': row[1],
-                    'name': row[1],  # Use full name as name too
-                    'abbreviation': row[2],
-                    'shortName': row[3],
-                    'slug': row[1].lower().replace(' ', '-') if row[1] else '',
-                }
+                team = team_from_cache_row(row[0], row[1], row[2], row[3])
+                if not unpack_search_names(team, row[5]):
+                    team['_search_names'] = self._build_search_names(team)
+                    rebuilt.append((pack_search_names(team), league_code.lower(), row[0]))
                 teams.append(team)
 
+            if rebuilt:
+                self._save_rebuilt_search_names(conn, league_code, rebuilt)
+
             logger.debug(f"Loaded {len(teams)} teams for {league_code} from DB cache")
             return teams
 
         except Exception as e:
             logger.warning(f"Error loading teams from DB cache for {league_code}: {e}")
             return None
+        finally:
+            if conn is not None:
+                conn.close()
 
     def _get_teams_for_league(self, league_code: str) -> List[Dict]:
         """
@@ -422,19 +637,43 @@ class TeamMatcher:
                 logger.warning(f"No teams returned for {league_code}")
                 return []
 
-            # Build search index with normalized names
+            # Build search index with normalized names (DB cache rows usually
+            # arrive with them precomputed by TeamLeagueCache.refresh_cache)
             for team in teams:
-                team['_search_names'] = self._build_search_names(team)
+                if '_search_names' not in team:
+                    team['_search_names'] = self._build_search_names(team)
 
-            # Cache results
+            # Cache results (with the name index used by _find_team_in_text)
             _shared_team_cache[league_lower] = {
                 'teams': teams,
+                'index': TeamNameIndex(teams),
                 'fetched_at': datetime.now()
             }
 
             logger.info(f"Cached {len(teams)} teams for {league_code}")
             return teams
 
+    def _get_team_index(self, league_code: str, teams: List[Dict]) -> TeamNameIndex:
+        """
+        Get the cached TeamNameIndex for a league's team list.
+
+        Falls back to building one if teams didn't come from the shared cache
+        (or the cache entry was refreshed since teams was fetched).
+
+        Args:
+            league_code: League code
+            teams: Team list returned by _get_teams_for_league
+
+        Returns:
+            TeamNameIndex over teams
+        """
+        with _shared_team_cache_lock:
+            cached = _shared_team_cache.get(league_code.lower())
+
+        if cached and cached['teams'] is teams and cached.get('index'):
+            return cached['index']
+        return TeamNameIndex(teams)
+
     def _fetch_college_teams(self, sport: str, league: str) -> List[Dict]:
         """
         Fetch all teams for a college league using get_all_teams_by_conference().
@@ -472,6 +711,27 @@ class TeamMatcher:
         logger.info(f"Fetched {len(teams)} college teams for {league}")
         return teams
 
+    @staticmethod
+    def _save_rebuilt_search_names(conn, league_code: str, rebuilt: List[tuple]):
+        """
+        Write search names rebuilt on load back to team_league_cache.
+
+        Args:
+            conn: Open database connection
+            league_code: League code (for logging)
+            rebuilt: (packed search_names, league_code, espn_team_id) tuples
+        """
+        try:
+            conn.executemany("""
+                UPDATE team_league_cache SET search_names = ?
+                WHERE league_code = ? AND espn_team_id = ?
+            """, rebuilt)
+            conn.commit()
+            logger.debug(f"Rebuilt search names for {len(rebuilt)} {league_code} teams in DB cache")
+        except Exception as e:
+            # Names are already on the team dicts; only the write-back is lost
+            logger.warning(f"Error saving rebuilt search names for {league_code}: {e}")
+
     def _build_search_names(self, team: Dict) -> List[str]:
         """
         Build list of normalized search names for a team.
@@ -873,7 +1133,12 @@ class TeamMatcher:
 
         return (None, -1)
 
-    def _find_team_in_text(self, text: str, teams: List[Dict]) -> Optional[Dict]:
+    def _find_team_in_text(
+        self,
+        text: str,
+        teams: List[Dict],
+        index: Optional[TeamNameIndex] = None
+    ) -> Optional[Dict]:
         """
         Find a team match in the given text.
 
@@ -888,9 +1153,13 @@ class TeamMatcher:
         (because input is prefix of "washington state cougars") rather than Washington
         Huskies (where "washington" appears as a word in input).
 
+        Lookups go through a TeamNameIndex, so the cost depends on the length
+        of the text rather than the number of teams in the league.
+
         Args:
             text: Normalized text to search in
             teams: List of team dicts with _search_names, _primary_names, _secondary_names
+            index: Prebuilt TeamNameIndex for teams (built on the fly if not given)
 
         Returns:
             Team dict or None
@@ -899,86 +1168,9 @@ class TeamMatcher:
         if not text:
             return None
 
-        # Track matches by tier, keeping the longest match in each tier
-        # Tier 1: Input is prefix of search name (e.g., "washington state" prefix of "washington state cougars")
-        input_prefix_match = None
-        input_prefix_length = 0
-
-        # Tier 2: Word boundary match (search name appears as whole word in input)
-        word_match = None
-        word_match_length = 0
-
-        # Tier 3: Search name is prefix of input (e.g., "washington" prefix of "washington state")
-        name_prefix_match = None
-        name_prefix_length = 0
-
-        for team in teams:
-            # Check primary names (team-specific: nickname, displayName, abbreviation)
-            for search_name in team.get('_primary_names', []):
-                if not search_name:
-                    continue
-                search_lower = search_name.lower()
-
-                # Exact match - immediate return
-                if text == search_lower:
-                    return team
-
-                # Input is prefix of search name
-                # e.g., "washington state" is prefix of "washington state cougars"
-                if search_lower.startswith(text) and len(text) >= 3:
-                    if len(text) > input_prefix_length:
-                        input_prefix_match = team
-                        input_prefix_length = len(text)
-
-                # Whole word match
-                if len(search_lower) >= 3:
-                    pattern = r'\b' + re.escape(search_lower) + r'\b'
-                    if re.search(pattern, text):
-                        if len(search_lower) > word_match_length:
-                            word_match = team
-                            word_match_length = len(search_lower)
-
-                # Search name is prefix of input
-                # e.g., "washington" is prefix of "washington state"
-                if text.startswith(search_lower) and len(search_lower) >= 3:
-                    if len(search_lower) > name_prefix_length:
-                        name_prefix_match = team
-                        name_prefix_length = len(search_lower)
-
-            # Check secondary names (location-only, lower priority)
-            for search_name in team.get('_secondary_names', []):
-                if not search_name:
-                    continue
-                search_lower = search_name.lower()
-
-                # Exact match - immediate return
-                if text == search_lower:
-                    return team
-
-                # Only check word boundary for secondary names (not prefix matches)
-                # to avoid location-only matches taking precedence
-                if len(search_lower) >= 3:
-                    pattern = r'\b' + re.escape(search_lower) + r'\b'
-                    if re.search(pattern, text):
-                        # Only use if we don't have a better primary match
-                        if len(search_lower) > word_match_length and not input_prefix_match:
-                            word_match = team
-                            word_match_length = len(search_lower)
-
-        # Return best match, preferring longer matches
-        # Compare across tiers - a significantly longer match should win
-        if input_prefix_match and input_prefix_length >= word_match_length:
-            return input_prefix_match
-        if word_match and word_match_length > name_prefix_length:
-            return word_match
-        if input_prefix_match:
-            return input_prefix_match
-        if word_match:
-            return word_match
-        if name_prefix_match:
-            return name_prefix_match
-
-        return None
+        if index is None:
+            index = TeamNameIndex(teams)
+        return index.find(text)
 
     def _find_all_matching_teams(self, text: str, teams: List[Dict], max_results: int = 5) -> List[Dict]:
         """
@@ -1190,19 +1382,20 @@ class TeamMatcher:
 
         try:
             conn = self.db_connection_func()
-            cursor = conn.cursor()
-
-            # Look for exact alias match
-            result = cursor.execute(
-                """
-                SELECT espn_team_id, espn_team_name
-                FROM team_aliases
-                WHERE alias = ? AND league = ?
-                """,
-                (text.lower().strip(), league.lower())
-            ).fetchone()
-
-            conn.close()
+            try:
+                cursor = conn.cursor()
+
+                # Look for exact alias match
+                result = cursor.execute(
+                    """
+                    SELECT espn_team_id, espn_team_name
+                    FROM team_aliases
+                    WHERE alias = ? AND league = ?
+                    """,
+                    (text.lower().strip(), league.lower())
+                ).fetchone()
+            finally:
+                conn.close()
 
             if result:
                 return {
@@ -1240,7 +1433,7 @@ class TeamMatcher:
             return alias_match
 
         # 2. Check ESPN team database
-        team_match = self._find_team_in_text(normalized, teams)
+        team_match = self._find_team_in_text(normalized, teams, self._get_team_index(league, teams))
         if team_match:
             logger.debug(f"ESPN match: '{text}' -> {team_match.get('name')}")
             return team_match
@@ -1769,23 +1962,23 @@ class TeamMatcher:
         else:
             result['game_time'] = extract_time_from_text(stream_name)
 
-        # Try to detect league from indicators in stream name
-        from epg.league_detector import LEAGUE_INDICATORS, SPORT_INDICATORS, get_sport_for_league
+        # Try to detect league from indicators in stream name (one pass for all indicators)
+        from epg.league_detector import (
+            LEAGUE_INDICATOR_MATCHER, SPORT_INDICATOR_MATCHER, get_sport_for_league
+        )
         from database import normalize_league_code
-        import re
 
-        for pattern, league in LEAGUE_INDICATORS.items():
-            if re.search(pattern, stream_name, re.IGNORECASE):
-                # Normalize alias to ESPN slug (single source of truth)
-                result['detected_league'] = normalize_league_code(league)
-                result['detected_sport'] = get_sport_for_league(league)
-                break
+        league_indicator = LEAGUE_INDICATOR_MATCHER.search(stream_name)
+        if league_indicator:
+            league = league_indicator[1]
+            # Normalize alias to ESPN slug (single source of truth)
+            result['detected_league'] = normalize_league_code(league)
+            result['detected_sport'] = get_sport_for_league(league)
 
         if not result['detected_league']:
-            for pattern, leagues in SPORT_INDICATORS.items():
-                if re.search(pattern, stream_name, re.IGNORECASE):
-                    result['detected_sport'] = pattern.strip(r'\b').lower()
-                    break
+            sport_indicator = SPORT_INDICATOR_MATCHER.search(stream_name)
+            if sport_indicator:
+                result['detected_sport'] = sport_indicator[0].strip(r'\b').lower()
 
         # Extract teams using custom or default pattern
         if custom_regex_teams_enabled and custom_regex_teams:
@@ -1839,6 +2032,19 @@ class TeamMatcher:
                 _shared_team_cache.clear()
         logger.info(f"Team cache cleared: {league or 'all'}")
 
+    def warm_league(self, league: str, load_teams: bool = True) -> None:
+        """
+        Load a league's config and, if load_teams, its team list (with
+        normalized search names) into the shared caches ahead of matching.
+
+        Args:
+            league: League code
+            load_teams: Also load the team list
+        """
+        self._get_league_config(league)
+        if load_teams:
+            self._get_teams_for_league(league)
+
     def get_teams_for_league(self, league: str) -> List[Dict]:
         """
         Public method to get teams for a league (for UI dropdowns, etc).
@@ -0,0 +1,139 @@
+"""
+Compiled Templates and Lazy Template Variables
+
+Shared by TemplateEngine (team channels) and EventTemplateEngine (event
+channels). A template string is parsed once into literal text and the
+variable names it references; resolving it only computes those variables.
+
+Variables are produced by sections - small builders that each fill a group
+of related variables (e.g. venue, odds, broadcast). LazyVariables runs a
+section the first time one of its variables is looked up and keeps the
+result, so every template resolved against the same context (title,
+subtitle, description, categories) shares the work.
+
+Usage:
+    compiled = compile_template(template, VARIABLE_PATTERN)
+    text = compiled.render(variables)
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+# Compiled templates kept per (pattern, template string); templates come from
+# user settings, so the working set is small
+MAX_COMPILED_TEMPLATES = 2048
+
+_compiled_templates: Dict[Tuple[str, str], 'CompiledTemplate'] = {}
+_compiled_templates_lock = threading.Lock()
+
+
+class CompiledTemplate:
+    """
+    A template split into literal text and variable references.
+
+    parts alternates literal, variable, literal, ... and always starts and
+    ends with a literal, so rendering is a single join.
+    """
+
+    __slots__ = ('source', 'parts', 'variables')
+
+    def __init__(self, source: str, pattern: Pattern):
+        self.source = source
+        self.parts: List[str] = pattern.split(source)
+        # Unique referenced names, in order of first use
+        self.variables: Tuple[str, ...] = tuple(dict.fromkeys(self.parts[1::2]))
+
+    def render(self, variables: Mapping) -> str:
+        """Substitute every variable reference (unknown names become '')."""
+        parts = self.parts
+        if len(parts) == 1:
+            return parts[0]
+        out = list(parts)
+        for i in range(1, len(parts), 2):
+            out[i] = str(variables.get(parts[i], ''))
+        return ''.join(out)
+
+
+def compile_template(template: str, pattern: Pattern) -> CompiledTemplate:
+    """
+    Get the compiled form of a template, parsing it on first use.
+
+    Args:
+        template: Template string with {variable} placeholders
+        pattern: Compiled regex with ONE capture group for the variable name
+
+    Returns:
+        CompiledTemplate (shared; treat as read-only)
+    """
+    key = (pattern.pattern, template)
+    compiled = _compiled_templates.get(key)
+    if compiled is None:
+        compiled = CompiledTemplate(template, pattern)
+        with _compiled_templates_lock:
+            if len(_compiled_templates) >= MAX_COMPILED_TEMPLATES:
+                _compiled_templates.clear()
+            _compiled_templates[key] = compiled
+    return compiled
+
+
+class LazyVariables(Mapping):
+    """
+    Read-only mapping of template variables computed section by section.
+
+    Subclasses list their sections in SECTIONS as
+    (method_name, (variable names it sets...)); each method receives the
+    values dict and fills in its variables. A section may look up variables
+    from other sections with self.get().
+
+    Iterating (or len()) builds every section, which is only needed when a
+    caller wants the full variable set.
+    """
+
+    SECTIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+
+    # Built per subclass on first use: variable name -> section method name
+    _section_index: Optional[Dict[str, str]] = None
+
+    def __init__(self):
+        self._values: Dict[str, str] = {}
+        self._built: set = set()
+
+    @classmethod
+    def _index(cls) -> Dict[str, str]:
+        index = cls.__dict__.get('_section_index')
+        if index is None:
+            index = {}
+            for method_name, names in cls.SECTIONS:
+                for name in names:
+                    index.setdefault(name, method_name)
+            cls._section_index = index
+        return index
+
+    def _build_section(self, method_name: str):
+        if method_name not in self._built:
+            self._built.add(method_name)
+            getattr(self, method_name)(self._values)
+
+    def __getitem__(self, name: str) -> str:
+        values = self._values
+        if name not in values:
+            method_name = self._index().get(name)
+            if method_name is None:
+                raise KeyError(name)
+            self._build_section(method_name)
+            if name not in values:
+                raise KeyError(name)
+        return values[name]
+
+    def build_all(self) -> Dict[str, str]:
+        """Run every section and return a plain dict of all variables."""
+        for method_name, _ in self.SECTIONS:
+            self._build_section(method_name)
+        return dict(self._values)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.build_all())
+
+    def __len__(self) -> int:
+        return len(self.build_all())
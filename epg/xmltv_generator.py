@@ -1,10 +1,16 @@
 """XMLTV EPG Generator following Gracenote best practices"""
+import io
+import re
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TextIO
 import hashlib
 
+from epg.xmltv_writer import XMLTVWriter
+
+# {variable} placeholders in user-defined categories
+CATEGORY_VARIABLE_PATTERN = re.compile(r'\{([^{}]+)\}')
+
 class XMLTVGenerator:
     """Generate XMLTV format EPG files"""
 
@@ -28,30 +34,48 @@ class XMLTVGenerator:
         Returns:
             XMLTV XML string
         """
-        # Create root element (no watermark - consolidator handles that)
-        tv = ET.Element('tv')
+        buffer = io.StringIO()
+        self.write(teams, events, settings, buffer)
+        return buffer.getvalue()
 
-        # Add channels (one per team)
-        for team in teams:
-            self._add_channel(tv, team)
+    def write(self, teams: List[Dict], events: Dict[str, List[Dict]],
+              settings: Dict, stream: TextIO) -> int:
+        """
+        Stream complete XMLTV document to a text stream
 
-        # Add programmes for each team
-        for team in teams:
-            team_events = events.get(str(team['id']), [])
-            for event in team_events:
-                self._add_programme(tv, team, event, settings)
+        Channels and programmes are built and written one at a time,
+        so memory stays bounded regardless of EPG size.
+
+        Args:
+            teams: List of team configurations
+            events: Dict mapping team_id to list of events
+            settings: Global settings
+            stream: Writable text stream
 
-        # Convert to pretty XML string
-        xml_str = self._prettify(tv)
+        Returns:
+            Number of elements written
+        """
+        # No watermark - consolidator handles that
+        with XMLTVWriter(stream) as writer:
+            # Add channels (one per team)
+            for team in teams:
+                writer.write_element(self._build_channel(team))
 
-        # Add DOCTYPE
-        xml_with_doctype = self._add_doctype(xml_str)
+            # Add programmes for each team
+            for team in teams:
+                team_events = events.get(str(team['id']), [])
+                for event in team_events:
+                    writer.write_element(self._build_programme(team, event, settings))
 
-        return xml_with_doctype
+        return writer.element_count
 
     def _add_channel(self, parent: ET.Element, team: Dict):
         """Add channel element for a team"""
-        channel = ET.SubElement(parent, 'channel')
+        parent.append(self._build_channel(team))
+
+    def _build_channel(self, team: Dict) -> ET.Element:
+        """Build channel element for a team"""
+        channel = ET.Element('channel')
         channel.set('id', team['channel_id'])
 
         # Display name
@@ -63,9 +87,15 @@ class XMLTVGenerator:
             icon = ET.SubElement(channel, 'icon')
             icon.set('src', team['team_logo_url'])
 
+        return channel
+
     def _add_programme(self, parent: ET.Element, team: Dict, event: Dict, settings: Dict):
+        """Add programme element for a game/event"""
+        parent.append(self._build_programme(team, event, settings))
+
+    def _build_programme(self, team: Dict, event: Dict, settings: Dict) -> ET.Element:
         """
-        Add programme element for a game/event
+        Build programme element for a game/event
 
         Following Gracenote best practices:
         - Generic sport titles ("NFL Football")
@@ -77,7 +107,7 @@ class XMLTVGenerator:
         start_time = self._format_xmltv_time(event['start_datetime'])
         stop_time = self._format_xmltv_time(event['end_datetime'])
 
-        programme = ET.SubElement(parent, 'programme')
+        programme = ET.Element('programme')
         programme.set('start', start_time)
         programme.set('stop', stop_time)
         programme.set('channel', team['channel_id'])
@@ -119,10 +149,12 @@ class XMLTVGenerator:
                 # Resolve template variables in category (e.g., {sport} -> Basketball)
                 resolved_category = category
                 if '{' in category:
-                    # Simple template variable replacement
-                    import re
-                    for var_name, var_value in template_vars.items():
-                        resolved_category = resolved_category.replace(f'{{{var_name}}}', str(var_value))
+                    # Simple template variable replacement - only the referenced
+                    # variables are looked up; unknown placeholders are left as-is
+                    resolved_category = CATEGORY_VARIABLE_PATTERN.sub(
+                        lambda m: str(template_vars[m.group(1)]) if m.group(1) in template_vars else m.group(0),
+                        category
+                    )
 
                 if resolved_category not in added_categories:
                     self._add_category(programme, resolved_category)
@@ -160,6 +192,8 @@ class XMLTVGenerator:
         else:
             programme.append(ET.Comment("teamarr:teams-event"))
 
+        return programme
+
     def _add_category(self, programme: ET.Element, category: str):
         """Add category element"""
         cat = ET.SubElement(programme, 'category')
@@ -182,27 +216,28 @@ class XMLTVGenerator:
 
         return dt.strftime('%Y%m%d%H%M%S +0000')
 
-    def _prettify(self, elem: ET.Element) -> str:
-        """Return pretty-printed XML string"""
-        rough_string = ET.tostring(elem, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        pretty = reparsed.toprettyxml(indent='  ')
-
-        # Remove extra blank lines
-        lines = [line for line in pretty.split('\n') if line.strip()]
+    def serialize(self, tv: ET.Element) -> str:
+        """Serialize a <tv> tree to an XMLTV string (declaration and DOCTYPE included)"""
+        buffer = io.StringIO()
+        self.write_tree(tv, buffer)
+        return buffer.getvalue()
 
-        # Remove XML declaration (we'll add it back with DOCTYPE)
-        if lines and lines[0].startswith('<?xml'):
-            lines = lines[1:]
-
-        return '\n'.join(lines)
+    def write_tree(self, tv: ET.Element, stream: TextIO) -> int:
+        """
+        Stream an already built <tv> tree to a text stream
 
-    def _add_doctype(self, xml_str: str) -> str:
-        """Add XML declaration and DOCTYPE (watermark added by consolidator)"""
-        declaration = '<?xml version="1.0" encoding="UTF-8"?>'
-        doctype = '<!DOCTYPE tv SYSTEM "xmltv.dtd">'
+        The children are dropped from the tree once written (one slice
+        delete, not a remove() per child) so the caller's tree doesn't keep
+        them alive.
 
-        return f"{declaration}\n{doctype}\n{xml_str}"
+        Returns:
+            Number of elements written
+        """
+        with XMLTVWriter(stream, root_attrs=dict(tv.attrib)) as writer:
+            for child in tv:
+                writer.write_element(child)
+        del tv[:]
+        return writer.element_count
 
     def calculate_file_hash(self, xml_content: str) -> str:
         """Calculate SHA256 hash of XML content for change detection"""
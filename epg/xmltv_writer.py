@@ -0,0 +1,248 @@
+"""
+Streaming XMLTV writer
+
+Writes XMLTV documents element by element instead of building the whole
+tree, re-parsing it with minidom and pretty-printing it in one go.
+
+Each <channel>/<programme> is indented and serialized on its own, so memory
+use is bounded by the largest single element rather than the whole document.
+
+Usage:
+    with atomic_write(path) as f:
+        with XMLTVWriter(f) as writer:
+            writer.write_element(channel_elem)
+            writer.write_element(programme_elem)
+"""
+
+import os
+import gzip
+import shutil
+import hashlib
+import logging
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>'
+XMLTV_DOCTYPE = '<!DOCTYPE tv SYSTEM "xmltv.dtd">'
+INDENT = '  '
+
+# Read size used when streaming source files through the parser
+PARSE_CHUNK_SIZE = 64 * 1024
+
+# Compression level for precompressed .xml.gz sidecars (speed/size balance)
+GZIP_COMPRESS_LEVEL = 6
+
+
+class XMLTVWriter:
+    """
+    Incrementally write an XMLTV document to a text stream.
+
+    The header (declaration, optional watermark comment, DOCTYPE and the
+    opening <tv> tag) is written on open(); </tv> is written on close().
+    Elements written in between are indented one level below <tv>.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        root_attrs: Optional[Dict[str, str]] = None,
+        watermark: Optional[str] = None
+    ):
+        """
+        Args:
+            stream: Writable text stream (file opened with encoding='utf-8', StringIO, ...)
+            root_attrs: Attributes for the <tv> root element
+            watermark: Optional comment block written between declaration and DOCTYPE
+        """
+        self.stream = stream
+        self.root_attrs = root_attrs or {}
+        self.watermark = watermark
+        self.element_count = 0
+        self._opened = False
+        self._closed = False
+
+    def __enter__(self) -> 'XMLTVWriter':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def open(self):
+        """Write the document header and opening <tv> tag."""
+        if self._opened:
+            return
+        self._opened = True
+
+        self.stream.write(XML_DECLARATION + '\n')
+        if self.watermark:
+            self.stream.write(self.watermark + '\n')
+        self.stream.write(XMLTV_DOCTYPE + '\n')
+
+        # Serialize an empty root to get correctly escaped attributes
+        root = ET.Element('tv', self.root_attrs)
+        root_tag = ET.tostring(root, encoding='unicode')
+        # '<tv a="b" />' -> '<tv a="b">'
+        self.stream.write(root_tag[:-3].rstrip() + '>\n')
+
+    def write_element(self, elem: ET.Element):
+        """
+        Indent and write a single top-level element (<channel> or <programme>).
+
+        The element's tail is discarded so parsed elements can be re-written
+        without carrying their original whitespace along.
+        """
+        if not self._opened:
+            self.open()
+
+        elem.tail = None
+        ET.indent(elem, space=INDENT, level=1)
+        self.stream.write(INDENT)
+        self.stream.write(ET.tostring(elem, encoding='unicode'))
+        self.stream.write('\n')
+        self.element_count += 1
+
+    def write_raw(self, fragment: str):
+        """Write an already serialized and indented fragment verbatim."""
+        if not self._opened:
+            self.open()
+        self.stream.write(fragment)
+
+    def close(self):
+        """Write the closing </tv> tag."""
+        if self._closed:
+            return
+        if not self._opened:
+            self.open()
+        self._closed = True
+        self.stream.write('</tv>\n')
+
+
+def serialize_element(elem: ET.Element) -> str:
+    """Serialize a top-level element exactly as XMLTVWriter.write_element would."""
+    elem.tail = None
+    ET.indent(elem, space=INDENT, level=1)
+    return INDENT + ET.tostring(elem, encoding='unicode') + '\n'
+
+
+@contextmanager
+def atomic_write(path: str) -> Iterator[TextIO]:
+    """
+    Open a text file for writing and move it into place only on success.
+
+    Clients polling the EPG never see a half-written document: output goes
+    to '<path>.tmp' and is renamed over the destination when the block exits.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _TopLevelElementTarget(ET.TreeBuilder):
+    """
+    TreeBuilder that hands each direct child of the root to a callback.
+
+    Comments are preserved (teamarr metadata lives in programme comments).
+    Elements are cleared and detached from the root after the callback so
+    the tree never grows.
+    """
+
+    def __init__(self, callback: Callable[[ET.Element], None]):
+        super().__init__(insert_comments=True)
+        self._callback = callback
+        self._depth = 0
+        self._root = None
+
+    def start(self, tag, attrs):
+        self._depth += 1
+        elem = super().start(tag, attrs)
+        if self._depth == 1:
+            self._root = elem
+        return elem
+
+    def end(self, tag):
+        elem = super().end(tag)
+        self._depth -= 1
+        if self._depth == 1:
+            self._callback(elem)
+            elem.clear()
+            # Also drops top-level comments between elements
+            del self._root[:]
+        return elem
+
+
+def iter_parse_xmltv(file_path: str, callback: Callable[[ET.Element], None]):
+    """
+    Stream an XMLTV file, calling callback for each <channel>/<programme>.
+
+    The callback receives the fully built element, including comments.
+    Raises ET.ParseError on malformed input.
+    """
+    parser = ET.XMLParser(target=_TopLevelElementTarget(callback))
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(PARSE_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    parser.close()
+
+
+def file_sha256(file_path: str) -> str:
+    """
+    SHA256 of a file's bytes, read in chunks.
+
+    Same digest as XMLTVGenerator.calculate_file_hash() on the file's
+    content, without loading the whole file into memory.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(PARSE_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_gzip_sidecar(file_path: str) -> Optional[str]:
+    """
+    Write a precompressed '<file>.gz' next to a finalized EPG file.
+
+    Written after the XML itself, so a sidecar with an older mtime than the
+    XML is stale and must not be served.
+
+    Returns:
+        Path to the sidecar, or None if it could not be written
+    """
+    gz_path = file_path + '.gz'
+    tmp_path = gz_path + '.tmp'
+    try:
+        with open(file_path, 'rb') as src, \
+                gzip.open(tmp_path, 'wb', compresslevel=GZIP_COMPRESS_LEVEL) as dst:
+            shutil.copyfileobj(src, dst, PARSE_CHUNK_SIZE)
+        os.replace(tmp_path, gz_path)
+        return gz_path
+    except OSError as e:
+        logger.warning(f"Could not write gzip sidecar for {file_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return None
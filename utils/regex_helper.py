@@ -21,6 +21,7 @@ Usage:
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 
 # Try to import 'regex' module which supports advanced features like
@@ -67,13 +68,26 @@ def compile_pattern(
     if not pattern or not pattern.strip():
         return default
 
+    compiled = _compile_cached(pattern.strip(), ignore_case)
+    return default if compiled is None else compiled
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(pattern: str, ignore_case: bool) -> Optional[object]:
+    """
+    Compile a pattern once per (pattern text, case flag).
+
+    Group filters are compiled for every page of every group refresh; the
+    compiled objects are immutable and thread-safe, so they're shared.
+    Returns None if the pattern doesn't compile.
+    """
     flags = REGEX_MODULE.IGNORECASE if ignore_case else 0
 
     try:
-        return REGEX_MODULE.compile(pattern.strip(), flags)
+        return REGEX_MODULE.compile(pattern, flags)
     except Exception:
         # Catches both re.error and regex-specific errors
-        return default
+        return None
 
 
 def validate_pattern(pattern: Optional[str]) -> Tuple[bool, Optional[str]]:
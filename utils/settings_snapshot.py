@@ -0,0 +1,122 @@
+"""
+Settings Snapshot - one immutable read of the settings row
+
+Generation code reads the same settings row (and the user's timezone) from
+SQLite in many places: once per event group, once per matched stream for
+"today in the user's timezone", once per lifecycle/reconciler handle. The
+row only changes when the user saves settings, so it is read once into a
+SettingsSnapshot that everything shares until the snapshot is invalidated.
+
+Invalidate after writing the settings table (settings_update() and the
+other settings writers in app.py do this).
+
+Usage:
+    snapshot = get_settings_snapshot()
+    snapshot.get('event_lookahead_days', 7)
+    snapshot.tz                # ZoneInfo of default_timezone
+    snapshot.today()           # current date in the user's timezone
+    settings = snapshot.as_dict()   # mutable copy for code that edits settings
+
+    invalidate_settings_snapshot()
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from zoneinfo import ZoneInfo
+
+DEFAULT_TIMEZONE = 'America/Detroit'
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Read-only settings row plus the resolved user timezone"""
+    values: Mapping[str, Any]
+    timezone_name: str
+    tz: ZoneInfo
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.values[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.values
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Mutable copy of the settings (same shape as dict(settings_row))"""
+        return dict(self.values)
+
+    def today(self) -> date:
+        """Current date in the user's timezone"""
+        return datetime.now(self.tz).date()
+
+
+def snapshot_from_settings(settings: Mapping[str, Any]) -> SettingsSnapshot:
+    """
+    Build a snapshot from a settings dict/row.
+
+    An unset or invalid default_timezone resolves to America/Detroit, the
+    same fallback get_user_timezone() and get_today_in_user_tz() use.
+    """
+    values = dict(settings)
+    timezone_name = values.get('default_timezone') or DEFAULT_TIMEZONE
+    try:
+        tz = ZoneInfo(timezone_name)
+    except Exception:
+        tz = ZoneInfo(DEFAULT_TIMEZONE)
+    return SettingsSnapshot(values=MappingProxyType(values), timezone_name=timezone_name, tz=tz)
+
+
+# Current snapshot (None = read the settings row on next use)
+_snapshot: Optional[SettingsSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_settings_snapshot(db_connection_func=None) -> Optional[SettingsSnapshot]:
+    """
+    Get the current settings snapshot, reading the settings row if needed.
+
+    Args:
+        db_connection_func: Function that returns DB connection.
+                           If not provided, falls back to database.get_connection.
+
+    Returns:
+        SettingsSnapshot, or None if the settings row can't be read (nothing
+        is cached then, so the next call tries again)
+    """
+    global _snapshot
+
+    # Fast path: no lock once a snapshot exists
+    snapshot = _snapshot
+    if snapshot is not None:
+        return snapshot
+
+    if db_connection_func is None:
+        from database import get_connection
+        db_connection_func = get_connection
+
+    with _snapshot_lock:
+        if _snapshot is not None:
+            return _snapshot
+
+        conn = db_connection_func()
+        try:
+            row = conn.execute("SELECT * FROM settings WHERE id = 1").fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+
+        _snapshot = snapshot_from_settings(row)
+        return _snapshot
+
+
+def invalidate_settings_snapshot():
+    """Drop the snapshot (call after the settings table changes)"""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
@@ -10,7 +10,8 @@ This ensures match rate calculations reflect reality:
 """
 
 import re
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from utils.regex_helper import compile_pattern
 
@@ -44,6 +45,16 @@ AT_AS_SEPARATOR_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# GAME_INDICATOR_PATTERN rewritten for scanning many names (same matches).
+# Python's re can't skip ahead to a pattern that starts with \b and tries the
+# alternation at every position; starting with a character class lets it
+# jump to candidate characters, and spelling out the case variants (incl. the
+# long s, which IGNORECASE folds to 's') avoids case-insensitive matching.
+_GAME_INDICATOR_SCAN_PATTERN = re.compile(
+    r'[vVaAxX](?<!\w[vVaAxX])'                                  # Word starting with v/a/x
+    r'(?:(?<=[vV])[sS\u017f]\.?|(?<=[aA])[tT]|(?<=[vVxX]))\b'   # vs, vs., at, v, x
+)
+
 
 def has_game_indicator(stream_name: str) -> bool:
     """
@@ -91,6 +102,112 @@ def has_game_indicator(stream_name: str) -> bool:
     return False
 
 
+def game_indicator_indexes(names: Sequence[str]) -> List[int]:
+    """
+    Indexes of the names that contain a game indicator.
+
+    Same result as [i for i, name in enumerate(names) if has_game_indicator(name)],
+    with a faster equivalent of GAME_INDICATOR_PATTERN and the @ separator
+    pattern only tried on names containing '@'.
+
+    Args:
+        names: Stream names
+
+    Returns:
+        Ascending list of indexes
+    """
+    indicator = _GAME_INDICATOR_SCAN_PATTERN.search
+    at_separator = AT_AS_SEPARATOR_PATTERN.search
+    return [
+        i for i, name in enumerate(names)
+        if indicator(name) or ('@' in name and at_separator(name))
+    ]
+
+
+def pattern_match_indexes(
+    pattern,
+    names: Sequence[str],
+    candidates: Optional[Sequence[int]] = None
+) -> List[int]:
+    """
+    Indexes of the names a compiled pattern matches (re.search semantics).
+
+    Args:
+        pattern: Compiled pattern (see compile_pattern)
+        names: Stream names
+        candidates: Indexes to test (default: all)
+
+    Returns:
+        Ascending list of matching indexes (subset of candidates)
+    """
+    search = pattern.search
+    if candidates is None:
+        return [i for i, name in enumerate(names) if search(name)]
+    return [i for i in candidates if search(names[i])]
+
+
+@dataclass
+class StreamFilterMasks:
+    """Stream indexes by filter outcome (each ascending, disjoint)"""
+    game: List[int] = field(default_factory=list)            # Passed all layers
+    no_indicator: List[int] = field(default_factory=list)    # No vs/@/at/v/x
+    include_regex: List[int] = field(default_factory=list)   # Didn't match inclusion regex
+    exclude_regex: List[int] = field(default_factory=list)   # Matched exclusion regex
+
+    def filtered(self) -> List[int]:
+        """All filtered-out indexes, ascending"""
+        return sorted(self.no_indicator + self.include_regex + self.exclude_regex)
+
+
+def filter_stream_names(
+    names: Sequence[str],
+    include_regex: str = None,
+    exclude_regex: str = None,
+    check_indicator: bool = True
+) -> StreamFilterMasks:
+    """
+    Batch version of the filter_game_streams() layers over a list of names.
+
+    Same layers and order as filter_game_streams(): game indicator, then
+    inclusion regex, then exclusion regex. Each layer only tests the names
+    that passed the previous one. User patterns are compiled once per
+    pattern text (compile_pattern caches them).
+
+    Args:
+        names: Stream names
+        include_regex: Optional regex pattern - only matching names pass
+        exclude_regex: Optional regex pattern - matching names are filtered
+        check_indicator: Apply the built-in game indicator layer
+
+    Returns:
+        StreamFilterMasks with the indexes for each outcome
+    """
+    masks = StreamFilterMasks()
+
+    if check_indicator:
+        passed = game_indicator_indexes(names)
+        passed_set = set(passed)
+        masks.no_indicator = [i for i in range(len(names)) if i not in passed_set]
+    else:
+        passed = list(range(len(names)))
+
+    include_pattern = compile_pattern(include_regex) if include_regex else None
+    if include_pattern:
+        included = pattern_match_indexes(include_pattern, names, passed)
+        included_set = set(included)
+        masks.include_regex = [i for i in passed if i not in included_set]
+        passed = included
+
+    exclude_pattern = compile_pattern(exclude_regex) if exclude_regex else None
+    if exclude_pattern:
+        masks.exclude_regex = pattern_match_indexes(exclude_pattern, names, passed)
+        excluded_set = set(masks.exclude_regex)
+        passed = [i for i in passed if i not in excluded_set]
+
+    masks.game = passed
+    return masks
+
+
 def filter_game_streams(
     streams: List[Dict],
     include_regex: str = None,
@@ -134,45 +251,18 @@ def filter_game_streams(
         >>> result['filtered_no_indicator']
         2
     """
-    game_streams = []
-    filtered_streams = []
-    filtered_no_indicator = 0
-    filtered_include_regex = 0
-    filtered_exclude_regex = 0
-
-    # Compile user patterns using regex helper (supports variable-width lookbehind)
-    include_pattern = compile_pattern(include_regex) if include_regex else None
-    exclude_pattern = compile_pattern(exclude_regex) if exclude_regex else None
-
-    for stream in streams:
-        name = stream.get('name', '')
-
-        # Layer 1: Must have game indicator
-        if not has_game_indicator(name):
-            filtered_streams.append(stream)
-            filtered_no_indicator += 1
-            continue
-
-        # Layer 2: Check user inclusion pattern (must match to pass)
-        if include_pattern and not include_pattern.search(name):
-            filtered_streams.append(stream)
-            filtered_include_regex += 1
-            continue
-
-        # Layer 3: Check user exclusion pattern (must NOT match to pass)
-        if exclude_pattern and exclude_pattern.search(name):
-            filtered_streams.append(stream)
-            filtered_exclude_regex += 1
-            continue
-
-        game_streams.append(stream)
+    masks = filter_stream_names(
+        [stream.get('name', '') for stream in streams],
+        include_regex=include_regex,
+        exclude_regex=exclude_regex
+    )
 
     return {
-        'game_streams': game_streams,
-        'filtered_streams': filtered_streams,
-        'filtered_no_indicator': filtered_no_indicator,
-        'filtered_include_regex': filtered_include_regex,
-        'filtered_exclude_regex': filtered_exclude_regex,
+        'game_streams': [streams[i] for i in masks.game],
+        'filtered_streams': [streams[i] for i in masks.filtered()],
+        'filtered_no_indicator': len(masks.no_indicator),
+        'filtered_include_regex': len(masks.include_regex),
+        'filtered_exclude_regex': len(masks.exclude_regex),
     }
 
 
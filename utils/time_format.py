@@ -194,6 +194,11 @@ def get_user_timezone(db_connection_func=None) -> str:
     """
     Get user's timezone from database settings.
 
+    For the app database (no db_connection_func, or database.get_connection)
+    the shared settings snapshot (utils/settings_snapshot.py) is used, so
+    repeated calls don't query SQLite. Any other connection function is
+    queried directly.
+
     Args:
         db_connection_func: Function that returns DB connection.
                            If not provided, falls back to database.get_connection.
@@ -204,21 +209,27 @@ def get_user_timezone(db_connection_func=None) -> str:
     """
     DEFAULT_TZ = 'America/Detroit'
 
-    if db_connection_func is None:
-        try:
-            from database import get_connection
-            db_connection_func = get_connection
-        except ImportError:
-            return DEFAULT_TZ
+    try:
+        from database import get_connection
+    except ImportError:
+        get_connection = None
 
     try:
-        conn = db_connection_func()
-        cursor = conn.cursor()
-        cursor.execute("SELECT default_timezone FROM settings WHERE id = 1")
-        row = cursor.fetchone()
-        conn.close()
-        if row and row[0]:
-            return row[0]
+        if db_connection_func is None or db_connection_func is get_connection:
+            if get_connection is None:
+                return DEFAULT_TZ
+            from utils.settings_snapshot import get_settings_snapshot
+            snapshot = get_settings_snapshot(get_connection)
+            if snapshot and snapshot.get('default_timezone'):
+                return snapshot.get('default_timezone')
+        else:
+            conn = db_connection_func()
+            try:
+                row = conn.execute("SELECT default_timezone FROM settings WHERE id = 1").fetchone()
+            finally:
+                conn.close()
+            if row and row[0]:
+                return row[0]
     except Exception:
         pass
 